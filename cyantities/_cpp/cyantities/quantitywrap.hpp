@@ -25,13 +25,27 @@
 #include <cyantities/unit.hpp>
 #include <cyantities/boost.hpp>
 
+#include <algorithm>
+#include <array>
+#include <compare>
 #include <concepts>
 #include <iterator>
+#include <limits>
 #include <memory>
+#include <ranges>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 namespace cyantities {
 
-class QuantityWrapper;
+template<typename T>
+class BasicQuantityWrapper;
 
 
 /*
@@ -137,7 +151,8 @@ template<typename boost_quantity, typename T>
 class QuantityIterator
 {
     typedef iterator_generator<boost_quantity, T>::type Generator;
-    friend QuantityWrapper;
+    template<typename U>
+    friend class BasicQuantityWrapper;
     friend Generator;
 public:
     typedef quantity_setter<boost_quantity, T> setter_t;
@@ -149,14 +164,15 @@ public:
     typedef setter_t& reference;
 
     /* Con- and destructors: */
-    QuantityIterator() : data(nullptr), begin(nullptr), end(nullptr),
+    QuantityIterator() : data(nullptr), begin(nullptr), step(1), N(0),
        setter(std::make_unique<setter_t>())
     {}
 
     QuantityIterator(QuantityIterator<boost_quantity,T>&&) = default;
 
     QuantityIterator(const QuantityIterator<boost_quantity,T>& other)
-       : data(other.data), begin(other.begin), end(other.end),
+       : data(other.data), begin(other.begin), step(other.step), N(other.N),
+         unit(other.unit),
          setter((other.setter) ? std::make_unique<setter_t>(*other.setter)
                                : std::make_unique<setter_t>())
     {
@@ -175,14 +191,17 @@ public:
     {
         data = other.data;
         begin = other.begin;
-        end = other.end;
+        step = other.step;
+        N = other.N;
+        unit = other.unit;
         setter = std::make_unique<setter_t>(*other.setter);
+        return *this;
     }
 
 
     QuantityIterator<boost_quantity,T>& operator++()
     {
-        ++data;
+        data += step;
         setter->data = data;
         return *this;
     }
@@ -196,20 +215,20 @@ public:
 
     QuantityIterator<boost_quantity,T>& operator--()
     {
-        --data;
+        data -= step;
         setter->data = data;
         return *this;
     }
 
     std::ptrdiff_t operator-(const QuantityIterator<boost_quantity,T>& other) const
     {
-        return data - other.data;
+        return (data - other.data) / step;
     }
 
     template<typename integer>
     QuantityIterator<boost_quantity,T>& operator-(integer off)
     {
-        data -= off;
+        data -= off * step;
         setter->data = data;
         return *this;
     }
@@ -217,7 +236,7 @@ public:
     template<typename integer>
     QuantityIterator<boost_quantity,T>& operator+=(integer off)
     {
-        data += off;
+        data += off * step;
         setter->data = data;
         return *this;
     }
@@ -226,12 +245,13 @@ public:
     {
         if (data == nullptr)
             throw std::runtime_error("Trying to dereference nullptr");
-        if (data < begin){
+        const std::ptrdiff_t i = (data - begin) / step;
+        if (i < 0){
             throw std::runtime_error(
                 "Trying to dereference QuantityIterator before begin."
             );
         }
-        if (data >= end)
+        if (i >= N)
             throw std::runtime_error(
                 "Trying to dereference QuantityIterator past end."
             );
@@ -242,12 +262,13 @@ public:
     {
         if (data == nullptr)
             throw std::runtime_error("Trying to dereference nullptr");
-        if (data < begin){
+        const std::ptrdiff_t i = (data - begin) / step;
+        if (i < 0){
             throw std::runtime_error(
                 "Trying to dereference QuantityIterator before begin."
             );
         }
-        if (data >= end)
+        if (i >= N)
             throw std::runtime_error(
                 "Trying to dereference QuantityIterator past end."
             );
@@ -266,7 +287,12 @@ private:
      * is not assignable). */
     T* data;
     const T* begin;
-    const T* end;
+    /*
+     * The distance between consecutive elements (in units of T) and the
+     * number of elements:
+     */
+    std::ptrdiff_t step;
+    std::ptrdiff_t N;
     /*
      * This is the unit in which the numeric 'data' is given.
      */
@@ -303,14 +329,15 @@ private:
      */
     std::unique_ptr<setter_t> setter;
 
-    QuantityIterator(T* data, size_t N, boost_quantity unit
+    QuantityIterator(T* data, size_t N, std::ptrdiff_t step,
+                     boost_quantity unit
     )
-       : data(data), begin(data), end(data+N), unit(unit),
+       : data(data), begin(data), step(step), N(N), unit(unit),
          setter(
             std::make_unique<quantity_setter<boost_quantity, T>>(data, unit)
          )
     {
-        if (this->data < this->begin)
+        if (step == 0)
             throw std::runtime_error("Invalid initialization!");
     }
 };
@@ -341,17 +368,18 @@ public:
     typedef QuantityIterator<boost_quantity, T> iterator;
 
     QuantityIteratorGenerator()
-       : data(nullptr), _N(0)
+       : data(nullptr), _N(0), step(1)
     {}
 
-    QuantityIteratorGenerator(T* data, size_t N, const Unit& unit)
-       : data(data), _N(N), _unit(unit)
+    QuantityIteratorGenerator(T* data, size_t N, std::ptrdiff_t step,
+                              const Unit& unit)
+       : data(data), _N(N), step(step), _unit(unit)
     {}
 
     iterator begin()
     {
         return QuantityIterator<boost_quantity, T>(
-            data, _N, get_converter<boost_quantity>(_unit)
+            data, _N, step, get_converter<boost_quantity>(_unit)
         );
     }
 
@@ -366,6 +394,7 @@ public:
 private:
     T* data;
     size_t _N;
+    std::ptrdiff_t step;
     Unit _unit;
 
     /*
@@ -433,17 +462,18 @@ struct ConstQuantityIteratorGenerator
     typedef QuantityIterator<boost_quantity, const T> iterator;
 
     ConstQuantityIteratorGenerator()
-       : data(nullptr), _N(0)
+       : data(nullptr), _N(0), step(1)
     {}
 
-    ConstQuantityIteratorGenerator(const T* data, size_t N, const Unit& unit)
-       : data(data), _N(N), _unit(unit)
+    ConstQuantityIteratorGenerator(const T* data, size_t N,
+                                   std::ptrdiff_t step, const Unit& unit)
+       : data(data), _N(N), step(step), _unit(unit)
     {}
 
     iterator begin() const
     {
         return QuantityIterator<boost_quantity, const T>(
-            data, _N, get_converter<boost_quantity>(_unit)
+            data, _N, step, get_converter<boost_quantity>(_unit)
         );
     }
 
@@ -457,6 +487,7 @@ struct ConstQuantityIteratorGenerator
 private:
     const T* data;
     size_t _N;
+    std::ptrdiff_t step;
     Unit _unit;
 
 
@@ -492,26 +523,395 @@ private:
 };
 
 
+/*
+ * Unchecked access
+ * ================
+ *
+ * The following classes provide a fast path to the elements of a
+ * QuantityWrapper. The dimension check and the unit scale are computed
+ * once when creating the QuantitySpan. Afterwards, element access
+ * neither checks bounds nor allocates, so that loops over the span
+ * compile to the same code as loops over a plain double buffer.
+ */
+
+/*
+ * A reference to a single element, converting from and to the
+ * Boost.Units quantity.
+ */
+template<typename boost_quantity, typename T>
+class QuantityReference
+{
+public:
+    QuantityReference(T* data, double scale) : data(data), scale(scale)
+    {}
+
+    operator boost_quantity() const
+    {
+        return boost_quantity::from_value(*data * scale);
+    }
+
+    const QuantityReference& operator=(const boost_quantity& q) const
+        requires (!std::is_const_v<T>)
+    {
+        *data = q.value() / scale;
+        return *this;
+    }
+
+    const QuantityReference& operator=(const QuantityReference& other) const
+        requires (!std::is_const_v<T>)
+    {
+        return operator=(static_cast<boost_quantity>(other));
+    }
+
+    const QuantityReference& operator+=(const boost_quantity& q) const
+        requires (!std::is_const_v<T>)
+    {
+        *data += q.value() / scale;
+        return *this;
+    }
+
+    const QuantityReference& operator-=(const boost_quantity& q) const
+        requires (!std::is_const_v<T>)
+    {
+        *data -= q.value() / scale;
+        return *this;
+    }
+
+private:
+    T* data;
+    double scale;
+};
+
+
+/*
+ * A random access iterator over the elements. Dereferencing yields a
+ * QuantityReference for mutable and a Boost.Units quantity for const
+ * data.
+ */
+template<typename boost_quantity, typename T>
+class UncheckedQuantityIterator
+{
+public:
+    typedef std::ptrdiff_t difference_type;
+    typedef boost_quantity value_type;
+    typedef std::conditional_t<
+                std::is_const_v<T>,
+                boost_quantity,
+                QuantityReference<boost_quantity, T>
+            > reference;
+    typedef std::random_access_iterator_tag iterator_category;
+
+    UncheckedQuantityIterator() : data(nullptr), step(1), scale(1.0)
+    {}
+
+    UncheckedQuantityIterator(T* data, std::ptrdiff_t step, double scale)
+       : data(data), step(step), scale(scale)
+    {}
+
+    reference operator*() const
+    {
+        if constexpr (std::is_const_v<T>)
+            return boost_quantity::from_value(*data * scale);
+        else
+            return reference(data, scale);
+    }
+
+    reference operator[](difference_type i) const
+    {
+        return *(*this + i);
+    }
+
+    UncheckedQuantityIterator& operator++()
+    {
+        data += step;
+        return *this;
+    }
+
+    UncheckedQuantityIterator operator++(int)
+    {
+        UncheckedQuantityIterator res(*this);
+        data += step;
+        return res;
+    }
+
+    UncheckedQuantityIterator& operator--()
+    {
+        data -= step;
+        return *this;
+    }
+
+    UncheckedQuantityIterator operator--(int)
+    {
+        UncheckedQuantityIterator res(*this);
+        data -= step;
+        return res;
+    }
+
+    UncheckedQuantityIterator& operator+=(difference_type off)
+    {
+        data += off * step;
+        return *this;
+    }
+
+    UncheckedQuantityIterator& operator-=(difference_type off)
+    {
+        data -= off * step;
+        return *this;
+    }
+
+    UncheckedQuantityIterator operator+(difference_type off) const
+    {
+        return UncheckedQuantityIterator(data + off * step, step, scale);
+    }
+
+    friend UncheckedQuantityIterator
+    operator+(difference_type off, const UncheckedQuantityIterator& it)
+    {
+        return it + off;
+    }
+
+    UncheckedQuantityIterator operator-(difference_type off) const
+    {
+        return UncheckedQuantityIterator(data - off * step, step, scale);
+    }
+
+    difference_type operator-(const UncheckedQuantityIterator& other) const
+    {
+        return (data - other.data) / step;
+    }
+
+    bool operator==(const UncheckedQuantityIterator& other) const
+    {
+        return data == other.data;
+    }
+
+    auto operator<=>(const UncheckedQuantityIterator& other) const
+    {
+        return (*this - other) <=> 0;
+    }
+
+private:
+    T* data;
+    std::ptrdiff_t step;
+    double scale;
+};
+
+
+/*
+ * A view of the elements of a QuantityWrapper, given in the Boost.Units
+ * quantity 'boost_quantity'. The elements are 'step' values of type T
+ * apart in memory.
+ */
+template<typename boost_quantity, typename T>
+class QuantitySpan
+   : public std::ranges::view_interface<QuantitySpan<boost_quantity, T>>
+{
+public:
+    typedef UncheckedQuantityIterator<boost_quantity, T> iterator;
+    typedef typename iterator::reference reference;
+
+    QuantitySpan() : data(nullptr), _N(0), step(1), scale(1.0)
+    {}
+
+    QuantitySpan(T* data, size_t N, std::ptrdiff_t step, const Unit& unit)
+       : data(data), _N(N), step(step),
+         scale(get_converter<boost_quantity>(unit).value())
+    {}
+
+    iterator begin() const
+    {
+        return iterator(data, step, scale);
+    }
+
+    iterator end() const
+    {
+        return iterator(data + static_cast<std::ptrdiff_t>(_N) * step, step,
+                        scale);
+    }
+
+    reference operator[](size_t i) const
+    {
+        const std::ptrdiff_t j = static_cast<std::ptrdiff_t>(i) * step;
+        if constexpr (std::is_const_v<T>)
+            return boost_quantity::from_value(data[j] * scale);
+        else
+            return reference(data + j, scale);
+    }
+
+    size_t size() const
+    {
+        return _N;
+    }
+
+private:
+    T* data;
+    size_t _N;
+    std::ptrdiff_t step;
+    double scale;
+
+    static_assert(std::random_access_iterator<iterator>);
+    static_assert(
+        std::indirectly_writable<iterator, boost_quantity>
+        || std::is_const_v<T>
+    );
+};
+
+
+/*
+ * Strided iteration
+ * =================
+ *
+ * The maximum number of dimensions of a QuantityWrapper, equal to the
+ * maximum number of dimensions of NumPy arrays (NPY_MAXDIMS, NumPy 1).
+ */
+constexpr size_t MAX_NDIM = 32;
+
+typedef std::array<std::ptrdiff_t, MAX_NDIM> strides_t;
+
+/*
+ * A cursor that traverses a shape in C order and keeps track of the
+ * element offsets into K strided arrays of that (broadcast) shape.
+ * Broadcast dimensions have stride zero.
+ */
+template<size_t K>
+class BroadcastCursor
+{
+public:
+    BroadcastCursor(size_t ndim, const size_t* shape,
+                    const std::array<strides_t, K>& strides, size_t start)
+       : ndim(ndim), shape(shape), strides(strides)
+    {
+        offsets.fill(0);
+        for (size_t d=ndim; d-- > 0;){
+            index[d] = start % shape[d];
+            start /= shape[d];
+            for (size_t k=0; k<K; ++k)
+                offsets[k] += static_cast<std::ptrdiff_t>(index[d])
+                              * strides[k][d];
+        }
+    }
+
+    void advance()
+    {
+        for (size_t d=ndim; d-- > 0;){
+            for (size_t k=0; k<K; ++k)
+                offsets[k] += strides[k][d];
+            if (++index[d] < shape[d])
+                return;
+            for (size_t k=0; k<K; ++k)
+                offsets[k] -= static_cast<std::ptrdiff_t>(shape[d])
+                              * strides[k][d];
+            index[d] = 0;
+        }
+    }
+
+    std::ptrdiff_t operator[](size_t k) const
+    {
+        return offsets[k];
+    }
+
+private:
+    size_t ndim;
+    const size_t* shape;
+    const std::array<strides_t, K>& strides;
+    std::array<size_t, MAX_NDIM> index;
+    std::array<std::ptrdiff_t, K> offsets;
+};
+
+
 /*
  * Quantity Wrapper
  * ================
  *
  * This class wraps the info from the Cython/Python 'Quantity' class
- * (i.e. a scalar double or an array of doubles + a unit) into something
- * of the C++ world, and provides templates to obtain the quantity in
- * Boost.Unit units (based on the conversion in boost.hpp).
+ * (i.e. a scalar or an array of floating point numbers + a unit) into
+ * something of the C++ world, and provides templates to obtain the quantity
+ * in Boost.Unit units (based on the conversion in boost.hpp).
+ *
+ * The template parameter T is the floating point type of the numeric
+ * buffer. QuantityWrapper (double) and QuantityWrapper32 (float) are the
+ * two instantiations used by the Quantity class.
+ *
+ * Array quantities keep the shape and the strides of the NumPy array,
+ * so that sliced and transposed arrays are wrapped without copying.
+ * The flat index i used by get, set_element, the iterators, and the
+ * algorithms enumerates the elements in C order.
  **/
-class QuantityWrapper {
+template<typename T>
+class BasicQuantityWrapper {
+    template<typename U>
+    friend class BasicQuantityWrapper;
 public:
-    QuantityWrapper();
+    typedef T value_type;
+
+    BasicQuantityWrapper()
+       : scalar_data(std::numeric_limits<T>::quiet_NaN()),
+         data(&scalar_data), _N(0), _ndim(0), _step(1)
+    {}
 
-    QuantityWrapper(double data, const Unit& unit);
+    BasicQuantityWrapper(T data, const Unit& unit)
+       : scalar_data(data), data(&scalar_data), _N(1), _ndim(0), _step(1),
+         _unit(unit)
+    {}
 
-    QuantityWrapper(double* data, size_t N, const Unit& unit);
+    BasicQuantityWrapper(T* data, size_t N, const Unit& unit)
+       : scalar_data(0.0), data(data), _N(N), _ndim(1), _step(1),
+         _unit(unit)
+    {
+        if (N == 0)
+            throw std::runtime_error("Zero-dimensional quantity not allowed.");
+        _shape[0] = N;
+        _strides[0] = 1;
+    }
+
+    /*
+     * Wraps a strided array of dimension 'ndim'. The strides are given
+     * in bytes, as in NumPy, and have to be multiples of sizeof(T).
+     */
+    BasicQuantityWrapper(T* data, size_t ndim, const std::intptr_t* shape,
+                         const std::intptr_t* strides, const Unit& unit)
+       : scalar_data(0.0), data(data), _N(1), _ndim(ndim), _unit(unit)
+    {
+        if (ndim > MAX_NDIM)
+            throw std::runtime_error("Too many dimensions.");
+        for (size_t d=0; d<ndim; ++d){
+            if (strides[d] % static_cast<std::intptr_t>(sizeof(T)) != 0)
+                throw std::runtime_error(
+                    "Strides need to be multiples of the element size."
+                );
+            _shape[d] = shape[d];
+            _strides[d] = strides[d] / static_cast<std::intptr_t>(sizeof(T));
+            _N *= _shape[d];
+        }
+        if (_N == 0)
+            throw std::runtime_error("Zero-dimensional quantity not allowed.");
+        _step = equal_step();
+    }
 
-    QuantityWrapper(const QuantityWrapper& other);
+    BasicQuantityWrapper(const BasicQuantityWrapper& other)
+       : scalar_data(other.scalar_data),
+         data((other.data == &other.scalar_data) ? &scalar_data : other.data),
+         _N(other._N), _ndim(other._ndim), _shape(other._shape),
+         _strides(other._strides), _step(other._step), _unit(other._unit)
+    {}
 
-    QuantityWrapper& operator=(const QuantityWrapper& other);
+    BasicQuantityWrapper& operator=(const BasicQuantityWrapper& other)
+    {
+        scalar_data = other.scalar_data;
+        /* If the 'data' points to the scalar_data member of the other,
+         * replace it by a pointer to this object's scalar_data: */
+        if (other.data == &other.scalar_data)
+            data = &scalar_data;
+        else
+            data = other.data;
+        _N = other._N;
+        _ndim = other._ndim;
+        _shape = other._shape;
+        _strides = other._strides;
+        _step = other._step;
+        _unit = other._unit;
+        return *this;
+    }
 
     template<typename boost_quantity>
     boost_quantity get(size_t i = 0) const
@@ -519,7 +919,9 @@ public:
         if (i >= _N)
             throw std::out_of_range("Index out of range.");
 
-        return data[i] * get_converter<boost_quantity>(_unit);
+        return static_cast<typename boost_quantity::value_type>(
+            data[offset(i)]
+        ) * get_converter<boost_quantity>(_unit);
     }
 
     template<typename boost_quantity>
@@ -529,27 +931,63 @@ public:
             throw std::out_of_range("Index out of range.");
 
         boost_quantity scale = get_converter<boost_quantity>(_unit);
-        data[i] = bq / scale;
+        data[offset(i)] = bq / scale;
+    }
+
+    /*
+     * Multidimensional access, with one index per dimension:
+     *
+     *    Length x = q.get_at<Length>(i, j);
+     *    q.set_at<Length>(2.0 * x, i, j);
+     */
+    template<typename boost_quantity, std::integral... Index>
+    boost_quantity get_at(Index... index) const
+    {
+        return static_cast<typename boost_quantity::value_type>(
+            data[nd_offset(index...)]
+        ) * get_converter<boost_quantity>(_unit);
+    }
+
+    template<typename boost_quantity, std::integral... Index>
+    void set_at(boost_quantity bq, Index... index)
+    {
+        boost_quantity scale = get_converter<boost_quantity>(_unit);
+        data[nd_offset(index...)] = bq / scale;
+    }
+
+    /*
+     * Broadcast access: returns the element at the multi-index 'index' of
+     * a shape that this quantity broadcasts to, following the NumPy rules.
+     * The index is aligned with the trailing dimensions of this quantity,
+     * and dimensions of size one repeat their element. This allows, for
+     * instance, to combine a (N,M) quantity with a (M,) or (N,1) quantity.
+     */
+    template<typename boost_quantity, size_t D>
+    boost_quantity get_broadcast(const std::array<size_t, D>& index) const
+    {
+        return static_cast<typename boost_quantity::value_type>(
+            data[broadcast_offset(index.data(), D)]
+        ) * get_converter<boost_quantity>(_unit);
     }
 
     template<typename boost_quantity>
-    QuantityIterator<boost_quantity,double> begin()
+    QuantityIterator<boost_quantity,T> begin()
     {
-        return QuantityIterator<boost_quantity, double>(
-            data, _N, get_converter<boost_quantity>(_unit)
+        return QuantityIterator<boost_quantity, T>(
+            data, _N, checked_step(), get_converter<boost_quantity>(_unit)
         );
     }
 
     template<typename boost_quantity>
-    QuantityIterator<boost_quantity,const double> cbegin() const
+    QuantityIterator<boost_quantity,const T> cbegin() const
     {
-        return QuantityIterator<boost_quantity, const double>(
-            data, _N, get_converter<boost_quantity>(_unit)
+        return QuantityIterator<boost_quantity, const T>(
+            data, _N, checked_step(), get_converter<boost_quantity>(_unit)
         );
     }
 
     template<typename boost_quantity>
-    QuantityIterator<boost_quantity, const double> end() const
+    QuantityIterator<boost_quantity, const T> end() const
     {
         auto _end(cbegin<boost_quantity>());
         _end += _N;
@@ -557,36 +995,475 @@ public:
     }
 
     template<typename boost_quantity>
-    QuantityIteratorGenerator<boost_quantity, double> iter()
+    QuantityIteratorGenerator<boost_quantity, T> iter()
+    {
+        return QuantityIteratorGenerator<boost_quantity, T>(
+            data, _N, checked_step(), _unit
+        );
+    }
+
+    template<typename boost_quantity>
+    ConstQuantityIteratorGenerator<boost_quantity, T> const_iter() const
     {
-        return QuantityIteratorGenerator<boost_quantity, double>(
-            data, _N, _unit
+        return ConstQuantityIteratorGenerator<boost_quantity, T>(
+            data, _N, checked_step(), _unit
+        );
+    }
+
+    /*
+     * Unchecked, allocation-free access to the elements:
+     *
+     *    auto out = F.span<Force>();
+     *    auto in = m.const_span<Mass>();
+     *    for (size_t i=0; i<in.size(); ++i){
+     *        out[i] = in[i] * g;
+     *    }
+     *
+     * Spans and iterators require that the elements are equally spaced
+     * in memory, which holds for contiguous arrays and for strided
+     * one-dimensional slices such as a column of a matrix. Other arrays
+     * can be traversed with the algorithms below or with get_at.
+     */
+    template<typename boost_quantity>
+    QuantitySpan<boost_quantity, T> span()
+    {
+        return QuantitySpan<boost_quantity, T>(
+            data, _N, checked_step(), _unit
+        );
+    }
+
+    template<typename boost_quantity>
+    QuantitySpan<boost_quantity, const T> span() const
+    {
+        return QuantitySpan<boost_quantity, const T>(
+            data, _N, checked_step(), _unit
         );
     }
 
     template<typename boost_quantity>
-    ConstQuantityIteratorGenerator<boost_quantity, double> const_iter() const
+    QuantitySpan<boost_quantity, const T> const_span() const
+    {
+        return QuantitySpan<boost_quantity, const T>(
+            data, _N, checked_step(), _unit
+        );
+    }
+
+    /*
+     * Parallel algorithms
+     * -------------------
+     * The following templates apply a function to all elements of one or
+     * more wrappers. The unit conversion factors are resolved once per call.
+     * If compiled with OpenMP and the wrapper contains at least
+     * PARALLEL_THRESHOLD elements, the index range is split across the
+     * threads of the OpenMP runtime (see OMP_NUM_THREADS). The functions
+     * passed hence need to be thread-safe and must not throw.
+     */
+    constexpr static size_t PARALLEL_THRESHOLD = 1 << 17;
+
+    /*
+     * Sets the elements of this quantity to fun(in[i]...), where the
+     * elements of the input wrappers are passed as the Boost.Units
+     * quantities 'in_quantity'. The input wrappers are broadcast to the
+     * shape of this quantity following the NumPy rules; in particular,
+     * wrappers of size one are broadcast to all elements. For instance:
+     *
+     *    F.transform<Force, Mass, Acceleration>(
+     *        [](const Mass& m, const Acceleration& g) -> Force
+     *        {
+     *            return m * g;
+     *        },
+     *        m, g
+     *    );
+     */
+    template<typename out_quantity, typename... in_quantity,
+             typename Function, typename... Wrapper>
+    void transform(Function fun, const Wrapper&... in)
     {
-        return ConstQuantityIteratorGenerator<boost_quantity, double>(
-            data, _N, _unit
+        static_assert(
+            sizeof...(in_quantity) == sizeof...(Wrapper),
+            "Need to specify one Boost.Units quantity per input wrapper."
+        );
+        static_assert(
+            (std::is_same_v<
+                Wrapper,
+                BasicQuantityWrapper<typename Wrapper::value_type>
+             > && ...)
         );
+        const bool flat = _step != 0 && (flat_compatible(in) && ...);
+        if (!flat)
+            (check_broadcastable(in), ...);
+        transform_impl<out_quantity, in_quantity...>(
+            flat, fun, std::index_sequence_for<in_quantity...>(), in...
+        );
+    }
+
+    /*
+     * Calls fun(q) for all elements q of this quantity, passed as a
+     * reference to the Boost.Units quantity 'boost_quantity'. Modifications
+     * of q are written back to the element.
+     */
+    template<typename boost_quantity, typename Function>
+    void for_each(Function fun)
+    {
+        typedef typename boost_quantity::value_type V;
+        const boost_quantity scale = get_converter<boost_quantity>(_unit);
+        T* x = data;
+        const std::ptrdiff_t N = _N;
+        const std::ptrdiff_t step = _step;
+        if (step != 0){
+            #ifdef _OPENMP
+            #pragma omp parallel for schedule(static) \
+                    if(N >= (std::ptrdiff_t)PARALLEL_THRESHOLD)
+            #endif
+            for (std::ptrdiff_t i=0; i<N; ++i){
+                boost_quantity q = static_cast<V>(x[i * step]) * scale;
+                fun(q);
+                x[i * step] = q / scale;
+            }
+            return;
+        }
+        const std::array<strides_t, 1> strides{_strides};
+        for_chunks([&](size_t i0, size_t i1){
+            BroadcastCursor<1> c(_ndim, _shape.data(), strides, i0);
+            for (size_t i=i0; i<i1; ++i, c.advance()){
+                boost_quantity q = static_cast<V>(x[c[0]]) * scale;
+                fun(q);
+                x[c[0]] = q / scale;
+            }
+        });
+    }
+
+    /*
+     * Reduces the elements of this quantity, given as the Boost.Units
+     * quantity 'boost_quantity', using the binary operation 'op' and the
+     * initial value 'init'. Since the elements are reduced in chunks, the
+     * operation has to be associative.
+     */
+    template<typename boost_quantity, typename BinaryOp>
+    boost_quantity reduce(boost_quantity init, BinaryOp op) const
+    {
+        typedef typename boost_quantity::value_type V;
+        const boost_quantity scale = get_converter<boost_quantity>(_unit);
+        const T* x = data;
+        const std::ptrdiff_t step = _step;
+        const std::array<strides_t, 1> strides{_strides};
+        /* Reduces the index range [i0,i1), which must not be empty: */
+        auto reduce_range = [&](size_t i0, size_t i1) -> boost_quantity
+        {
+            if (step != 0){
+                const std::ptrdiff_t j0 = i0, j1 = i1;
+                boost_quantity r = static_cast<V>(x[j0 * step]) * scale;
+                for (std::ptrdiff_t j=j0+1; j<j1; ++j)
+                    r = op(r, static_cast<V>(x[j * step]) * scale);
+                return r;
+            }
+            BroadcastCursor<1> c(_ndim, _shape.data(), strides, i0);
+            boost_quantity r = static_cast<V>(x[c[0]]) * scale;
+            for (size_t i=i0+1; i<i1; ++i){
+                c.advance();
+                r = op(r, static_cast<V>(x[c[0]]) * scale);
+            }
+            return r;
+        };
+        const size_t N = _N;
+        #ifdef _OPENMP
+        const int max_threads = omp_get_max_threads();
+        if (N >= PARALLEL_THRESHOLD && max_threads > 1){
+            std::vector<boost_quantity> partial(max_threads);
+            std::vector<char> has_partial(max_threads, 0);
+            #pragma omp parallel num_threads(max_threads)
+            {
+                const size_t t = omp_get_thread_num();
+                const size_t nt = omp_get_num_threads();
+                const size_t chunk = (N + nt - 1) / nt;
+                const size_t i0 = std::min(N, t * chunk);
+                const size_t i1 = std::min(N, i0 + chunk);
+                if (i0 < i1){
+                    partial[t] = reduce_range(i0, i1);
+                    has_partial[t] = 1;
+                }
+            }
+            for (int t=0; t<max_threads; ++t){
+                if (has_partial[t])
+                    init = op(init, partial[t]);
+            }
+            return init;
+        }
+        #endif
+        if (N > 0)
+            init = op(init, reduce_range(0, N));
+        return init;
     }
 
 
 private:
-    double scalar_data;
+    T scalar_data;
 
     /* Attributes: */
-    double* data;
+    T* data;
     size_t _N;
+    size_t _ndim;
+    std::array<size_t, MAX_NDIM> _shape{};
+    /* Strides in units of T: */
+    strides_t _strides{};
+    /* The distance between consecutive elements (in C order) if they are
+     * equally spaced, zero otherwise: */
+    std::ptrdiff_t _step;
     Unit _unit;
 
+    std::ptrdiff_t equal_step() const
+    {
+        std::ptrdiff_t step = 1;
+        std::ptrdiff_t expected = 0;
+        bool found = false;
+        for (size_t d=_ndim; d-- > 0;){
+            if (_shape[d] == 1)
+                continue;
+            if (!found){
+                step = _strides[d];
+                found = true;
+            } else if (_strides[d] != expected){
+                return 0;
+            }
+            expected = _strides[d] * static_cast<std::ptrdiff_t>(_shape[d]);
+        }
+        return step;
+    }
+
+    std::ptrdiff_t checked_step() const
+    {
+        if (_step == 0)
+            throw std::runtime_error(
+                "The elements of this quantity are not equally spaced in "
+                "memory."
+            );
+        return _step;
+    }
+
+    /*
+     * The offset of the element with flat index i:
+     */
+    std::ptrdiff_t offset(size_t i) const
+    {
+        if (_step != 0)
+            return static_cast<std::ptrdiff_t>(i) * _step;
+        std::ptrdiff_t off = 0;
+        for (size_t d=_ndim; d-- > 0;){
+            off += static_cast<std::ptrdiff_t>(i % _shape[d]) * _strides[d];
+            i /= _shape[d];
+        }
+        return off;
+    }
+
+    template<std::integral... Index>
+    std::ptrdiff_t nd_offset(Index... index) const
+    {
+        if (sizeof...(Index) != _ndim)
+            throw std::out_of_range(
+                "Number of indices does not match the number of dimensions."
+            );
+        const std::array<size_t, sizeof...(Index)> idx{
+            static_cast<size_t>(index)...
+        };
+        std::ptrdiff_t off = 0;
+        for (size_t d=0; d<idx.size(); ++d){
+            if (idx[d] >= _shape[d])
+                throw std::out_of_range("Index out of range.");
+            off += static_cast<std::ptrdiff_t>(idx[d]) * _strides[d];
+        }
+        return off;
+    }
+
+    std::ptrdiff_t broadcast_offset(const size_t* index, size_t n) const
+    {
+        std::ptrdiff_t off = 0;
+        for (size_t j=0; j<_ndim; ++j){
+            /* Aligned dimension of the index: */
+            const std::ptrdiff_t d = static_cast<std::ptrdiff_t>(n + j)
+                                     - static_cast<std::ptrdiff_t>(_ndim);
+            if (_shape[j] == 1)
+                continue;
+            if (d < 0)
+                throw std::out_of_range(
+                    "Index has too few dimensions to broadcast."
+                );
+            if (index[d] >= _shape[j])
+                throw std::out_of_range("Index out of range.");
+            off += static_cast<std::ptrdiff_t>(index[d]) * _strides[j];
+        }
+        return off;
+    }
+
+    /*
+     * Computes the strides of the quantity 'in', broadcast to the shape
+     * of this quantity. Returns false if the shapes are incompatible.
+     */
+    template<typename U>
+    bool broadcast_strides(const BasicQuantityWrapper<U>& in,
+                           strides_t& strides) const
+    {
+        strides.fill(0);
+        for (size_t j=0; j<in._ndim; ++j){
+            const std::ptrdiff_t d = static_cast<std::ptrdiff_t>(_ndim + j)
+                                     - static_cast<std::ptrdiff_t>(in._ndim);
+            if (in._shape[j] == 1)
+                continue;
+            if (d < 0 || in._shape[j] != _shape[d])
+                return false;
+            strides[d] = in._strides[j];
+        }
+        return true;
+    }
+
+    /*
+     * Whether the input can be traversed together with this equally
+     * spaced quantity by a flat index. This includes the equal-size
+     * inputs of differing shape accepted by earlier versions.
+     */
+    template<typename U>
+    bool flat_compatible(const BasicQuantityWrapper<U>& in) const
+    {
+        return in._N == 1 || (in._step != 0 && in._N == _N);
+    }
+
+    template<typename U>
+    void check_broadcastable(const BasicQuantityWrapper<U>& in) const
+    {
+        strides_t strides;
+        if (!broadcast_strides(in, strides))
+            throw std::runtime_error(
+                "Input quantity size is incompatible with the output size."
+            );
+    }
+
+    /*
+     * Calls fun(i0, i1) for chunks [i0,i1) of the flat index range,
+     * in parallel if large enough.
+     */
+    template<typename Function>
+    void for_chunks(Function fun) const
+    {
+        const size_t N = _N;
+        #ifdef _OPENMP
+        if (N >= PARALLEL_THRESHOLD){
+            #pragma omp parallel
+            {
+                const size_t t = omp_get_thread_num();
+                const size_t nt = omp_get_num_threads();
+                const size_t chunk = (N + nt - 1) / nt;
+                const size_t i0 = std::min(N, t * chunk);
+                const size_t i1 = std::min(N, i0 + chunk);
+                if (i0 < i1)
+                    fun(i0, i1);
+            }
+            return;
+        }
+        #endif
+        fun(0, N);
+    }
+
+    template<typename out_quantity, typename... in_quantity,
+             typename Function, size_t... I, typename... Wrapper>
+    void transform_impl(bool flat, Function& fun, std::index_sequence<I...>,
+                        const Wrapper&... in)
+    {
+        /* Resolve the unit conversions and the input strides once: */
+        const out_quantity out_scale = get_converter<out_quantity>(_unit);
+        const std::tuple<in_quantity...> in_scale(
+            get_converter<in_quantity>(in._unit)...
+        );
+        const std::tuple<const typename Wrapper::value_type*...> in_data(
+            in.data...
+        );
+        T* out = data;
+        if (flat){
+            /* All elements equally spaced: */
+            const std::array<std::ptrdiff_t, sizeof...(I)> in_step{
+                ((in._N == 1) ? 0 : in._step)...
+            };
+            const std::ptrdiff_t step = _step;
+            const std::ptrdiff_t N = _N;
+            #ifdef _OPENMP
+            #pragma omp parallel for schedule(static) \
+                    if(N >= (std::ptrdiff_t)PARALLEL_THRESHOLD)
+            #endif
+            for (std::ptrdiff_t i=0; i<N; ++i){
+                const out_quantity q = fun(
+                    (static_cast<typename in_quantity::value_type>(
+                         std::get<I>(in_data)[i * in_step[I]]
+                     ) * std::get<I>(in_scale))...
+                );
+                out[i * step] = q / out_scale;
+            }
+            return;
+        }
+
+        /* Strided or broadcast operands. Index 0 is the output: */
+        std::array<strides_t, sizeof...(I) + 1> strides;
+        strides[0] = _strides;
+        (broadcast_strides(in, strides[I+1]), ...);
+        for_chunks([&](size_t i0, size_t i1){
+            BroadcastCursor<sizeof...(I) + 1> c(
+                _ndim, _shape.data(), strides, i0
+            );
+            for (size_t i=i0; i<i1; ++i, c.advance()){
+                const out_quantity q = fun(
+                    (static_cast<typename in_quantity::value_type>(
+                         std::get<I>(in_data)[c[I+1]]
+                     ) * std::get<I>(in_scale))...
+                );
+                out[c[0]] = q / out_scale;
+            }
+        });
+    }
+
 public:
-    size_t size() const;
-    const Unit& unit() const;
+    size_t size() const
+    {
+        return _N;
+    }
+
+    size_t ndim() const
+    {
+        return _ndim;
+    }
+
+    size_t shape(size_t dim) const
+    {
+        if (dim >= _ndim)
+            throw std::out_of_range("Dimension out of range.");
+        return _shape[dim];
+    }
+
+    /*
+     * The stride of dimension 'dim' in units of T.
+     */
+    std::ptrdiff_t stride(size_t dim) const
+    {
+        if (dim >= _ndim)
+            throw std::out_of_range("Dimension out of range.");
+        return _strides[dim];
+    }
+
+    bool contiguous() const
+    {
+        return _step == 1;
+    }
+
+    const Unit& unit() const
+    {
+        return _unit;
+    }
 };
 
 
+typedef BasicQuantityWrapper<double> QuantityWrapper;
+typedef BasicQuantityWrapper<float> QuantityWrapper32;
+
+extern template class BasicQuantityWrapper<double>;
+extern template class BasicQuantityWrapper<float>;
+
+
 
 } // end namespace
 
@@ -600,5 +1477,11 @@ std::ranges::enable_borrowed_range<
     cyantities::QuantityIteratorGenerator<boost_quantity, T>
 > = true;
 
+template< typename boost_quantity, typename T >
+inline constexpr bool
+std::ranges::enable_borrowed_range<
+    cyantities::QuantitySpan<boost_quantity, T>
+> = true;
+
 
 #endif
\ No newline at end of file
@@ -52,6 +52,19 @@ constexpr base_unit_index_t BASE_UNIT_COUNT = 9;
 typedef std::array<int8_t,BASE_UNIT_COUNT> base_unit_array_t;
 
 
+/*
+ * The dimension key packs the base unit exponents into a single integer
+ * so that dimensions can be compared and hashed with a single integer
+ * operation. Each exponent occupies a 7-bit two's complement field.
+ * Exponents outside of the range [-64, 63] set the overflow bit, in which
+ * case comparisons fall back to the base unit array.
+ */
+typedef uint64_t dimension_key_t;
+constexpr uint_fast8_t DIMENSION_KEY_BITS = 7;
+constexpr dimension_key_t DIMENSION_KEY_OVERFLOW
+    = static_cast<dimension_key_t>(1) << 63;
+
+
 class Unit;
 
 /*
@@ -111,16 +124,27 @@ public:
 
     Unit power(int16_t exp) const;
 
+    /* Whether the n-th root has integer base unit exponents: */
+    bool has_root(int16_t n) const;
+
+    /* The n-th root. Requires has_root(n). */
+    Unit root(int16_t n) const;
+
     int16_t decadal_exponent() const;
     double conversion_factor() const;
     double total_scale() const;
 
     const base_unit_array_t& base_units() const;
 
+    dimension_key_t dimension_key() const;
+
 private:
     int16_t dec_exp;
     base_unit_array_t _base_units;
     double conv;
+    dimension_key_t dim_key;
+
+    void update_dimension_key();
 };
 
 }
@@ -60,14 +60,15 @@ void UnitBuilder::multiply_conversion_factor(double f)
 /*
  * Unit:
  */
-Unit::Unit() : dec_exp(0), conv(1.0)
+Unit::Unit() : dec_exp(0), conv(1.0), dim_key(0)
 {
     for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
         _base_units[i] = 0;
 }
 
 
-Unit::Unit(int16_t dec_exp, double conv) : dec_exp(dec_exp), conv(conv)
+Unit::Unit(int16_t dec_exp, double conv)
+    : dec_exp(dec_exp), conv(conv), dim_key(0)
 {
     for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
         _base_units[i] = 0;
@@ -78,6 +79,22 @@ Unit::Unit(const UnitBuilder& builder)
 {
     /* Init the array: */
     _base_units = builder.unit;
+    update_dimension_key();
+}
+
+void Unit::update_dimension_key()
+{
+    constexpr int8_t field_min = -(1 << (DIMENSION_KEY_BITS - 1));
+    constexpr int8_t field_max = (1 << (DIMENSION_KEY_BITS - 1)) - 1;
+    constexpr dimension_key_t field_mask = (1 << DIMENSION_KEY_BITS) - 1;
+    dim_key = 0;
+    for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i){
+        int8_t e = _base_units[i];
+        if (e < field_min || e > field_max)
+            dim_key |= DIMENSION_KEY_OVERFLOW;
+        dim_key |= (static_cast<dimension_key_t>(static_cast<uint8_t>(e))
+                    & field_mask) << (DIMENSION_KEY_BITS * i);
+    }
 }
 
 Unit Unit::invert() const
@@ -85,6 +102,7 @@ Unit Unit::invert() const
     Unit res(-dec_exp, 1.0 / conv);
     for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
         res._base_units[i] = -_base_units[i];
+    res.update_dimension_key();
     return res;
 }
 
@@ -94,29 +112,62 @@ Unit Unit::power(int16_t exponent) const
     Unit res(exponent*dec_exp, std::pow(conv, exponent));
     for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
         res._base_units[i] = exponent * _base_units[i];
+    res.update_dimension_key();
+    return res;
+}
+
+
+bool Unit::has_root(int16_t n) const
+{
+    if (n <= 0)
+        return false;
+    for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i){
+        if (_base_units[i] % n != 0)
+            return false;
+    }
+    return true;
+}
+
+
+Unit Unit::root(int16_t n) const
+{
+    /* Keep the decadal exponent integer and move the remainder to the
+     * conversion factor: */
+    int16_t dec = dec_exp / n;
+    if (dec_exp % n < 0)
+        dec -= 1;
+    const int16_t rem = dec_exp - n * dec;
+    Unit res(dec, std::pow(conv * std::pow(10.0, rem), 1.0 / n));
+    for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
+        res._base_units[i] = _base_units[i] / n;
+    res.update_dimension_key();
     return res;
 }
 
 
 bool Unit::operator==(const Unit& other) const
 {
-    return (dec_exp == other.dec_exp) && (_base_units == other._base_units)
-        && (conv == other.conv);
+    return (dec_exp == other.dec_exp) && (conv == other.conv)
+        && same_dimension(other);
 }
 
 
 bool Unit::same_dimension(const Unit& other) const
 {
-    return _base_units == other._base_units;
+    if (dim_key != other.dim_key)
+        return false;
+
+    /* Only if one of the exponents does not fit into its field of the
+     * key do we need to compare the full arrays: */
+    if (dim_key & DIMENSION_KEY_OVERFLOW)
+        return _base_units == other._base_units;
+
+    return true;
 }
 
 bool Unit::dimensionless() const
 {
-    for (uint_fast8_t i=0; i<BASE_UNIT_COUNT; ++i)
-        if (_base_units[i] != 0)
-            return false;
-
-    return true;
+    return dim_key == 0;
 }
 
 /*
@@ -141,6 +192,7 @@ Unit Unit::operator*(const Unit& other) const
     /* Scale and convergence factor: */
     result.dec_exp = dec_exp + other.dec_exp;
     result.conv = conv * other.conv;
+    result.update_dimension_key();
 
     return result;
 }
@@ -156,6 +208,7 @@ Unit& Unit::operator*=(const Unit& other)
     /* Scale and convergence factor: */
     dec_exp += other.dec_exp;
     conv *= other.conv;
+    update_dimension_key();
 
     return *this;
 }
@@ -184,6 +237,7 @@ Unit Unit::operator/(const Unit& other) const
     /* Scale and convergence factor: */
     result.dec_exp = dec_exp - other.dec_exp;
     result.conv = conv / other.conv;
+    result.update_dimension_key();
 
 
     return result;
@@ -200,6 +254,7 @@ Unit& Unit::operator/=(const Unit& other)
     /* Scale and convergence factor: */
     dec_exp -= other.dec_exp;
     conv /= other.conv;
+    update_dimension_key();
 
     return *this;
 }
@@ -230,4 +285,9 @@ const base_unit_array_t& Unit::base_units() const
     return _base_units;
 }
 
+dimension_key_t Unit::dimension_key() const
+{
+    return dim_key;
+}
+
 }
\ No newline at end of file
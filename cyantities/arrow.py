@@ -0,0 +1,202 @@
+# Apache Arrow interchange of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+#
+# This module requires pyarrow. Quantities are represented by the Arrow
+# extension type 'cyantities.quantity' over float64 or float32 storage.
+# The serialized type metadata is a JSON object with the keys
+#   'unit'   : object with the keys 'dec_exp', 'conv', and 'exponents',
+#              the exact state of the C++ unit (as in cyantities.io)
+#   'symbol' : informative string representation of the unit
+# so that the unit survives Arrow IPC, Parquet, and other tools that
+# preserve extension types.
+#
+
+import json
+import numpy as np
+import pyarrow as pa
+from .unit import Unit
+from .quantity import Quantity
+from .io import _unit_to_dict, _unit_from_dict
+
+_EXTENSION_NAME = "cyantities.quantity"
+
+
+class QuantityType(pa.ExtensionType):
+    """
+    Arrow extension type of one-dimensional quantities, with the unit
+    in the type metadata.
+
+    Parameters
+    ----------
+    unit : Unit | str
+        The unit of the values.
+    storage_type : pa.DataType, optional
+        The storage type, `pa.float64()` (default) or `pa.float32()`.
+    """
+    def __init__(self, unit: Unit | str,
+                 storage_type: pa.DataType | None = None):
+        if isinstance(unit, str):
+            unit = Unit(unit)
+        elif not isinstance(unit, Unit):
+            raise TypeError("'unit' has to be either a string or a Unit.")
+        if storage_type is None:
+            storage_type = pa.float64()
+        elif storage_type not in (pa.float64(), pa.float32()):
+            raise TypeError("The storage type has to be float64 or float32.")
+        self._unit = unit
+        super().__init__(storage_type, _EXTENSION_NAME)
+
+
+    def unit(self) -> Unit:
+        """
+        The unit of the values.
+        """
+        return self._unit
+
+
+    def __eq__(self, other):
+        # The default equality of extension types ignores the metadata.
+        if isinstance(other, QuantityType):
+            return (self.storage_type == other.storage_type
+                    and self._unit == other._unit)
+        return NotImplemented
+
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+
+    def __hash__(self) -> int:
+        return hash((self.storage_type, self._unit))
+
+
+    def __repr__(self) -> str:
+        return ("QuantityType('" + str(self._unit) + "', "
+                + str(self.storage_type) + ")")
+
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return json.dumps({
+            'unit' : _unit_to_dict(self._unit),
+            'symbol' : str(self._unit)
+        }).encode('ascii')
+
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type: pa.DataType,
+                                  serialized: bytes) -> "QuantityType":
+        metadata = json.loads(serialized.decode('ascii'))
+        return cls(_unit_from_dict(metadata['unit']), storage_type)
+
+
+    def __arrow_ext_class__(self):
+        return QuantityArray
+
+
+    def __reduce__(self):
+        return (QuantityType, (self._unit, self.storage_type))
+
+
+class QuantityArray(pa.ExtensionArray):
+    """
+    Arrow array of the extension type `QuantityType`.
+    """
+    def to_quantity(self) -> Quantity:
+        """
+        The quantity that wraps the buffer of this array without
+        copying until it is written to. Null values are replaced by NaN
+        in a copy.
+        """
+        return to_quantity(self)
+
+
+# Register the type so that it is restored when reading Arrow data:
+try:
+    pa.register_extension_type(QuantityType(Unit('1')))
+except pa.ArrowKeyError:
+    pass
+
+
+def from_quantity(quantity: Quantity) -> QuantityArray:
+    """
+    Wraps the values of a one-dimensional array quantity into an Arrow
+    array of type `QuantityType`.
+
+    The Arrow array shares the buffer of contiguous quantities, which
+    is kept alive by the array. Strided quantities are copied.
+    """
+    if not isinstance(quantity, Quantity):
+        raise TypeError("'quantity' has to be a Quantity.")
+    shape = quantity.shape()
+    if not isinstance(shape, tuple) or len(shape) != 1:
+        raise ValueError("Only one-dimensional array quantities can be "
+                         "converted to Arrow arrays.")
+    unit = quantity.unit()
+    values = np.ascontiguousarray(np.asarray(quantity / unit))
+    storage_type = pa.float32() if values.dtype == np.float32 \
+                   else pa.float64()
+    storage = pa.Array.from_buffers(storage_type, values.size,
+                                    [None, pa.py_buffer(values)])
+    return pa.ExtensionArray.from_storage(
+        QuantityType(unit, storage_type), storage
+    )
+
+
+def to_quantity(array: pa.Array | pa.ChunkedArray,
+                unit: Unit | str | None = None) -> Quantity:
+    """
+    Creates a quantity from an Arrow array.
+
+    Parameters
+    ----------
+    array : pa.Array | pa.ChunkedArray
+        An array of type `QuantityType`, or of a floating point or
+        integer type if `unit` is given.
+    unit : Unit | str, optional
+        The unit of arrays that are not of type `QuantityType`.
+
+    Returns
+    -------
+    quantity : Quantity
+        A one-dimensional quantity. Arrays and single-chunk chunked arrays
+        of float64 or float32 values without nulls are shared without
+        copying. The quantity then copies the buffer once it is written
+        to, for instance as the `out` target of an operation.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        if array.num_chunks == 1:
+            array = array.chunk(0)
+        else:
+            array = array.combine_chunks()
+    if not isinstance(array, pa.Array):
+        raise TypeError("'array' has to be an Arrow array.")
+    if isinstance(array.type, QuantityType):
+        if unit is not None:
+            raise ValueError("The unit of arrays of type QuantityType is "
+                             "part of the type.")
+        unit = array.type.unit()
+        array = array.storage
+    elif unit is None:
+        raise ValueError("The unit has to be given for arrays that are not "
+                         "of type QuantityType.")
+    values = array.to_numpy(zero_copy_only=False)
+    # Copy-on-write, since Arrow buffers are immutable:
+    return Quantity(values, unit, copy=None)
@@ -0,0 +1,258 @@
+# Saving and loading quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+#
+# File format
+# -----------
+# 1) The magic string b'\x93CYANTITIES', followed by the major and minor
+#    version of the format as two unsigned bytes.
+# 2) The length of the header as a little-endian uint32.
+# 3) The header: an ASCII JSON object with the keys
+#      'shape'  : list of int, empty for scalar quantities
+#      'dtype'  : NumPy dtype string of the values ('<f8' or '<f4')
+#      'unit'   : object with the keys 'dec_exp', 'conv', and 'exponents',
+#                 the exact state of the C++ unit
+#      'symbol' : informative string representation of the unit
+#    padded with spaces so that the values start at a multiple of 64 bytes.
+# 4) The values, in C order, in the unit of the quantity.
+#
+
+import json
+import struct
+import numpy as np
+from io import TextIOBase
+from os import PathLike
+from typing import IO, Literal
+from .unit import Unit, _unit_state, _unit_from_state
+from .errors import UnitError
+from .quantity import Quantity, _format_values
+
+_MAGIC = b'\x93CYANTITIES'
+_VERSION = (1, 0)
+_ALIGNMENT = 64
+
+# Number of values formatted per block by savetxt:
+_TEXT_CHUNK_SIZE = 1 << 16
+
+
+def _unit_to_dict(unit: Unit) -> dict:
+    """
+    The exact state of a unit as a JSON-serializable dict.
+    """
+    dec_exp, conv, exponents = _unit_state(unit)
+    return {
+        'dec_exp' : dec_exp,
+        'conv' : conv,
+        'exponents' : list(exponents)
+    }
+
+
+def _unit_from_dict(state: dict) -> Unit:
+    """
+    Restores a unit from the dict returned by _unit_to_dict.
+    """
+    return _unit_from_state(state['dec_exp'], state['conv'],
+                            tuple(state['exponents']))
+
+
+def save(file: str | PathLike, quantity: Quantity):
+    """
+    Saves a quantity to a file.
+
+    Parameters
+    ----------
+    file : str | PathLike
+       Path of the file.
+    quantity : Quantity
+       The quantity. Its values are written without conversion, in
+       the unit and precision of the quantity.
+    """
+    if not isinstance(quantity, Quantity):
+        raise TypeError("'quantity' has to be a Quantity.")
+    unit = quantity.unit()
+    values = np.asarray(quantity / unit)
+    if isinstance(quantity.shape(), tuple):
+        shape = list(values.shape)
+    else:
+        shape = []
+    values = values.astype(values.dtype.newbyteorder('<'), copy=False)
+    header = json.dumps({
+        'shape' : shape,
+        'dtype' : values.dtype.str,
+        'unit' : _unit_to_dict(unit),
+        'symbol' : str(unit)
+    }).encode('ascii')
+
+    # Pad the header so that the values are aligned:
+    preamble = len(_MAGIC) + 2 + 4
+    header += b' ' * (-(preamble + len(header)) % _ALIGNMENT)
+
+    with open(file, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(bytes(_VERSION))
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        values.tofile(f)
+
+
+def _read_header(f) -> tuple[dict, int]:
+    """
+    Reads the header of a file and returns it together with the offset
+    of the values.
+    """
+    if f.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError("Not a Cyantities quantity file.")
+    version = tuple(f.read(2))
+    if version[0] != _VERSION[0]:
+        raise ValueError("Unsupported file format version "
+                         + ".".join(str(v) for v in version) + ".")
+    header_length, = struct.unpack('<I', f.read(4))
+    header = json.loads(f.read(header_length).decode('ascii'))
+    return header, len(_MAGIC) + 2 + 4 + header_length
+
+
+def load(
+        file: str | PathLike,
+        mmap: bool = True,
+        mode: Literal['r','r+','c'] = 'r'
+    ) -> Quantity:
+    """
+    Loads a quantity from a file.
+
+    Parameters
+    ----------
+    file : str | PathLike
+       Path of the file.
+    mmap : bool, optional
+       If True, array values are memory-mapped through `np.memmap`
+       instead of being read into memory. This opens files of any size
+       in constant time.
+    mode : 'r' | 'r+' | 'c', optional
+       Access mode of the memory map. The default 'r' maps read-only:
+       arithmetic returns new quantities, and writing to the quantity
+       through `out` arguments or in-place conversion raises a
+       ValueError. With 'r+', results written to the quantity through
+       `out` arguments are stored in the file, and 'c' maps copy-on-write
+       pages that are not written back to the file.
+    """
+    with open(file, 'rb') as f:
+        header, offset = _read_header(f)
+        unit = _unit_from_dict(header['unit'])
+        dtype = np.dtype(header['dtype'])
+        shape = tuple(header['shape'])
+        if len(shape) == 0:
+            return Quantity(float(np.fromfile(f, dtype, 1)[0]), unit)
+        if not mmap or 0 in shape:
+            values = np.fromfile(f, dtype, int(np.prod(shape)))
+            return Quantity(values.reshape(shape), unit, copy=False)
+
+    values = np.memmap(file, dtype=dtype, mode=mode, offset=offset,
+                       shape=shape, order='C')
+    return Quantity(values, unit, copy=False)
+
+
+def savetxt(
+        file: str | PathLike | IO,
+        quantity: Quantity,
+        unit: Unit | str | None = None,
+        delimiter: str = ',',
+        precision: int | None = None,
+        header: bool = True,
+        chunk_size: int | None = None
+    ):
+    """
+    Writes a one- or two-dimensional array quantity to a delimited text
+    file, for instance a CSV file, with one row per line.
+
+    Parameters
+    ----------
+    file : str | PathLike | IO
+       Path of the file or an open text or binary file.
+    quantity : Quantity
+       The array quantity.
+    unit : Unit | str, optional
+       The unit in which the values are written. By default, the unit
+       of the quantity.
+    delimiter : str, optional
+       The column separator.
+    precision : int, optional
+       Number of significant digits, at most 17. By default, the values
+       are written with the shortest representation that reads back to
+       the same double.
+    header : bool, optional
+       If True, the first line is a comment '# ' followed by the unit.
+    chunk_size : int, optional
+       Approximate number of values that are formatted per block.
+
+    Notes
+    -----
+    The values are formatted natively in blocks, so that the memory
+    required for the text is bounded by `chunk_size`.
+    """
+    if not isinstance(quantity, Quantity):
+        raise TypeError("'quantity' has to be a Quantity.")
+    if not isinstance(quantity.shape(), tuple):
+        raise TypeError("Only array quantities can be written to text "
+                        "files.")
+    # Keep unit strings as given for the header:
+    if unit is None:
+        unit = quantity.unit()
+        symbol = str(unit)
+    elif isinstance(unit, str):
+        symbol = unit
+        unit = Unit(unit)
+    elif isinstance(unit, Unit):
+        symbol = str(unit)
+    else:
+        raise TypeError("'unit' has to be either a string or a Unit.")
+    if not unit.same_dimension(quantity.unit()):
+        raise UnitError("The unit has to be of the dimension of the "
+                        "quantity.")
+    scale = float(quantity.unit() / unit)
+    if precision is None:
+        precision = -1
+    elif precision < 1:
+        raise ValueError("'precision' has to be positive.")
+    if chunk_size is None:
+        chunk_size = _TEXT_CHUNK_SIZE
+    elif chunk_size < 1:
+        raise ValueError("'chunk_size' has to be positive.")
+
+    values = np.asarray(quantity / quantity.unit())
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    elif values.ndim != 2:
+        raise ValueError("Only one- and two-dimensional quantities can be "
+                         "written to text files.")
+    step = max(chunk_size // max(values.shape[1], 1), 1)
+    delimiter = delimiter.encode('utf-8')
+
+    f = file if hasattr(file, 'write') else open(file, 'wb')
+    text_mode = isinstance(f, TextIOBase)
+    try:
+        if header:
+            line = "# " + symbol + "\n"
+            f.write(line if text_mode else line.encode('utf-8'))
+        for i in range(0, values.shape[0], step):
+            block = np.ascontiguousarray(values[i:i+step], dtype=np.double)
+            lines = _format_values(block, scale, delimiter, precision)
+            f.write(lines.decode('utf-8') if text_mode else lines)
+    finally:
+        if f is not file:
+            f.close()
@@ -0,0 +1,276 @@
+# Lazy evaluation of quantity expressions.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import numpy as np
+from .unit import Unit
+from .errors import UnitError
+from .quantity import Quantity, _evaluate_program, _writable_values, \
+    _PROGRAM_OPCODES
+from . import quantity as _quantity
+
+_DIMENSIONLESS = Unit('1')
+
+
+class LazyQuantity:
+    """
+    A node of a deferred quantity expression.
+
+    Arithmetic with lazy quantities builds an expression tree. The unit
+    and shape of each node are determined immediately, so that unit
+    errors are raised where the expression is written, while the values
+    are computed only by `evaluate`. The evaluation runs over the whole
+    expression in a single multithreaded pass that processes the
+    elements in cache-sized blocks, without array temporaries.
+    Broadcast and strided operands are read through their strides.
+
+    Sums and differences are expressed in the unit of the left operand.
+    The arithmetic is carried out in double precision, and results are
+    stored as float32 if all array operands are float32 (see `dtype`).
+    """
+    __slots__ = ('_op', '_children', '_value', '_unit', '_shape')
+
+    def __init__(self, op: str, children: tuple, value, unit: Unit,
+                 shape: tuple[int,...]):
+        self._op = op
+        self._children = children
+        self._value = value
+        self._unit = unit
+        self._shape = shape
+
+
+    def unit(self) -> Unit:
+        """
+        The unit of the result.
+        """
+        return self._unit
+
+
+    def shape(self) -> tuple[int,...]:
+        """
+        The shape of the result. Empty for scalar results.
+        """
+        return self._shape
+
+
+    def dtype(self) -> np.dtype:
+        """
+        The dtype of the result: float32 if all array operands are
+        float32, double otherwise.
+        """
+        arrays = []
+        self._compile([], [], arrays, dict())
+        return _result_dtype(arrays)
+
+
+    def __repr__(self) -> str:
+        return ("LazyQuantity(" + self._op + ", shape=" + str(self._shape)
+                + ", '" + str(self._unit) + "')")
+
+
+    #
+    # Expression building:
+    #
+    def __add__(self, other):
+        return _sum(self, other, 'add')
+
+    def __radd__(self, other):
+        return _sum(other, self, 'add')
+
+    def __sub__(self, other):
+        return _sum(self, other, 'subtract')
+
+    def __rsub__(self, other):
+        return _sum(other, self, 'subtract')
+
+    def __mul__(self, other):
+        return _product(self, other, 'multiply')
+
+    def __rmul__(self, other):
+        return _product(other, self, 'multiply')
+
+    def __truediv__(self, other):
+        return _product(self, other, 'divide')
+
+    def __rtruediv__(self, other):
+        return _product(other, self, 'divide')
+
+    def __neg__(self):
+        return LazyQuantity('negate', (self,), -1.0, self._unit, self._shape)
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, int):
+            raise TypeError("Quantities can be exponentiated only to integer "
+                            "powers.")
+        return LazyQuantity('power', (self,), float(exponent),
+                            self._unit ** exponent, self._shape)
+
+
+    #
+    # Evaluation:
+    #
+    def _compile(self, opcodes: list, args: list, arrays: list,
+                 indices: dict) -> int:
+        """
+        Appends the postfix program of this node and returns the number
+        of registers that it requires.
+        """
+        if self._op == 'load':
+            key = id(self._value)
+            if key not in indices:
+                indices[key] = len(arrays)
+                arrays.append(self._value)
+            opcodes.append(_PROGRAM_OPCODES['load'])
+            args.append(indices[key])
+            return 1
+        if self._op == 'const':
+            opcodes.append(_PROGRAM_OPCODES['const'])
+            args.append(self._value)
+            return 1
+        depth = self._children[0]._compile(opcodes, args, arrays, indices)
+        if len(self._children) == 2:
+            depth = max(depth, 1 + self._children[1]._compile(
+                opcodes, args, arrays, indices
+            ))
+        opcodes.append(_PROGRAM_OPCODES[self._op])
+        args.append(self._value)
+        if self._op in ('add', 'subtract') and self._value != 1.0:
+            # Scale of the right operand:
+            opcodes.insert(-1, _PROGRAM_OPCODES['scale'])
+            args.insert(-1, self._value)
+        return depth
+
+
+    def evaluate(self, out: Quantity | None = None) -> Quantity:
+        """
+        Evaluates the expression.
+
+        Parameters
+        ----------
+        out : Quantity, optional
+            A preallocated quantity of the shape of the result to which
+            the result is written, expressed in the unit of `out`.
+
+        Returns
+        -------
+        result : Quantity
+            The result, which is `out` if provided. Otherwise, its values
+            are of the dtype given by `dtype`.
+        """
+        opcodes = []
+        args = []
+        arrays = []
+        depth = self._compile(opcodes, args, arrays, dict())
+        shape = self._shape
+
+        if out is None:
+            values = np.empty(shape, dtype=_result_dtype(arrays))
+            _evaluate_program(opcodes, args, arrays, values, depth)
+            if len(shape) == 0:
+                return Quantity(float(values), self._unit)
+            return Quantity(values, self._unit, copy=False)
+
+        if not isinstance(out, Quantity):
+            raise TypeError("'out' has to be a Quantity.")
+        if len(shape) == 0:
+            return _quantity.multiply(self.evaluate(), 1.0, out=out)
+        if not out.unit().same_dimension(self._unit):
+            raise UnitError("The unit of `out` is incompatible with the "
+                            "unit of the result.")
+        if out.shape() != shape:
+            raise ValueError("The shape of `out` does not match the shape of "
+                             "the result.")
+        scale = float(self._unit / out.unit())
+        if scale != 1.0:
+            opcodes.append(_PROGRAM_OPCODES['scale'])
+            args.append(scale)
+        target = _writable_values(out)
+        if target.flags['C_CONTIGUOUS']:
+            _evaluate_program(opcodes, args, arrays, target, depth)
+        else:
+            values = np.empty(shape, dtype=target.dtype)
+            _evaluate_program(opcodes, args, arrays, values, depth)
+            target[...] = values
+        return out
+
+
+def _result_dtype(arrays: list[np.ndarray]) -> np.dtype:
+    """
+    The dtype of the result of an expression of the array operands.
+    """
+    if len(arrays) > 0 and all(a.dtype == np.float32 for a in arrays):
+        return np.dtype(np.float32)
+    return np.dtype(np.double)
+
+
+def lazy(value: Quantity | Unit | float) -> LazyQuantity:
+    """
+    Wraps a quantity, unit, or number into a lazy expression.
+
+    Example
+    -------
+    >>> m, v, h = lazy(m), lazy(v), lazy(h)
+    >>> E = (0.5 * m * v**2 + m * g * h).evaluate()
+    """
+    if isinstance(value, LazyQuantity):
+        return value
+    if isinstance(value, Quantity):
+        unit = value.unit()
+        shape = value.shape()
+        if not isinstance(shape, tuple):
+            return LazyQuantity('const', (), float(value / unit), unit, ())
+        # Values in the unit of the quantity, without a copy:
+        return LazyQuantity('load', (), np.asarray(value / unit), unit,
+                            shape)
+    if isinstance(value, Unit):
+        return LazyQuantity('const', (), 1.0, value, ())
+    if isinstance(value, (float, int)):
+        return LazyQuantity('const', (), float(value), _DIMENSIONLESS, ())
+    raise TypeError("Only quantities, units, and numbers can be part of "
+                    "lazy expressions.")
+
+
+def _operands(a, b) -> tuple[LazyQuantity, LazyQuantity, tuple[int,...]]:
+    """
+    Wraps the operands of a binary operation and determines the shape
+    of the result.
+    """
+    try:
+        a = lazy(a)
+        b = lazy(b)
+    except TypeError:
+        return None, None, None
+    return a, b, np.broadcast_shapes(a._shape, b._shape)
+
+
+def _sum(a, b, op: str):
+    a, b, shape = _operands(a, b)
+    if a is None:
+        return NotImplemented
+    if not a._unit.same_dimension(b._unit):
+        raise UnitError("Trying to " + op + " two quantities of incompatible "
+                        "units.")
+    return LazyQuantity(op, (a, b), float(b._unit / a._unit), a._unit, shape)
+
+
+def _product(a, b, op: str):
+    a, b, shape = _operands(a, b)
+    if a is None:
+        return NotImplemented
+    unit = a._unit * b._unit if op == 'multiply' else a._unit / b._unit
+    return LazyQuantity(op, (a, b), 0.0, unit, shape)
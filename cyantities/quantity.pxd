@@ -20,7 +20,7 @@
 import numpy as np
 from .unit cimport CppUnit, Unit
 from libcpp cimport bool
-from numpy cimport ndarray, float64_t
+from numpy cimport ndarray, float64_t, npy_intp
 
 
 cdef extern from "cyantities/quantitywrap.hpp" namespace "cyantities" nogil:
@@ -28,6 +28,15 @@ cdef extern from "cyantities/quantitywrap.hpp" namespace "cyantities" nogil:
         QuantityWrapper()
         QuantityWrapper(double data, const CppUnit& unit)
         QuantityWrapper(double* data, size_t N, const CppUnit& unit)
+        QuantityWrapper(double* data, size_t ndim, const npy_intp* shape,
+                        const npy_intp* strides, const CppUnit& unit)
+
+    cppclass QuantityWrapper32:
+        QuantityWrapper32()
+        QuantityWrapper32(float data, const CppUnit& unit)
+        QuantityWrapper32(float* data, size_t N, const CppUnit& unit)
+        QuantityWrapper32(float* data, size_t ndim, const npy_intp* shape,
+                          const npy_intp* strides, const CppUnit& unit)
 
 
 cdef class Quantity:
@@ -36,21 +45,44 @@ cdef class Quantity:
     physical unit.
     """
     # All underscored _variables are not part of the stable API.
-    cdef bool _initialized
-    cdef bool _is_scalar
+    # The members are ordered by alignment to keep the object compact.
     cdef double _val
     cdef size_t _val_array_N
-    cdef double* _val_array_ptr
+    cdef void* _val_array_ptr
     # So as to hold a reference to the buffer, define the following:
     cdef object _val_object
     cdef CppUnit _unit
-    cdef dict __dict__
+    cdef bool _initialized
+    cdef bool _is_scalar
+    cdef bool _cow
+    cdef bool _is_float32
+    cdef bool _is_contiguous
 
     cdef _cyinit(self, bool is_scalar, double val, object val_object,
                  CppUnit unit)
 
+    cdef _detach(self)
+
+    cdef bool _exclusive(self)
+
+    cdef bool _writable(self)
+
+    cdef bool _inplace_compatible(self, Quantity other)
+
+    cdef bool _native_reduction(self, object axis)
+
+    cdef size_t _argextremum(self, bool maximum)
+
+    cdef double _element(self, size_t i)
+
     cdef QuantityWrapper wrapper(self) nogil
 
+    cdef QuantityWrapper32 wrapper32(self) nogil
+
+    cdef QuantityWrapper mutable_wrapper(self)
+
+    cdef QuantityWrapper32 mutable_wrapper32(self)
+
     @staticmethod
     cdef Quantity zeros_like(Quantity other, object unit)
 
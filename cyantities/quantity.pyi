@@ -19,7 +19,7 @@
 
 import numpy as np
 from .unit import Unit
-from typing import Any
+from typing import Any, Callable, Literal, Sequence
 from numpy.typing import NDArray
 
 
@@ -27,9 +27,25 @@ class Quantity:
     """
     A physical quantity: a single or array of real numbers with an associated
     physical unit.
+
+    By default (`copy=True`), array quantities copy the given array once.
+    With `copy=None`, they instead wrap a read-only view of the array,
+    which is copied once the quantity is written to (copy-on-write).
+    Until then, changes of the array are visible in the quantity. With
+    `copy=False`, the buffer is shared with the array also for writing.
     """
 
-    def __init__(self, value, unit: Unit | str, copy: bool = True):
+    def __init__(
+            self,
+            value,
+            unit: Unit | str,
+            copy: bool | None = True,
+            dtype: np.dtype | type | None = None
+        ):
+        pass
+
+
+    def dtype(self) -> np.dtype:
         pass
 
 
@@ -41,6 +57,21 @@ class Quantity:
         pass
 
 
+    def __dlpack__(
+            self,
+            *,
+            stream: Any = None,
+            max_version: tuple[int, int] | None = None,
+            dl_device: tuple[int, int] | None = None,
+            copy: bool | None = None
+        ) -> Any:
+        pass
+
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        pass
+
+
     def __mul__(
             self,
             other: Quantity | Unit | NDArray[np.double] | float
@@ -77,6 +108,28 @@ class Quantity:
         pass
 
 
+    def __iadd__(self, other: Quantity) -> Quantity:
+        pass
+
+
+    def __isub__(self, other: Quantity) -> Quantity:
+        pass
+
+
+    def __imul__(
+            self,
+            other: Quantity | Unit | NDArray[np.double] | float | int
+        ) -> Quantity:
+        pass
+
+
+    def __itruediv__(
+            self,
+            other: Quantity | Unit | NDArray[np.double] | float | int
+        ) -> Quantity:
+        pass
+
+
     def __pow__(self, exponent: int) -> Quantity:
         pass
 
@@ -89,8 +142,40 @@ class Quantity:
         pass
 
 
-    def __eq__(self, other: Any) -> bool:
-       pass
+    def __eq__(self, other: Any) -> bool | NDArray[np.bool_]:
+        pass
+
+
+    def __ne__(self, other: Any) -> bool | NDArray[np.bool_]:
+        pass
+
+
+    def __lt__(
+            self,
+            other: Quantity | NDArray[np.double] | float
+        ) -> bool | NDArray[np.bool_]:
+        pass
+
+
+    def __le__(
+            self,
+            other: Quantity | NDArray[np.double] | float
+        ) -> bool | NDArray[np.bool_]:
+        pass
+
+
+    def __gt__(
+            self,
+            other: Quantity | NDArray[np.double] | float
+        ) -> bool | NDArray[np.bool_]:
+        pass
+
+
+    def __ge__(
+            self,
+            other: Quantity | NDArray[np.double] | float
+        ) -> bool | NDArray[np.bool_]:
+        pass
 
 
     def __getitem__(
@@ -108,4 +193,167 @@ class Quantity:
 
 
     def unit(self) -> Unit:
-        pass
\ No newline at end of file
+        pass
+
+
+    def to(
+            self,
+            unit: Unit | str,
+            out: Quantity | None = None,
+            inplace: bool = False
+        ) -> Quantity:
+        pass
+
+
+    def value_in(self, unit: Unit | str) -> float | NDArray[np.double]:
+        pass
+
+
+    def sum(self, axis: int | tuple[int,...] | None = None) -> Quantity:
+        pass
+
+
+    def mean(self, axis: int | tuple[int,...] | None = None) -> Quantity:
+        pass
+
+
+    def min(self, axis: int | tuple[int,...] | None = None) -> Quantity:
+        pass
+
+
+    def max(self, axis: int | tuple[int,...] | None = None) -> Quantity:
+        pass
+
+
+    def argmin(self, axis: int | None = None) -> int | NDArray[np.intp]:
+        pass
+
+
+    def argmax(self, axis: int | None = None) -> int | NDArray[np.intp]:
+        pass
+
+
+    def cumsum(self, axis: int | None = None) -> Quantity:
+        pass
+
+
+    def sort(self, axis: int | None = -1) -> Quantity:
+        pass
+
+
+    def argsort(self, axis: int | None = -1) -> NDArray[np.intp]:
+        pass
+
+
+    def searchsorted(
+            self,
+            v: Quantity,
+            side: Literal['left','right'] = 'left'
+        ) -> int | NDArray[np.intp]:
+        pass
+
+
+    def clip(
+            self,
+            min: Quantity | None = None,
+            max: Quantity | None = None
+        ) -> Quantity:
+        pass
+
+
+    def dot(
+            self,
+            other: Quantity | Unit | NDArray[np.double] | float
+        ) -> Quantity:
+        pass
+
+
+    def norm(self, axis: int | tuple[int,...] | None = None) -> Quantity:
+        pass
+
+
+    def __reduce__(self) -> tuple:
+        pass
+
+
+    def __array__(
+            self,
+            dtype: np.dtype | None = None,
+            copy: bool | None = None
+        ) -> NDArray[np.double]:
+        pass
+
+
+    def __array_ufunc__(
+            self,
+            ufunc: np.ufunc,
+            method: str,
+            *inputs: Any,
+            **kwargs: Any
+        ) -> Any:
+        pass
+
+
+    def __array_function__(
+            self,
+            func: Callable,
+            types: tuple[type,...],
+            args: tuple,
+            kwargs: dict[str,Any]
+        ) -> Any:
+        pass
+
+
+def add(a: Quantity, b: Quantity, out: Quantity | None = None) -> Quantity:
+    pass
+
+
+def subtract(a: Quantity, b: Quantity, out: Quantity | None = None) -> Quantity:
+    pass
+
+
+def multiply(
+        a: Quantity | Unit | NDArray[np.double] | float | int,
+        b: Quantity | Unit | NDArray[np.double] | float | int,
+        out: Quantity | None = None
+    ) -> Quantity:
+    pass
+
+
+def divide(
+        a: Quantity | Unit | NDArray[np.double] | float | int,
+        b: Quantity | Unit | NDArray[np.double] | float | int,
+        out: Quantity | None = None
+    ) -> Quantity:
+    pass
+
+
+def parse_quantities(
+        strings: Sequence[str] | NDArray[np.str_] | NDArray[np.bytes_],
+        unit: Unit | str | None = None
+    ) -> Quantity:
+    pass
+
+
+def from_dlpack(
+        x: Any,
+        unit: Unit | str,
+        copy: bool | None = None
+    ) -> Quantity:
+    pass
+
+
+def set_num_threads(num_threads: int) -> None:
+    pass
+
+
+def get_num_threads() -> int:
+    pass
+
+
+def set_parallel_threshold(threshold: int) -> None:
+    pass
+
+
+def get_parallel_threshold() -> int:
+    pass
@@ -20,63 +20,79 @@
 
 import numpy as np
 from cython.cimports.cpython.ref cimport PyObject, PyTypeObject
-from cpython.object cimport PyObject_TypeCheck
+from cpython.object cimport PyObject_TypeCheck, PyObject_RichCompare, \
+    Py_LT, Py_LE, Py_EQ, Py_NE, Py_GT, Py_GE
 from numpy cimport ndarray, float64_t, PyArrayObject, npy_intp,\
-    NPY_DOUBLE
+    NPY_DOUBLE, NPY_FLOAT, NPY_ARRAY_OWNDATA, NPY_ARRAY_WRITEABLE,\
+    NPY_ARRAY_ALIGNED, NPY_ARRAY_C_CONTIGUOUS
 from .errors import UnitError
 from .unit cimport CppUnit, Unit, parse_unit, generate_from_cpp, format_unit
 from .quantity cimport Quantity
-from libc.math cimport log10
-from libc.stdint cimport int16_t
+from libc.math cimport log10, pow, sqrt
+from cython.parallel cimport prange
+cimport cython
+from cython cimport floating
+from libc.stdint cimport int16_t, uint32_t
 from libcpp cimport bool
+from libcpp.vector cimport vector
+from libcpp.string cimport string
+from libc.string cimport memchr, memcmp, memcpy
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize, PyUnicode_DecodeUTF8
 
 cdef extern from *:
     """
     #include <cstdlib>
     #include <numpy/ndarraytypes.h>
 
-    bool is_single_stride(
+    bool has_item_strides(
         npy_intp* stride,
-        npy_intp* shape,
         int ndim,
         npy_intp itemsize
     )
     {
-        npy_intp expected_stride = itemsize;
         for (int i=0; i<ndim; ++i){
-            int j = ndim - i - 1;
-            auto x = std::div(stride[j], expected_stride);
-            if ((x.quot != 1) || (x.rem != 0)){
+            if (stride[i] % itemsize != 0)
                 return false;
-            }
-
-            /* New expected stride: */
-            expected_stride *= shape[j];
         }
-
         return true;
     }
 
     size_t ptr2int(const char* ptr){
         return (size_t)ptr;
     }
+
+    #ifdef _OPENMP
+    #include <omp.h>
+    #endif
+
+    int _default_num_threads(){
+        #ifdef _OPENMP
+        return omp_get_max_threads();
+        #else
+        return 1;
+        #endif
+    }
     """
-    npy_intp* PyArray_SHAPE(PyArrayObject*)
-    npy_intp* PyArray_STRIDES(PyArrayObject*)
+    npy_intp* PyArray_SHAPE(PyArrayObject*) nogil
+    npy_intp* PyArray_STRIDES(PyArrayObject*) nogil
     void* PyArray_DATA(PyArrayObject*)
-    int PyArray_NDIM(PyArrayObject*)
+    int PyArray_NDIM(PyArrayObject*) nogil
+    int PyArray_TYPE(PyArrayObject*)
     npy_intp PyArray_ITEMSIZE(PyArrayObject*)
     npy_intp PyArray_SIZE(PyArrayObject*)
     PyTypeObject PyArray_Type
     cppclass PyArray_Descr
     int PyArray_CastScalarToCtype(PyObject*, void*, PyArray_Descr*)
     PyArray_Descr* PyArray_DescrFromType(int typenum)
+    PyObject* PyArray_BASE(PyArrayObject*)
+    bool PyArray_CHKFLAGS(PyArrayObject*, int flags)
+    Py_ssize_t Py_REFCNT(PyObject*)
 
 
     size_t ptr2int(const char* ptr)
-    bool is_single_stride(
+    int _default_num_threads()
+    bool has_item_strides(
         npy_intp* stride,
-        npy_intp* shape,
         int ndim,
         npy_intp itemsize
     )
@@ -95,76 +111,1183 @@ dummy_double[0] = 1.938928939273982423e-78
 cdef PyArray_Descr* _DOUBLE_ARRAY_TYPE = PyArray_DescrFromType(NPY_DOUBLE)
 
 
+#
+# Parallel execution of the elementwise kernels.
+#
+cdef size_t _parallel_threshold = 1 << 17
+cdef int _num_threads = _default_num_threads()
+
+
+def set_num_threads(int num_threads):
+    """
+    Sets the number of threads used for elementwise arithmetic on large
+    arrays.
+
+    Parameters
+    ----------
+    num_threads : int
+        The number of threads. Must be positive. The default is the
+        OpenMP default, which can be controlled by the `OMP_NUM_THREADS`
+        environment variable.
+
+    Notes
+    -----
+    If the module has been compiled without OpenMP support, all arithmetic
+    is performed in the calling thread irrespective of this setting.
+    """
+    global _num_threads
+    if num_threads <= 0:
+        raise ValueError("The number of threads has to be positive.")
+    _num_threads = num_threads
+
+
+def get_num_threads() -> int:
+    """
+    Returns the number of threads used for elementwise arithmetic on
+    large arrays.
+    """
+    return _num_threads
+
+
+def set_parallel_threshold(size_t threshold):
+    """
+    Sets the array size from which on elementwise arithmetic is split
+    across threads. Smaller arrays are processed in the calling thread.
+
+    Parameters
+    ----------
+    threshold : int
+        The minimum number of array elements for parallel execution.
+        Default: 131072.
+    """
+    global _parallel_threshold
+    _parallel_threshold = threshold
+
+
+def get_parallel_threshold() -> int:
+    """
+    Returns the array size from which on elementwise arithmetic is split
+    across threads.
+    """
+    return _parallel_threshold
+
+
+cdef struct _KernelArgs:
+    void* out
+    const void* a
+    const void* b
+    double s0
+    double s1
+    double c
+    int exponent
+    # Whether the buffers are float32 instead of double:
+    bool single
+
+
+ctypedef void (*_chunk_kernel_t)(const _KernelArgs*, size_t,
+                                 size_t) noexcept nogil
+
+
+cdef void _run_kernel(_chunk_kernel_t kernel, const _KernelArgs* args,
+                      size_t N) noexcept nogil:
+    """
+    Evaluates a kernel on the index range [0,N). Large ranges are split
+    into one contiguous chunk per thread.
+    """
+    cdef int nthreads = _num_threads
+    if nthreads <= 1 or N < _parallel_threshold:
+        kernel(args, 0, N)
+        return
+    cdef size_t chunk = (N + nthreads - 1) // nthreads
+    cdef Py_ssize_t k
+    for k in prange(nthreads, num_threads=nthreads, schedule='static'):
+        kernel(args, k * chunk, min((k + 1) * chunk, N))
+
+
+#
+# Elementwise loops over index ranges of contiguous float32 or double
+# buffers. The output buffer may coincide with an input buffer.
+#
+cdef inline void _loop_fill(floating* out, double c, size_t i0,
+                            size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = c
+
+
+cdef inline void _loop_scale(floating* out, double s, const floating* a,
+                             size_t i0, size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s * a[i]
+
+
+cdef inline void _loop_axpb(floating* out, double s, const floating* a,
+                            double c, size_t i0, size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s * a[i] + c
+
+
+cdef inline void _loop_axpby(floating* out, double s0, const floating* a,
+                             double s1, const floating* b, size_t i0,
+                             size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s0 * a[i] + s1 * b[i]
+
+
+cdef inline void _loop_mul(floating* out, double s, const floating* a,
+                           const floating* b, size_t i0,
+                           size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s * a[i] * b[i]
+
+
+@cython.cdivision(True)
+cdef inline void _loop_div(floating* out, double s, const floating* a,
+                           const floating* b, size_t i0,
+                           size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s * a[i] / b[i]
+
+
+@cython.cdivision(True)
+cdef inline void _loop_div_scalar(floating* out, double s, const floating* a,
+                                  double c, size_t i0,
+                                  size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = s * a[i] / c
+
+
+@cython.cdivision(True)
+cdef inline void _loop_rdiv(floating* out, double c, const floating* b,
+                            size_t i0, size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = c / b[i]
+
+
+cdef inline void _loop_pow(floating* out, const floating* a, double e,
+                           size_t i0, size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = pow(a[i], e)
+
+
+#
+# The kernels on chunks, dispatching to the loops of the buffer type.
+#
+cdef void _chunk_fill(const _KernelArgs* args, size_t i0,
+                      size_t i1) noexcept nogil:
+    if args.single:
+        _loop_fill(<float*>args.out, args.c, i0, i1)
+    else:
+        _loop_fill(<double*>args.out, args.c, i0, i1)
+
+
+cdef void _chunk_scale(const _KernelArgs* args, size_t i0,
+                       size_t i1) noexcept nogil:
+    if args.single:
+        _loop_scale(<float*>args.out, args.s0, <const float*>args.a, i0, i1)
+    else:
+        _loop_scale(<double*>args.out, args.s0, <const double*>args.a, i0, i1)
+
+
+cdef void _chunk_axpb(const _KernelArgs* args, size_t i0,
+                      size_t i1) noexcept nogil:
+    if args.single:
+        _loop_axpb(<float*>args.out, args.s0, <const float*>args.a, args.c,
+                   i0, i1)
+    else:
+        _loop_axpb(<double*>args.out, args.s0, <const double*>args.a, args.c,
+                   i0, i1)
+
+
+cdef void _chunk_axpby(const _KernelArgs* args, size_t i0,
+                       size_t i1) noexcept nogil:
+    if args.single:
+        _loop_axpby(<float*>args.out, args.s0, <const float*>args.a, args.s1,
+                    <const float*>args.b, i0, i1)
+    else:
+        _loop_axpby(<double*>args.out, args.s0, <const double*>args.a,
+                    args.s1, <const double*>args.b, i0, i1)
+
+
+cdef void _chunk_mul(const _KernelArgs* args, size_t i0,
+                     size_t i1) noexcept nogil:
+    if args.single:
+        _loop_mul(<float*>args.out, args.s0, <const float*>args.a,
+                  <const float*>args.b, i0, i1)
+    else:
+        _loop_mul(<double*>args.out, args.s0, <const double*>args.a,
+                  <const double*>args.b, i0, i1)
+
+
+cdef void _chunk_div(const _KernelArgs* args, size_t i0,
+                     size_t i1) noexcept nogil:
+    if args.single:
+        _loop_div(<float*>args.out, args.s0, <const float*>args.a,
+                  <const float*>args.b, i0, i1)
+    else:
+        _loop_div(<double*>args.out, args.s0, <const double*>args.a,
+                  <const double*>args.b, i0, i1)
+
+
+cdef void _chunk_div_scalar(const _KernelArgs* args, size_t i0,
+                            size_t i1) noexcept nogil:
+    if args.single:
+        _loop_div_scalar(<float*>args.out, args.s0, <const float*>args.a,
+                         args.c, i0, i1)
+    else:
+        _loop_div_scalar(<double*>args.out, args.s0, <const double*>args.a,
+                         args.c, i0, i1)
+
+
+cdef void _chunk_rdiv(const _KernelArgs* args, size_t i0,
+                      size_t i1) noexcept nogil:
+    if args.single:
+        _loop_rdiv(<float*>args.out, args.c, <const float*>args.b, i0, i1)
+    else:
+        _loop_rdiv(<double*>args.out, args.c, <const double*>args.b, i0, i1)
+
+
+cdef void _chunk_pow(const _KernelArgs* args, size_t i0,
+                     size_t i1) noexcept nogil:
+    if args.single:
+        _loop_pow(<float*>args.out, <const float*>args.a, args.exponent,
+                  i0, i1)
+    else:
+        _loop_pow(<double*>args.out, <const double*>args.a, args.exponent,
+                  i0, i1)
+
+
+#
+# Elementwise kernels on contiguous buffers. All buffers are float32 if
+# 'single' is true, and double otherwise.
+#
+cdef void _kernel_fill(void* out, double c, size_t N,
+                       bool single) noexcept nogil:
+    """
+    out = c
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.c = c
+    args.single = single
+    _run_kernel(_chunk_fill, &args, N)
+
+
+cdef void _kernel_scale(void* out, double s, const void* a, size_t N,
+                        bool single) noexcept nogil:
+    """
+    out = s * a
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.s0 = s
+    args.single = single
+    _run_kernel(_chunk_scale, &args, N)
+
+
+cdef void _kernel_axpb(void* out, double s, const void* a, double c,
+                       size_t N, bool single) noexcept nogil:
+    """
+    out = s * a + c
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.s0 = s
+    args.c = c
+    args.single = single
+    _run_kernel(_chunk_axpb, &args, N)
+
+
+cdef void _kernel_axpby(void* out, double s0, const void* a, double s1,
+                        const void* b, size_t N, bool single) noexcept nogil:
+    """
+    out = s0 * a + s1 * b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.b = b
+    args.s0 = s0
+    args.s1 = s1
+    args.single = single
+    _run_kernel(_chunk_axpby, &args, N)
+
+
+cdef void _kernel_mul(void* out, double s, const void* a, const void* b,
+                      size_t N, bool single) noexcept nogil:
+    """
+    out = s * a * b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.b = b
+    args.s0 = s
+    args.single = single
+    _run_kernel(_chunk_mul, &args, N)
+
+
+cdef void _kernel_div(void* out, double s, const void* a, const void* b,
+                      size_t N, bool single) noexcept nogil:
+    """
+    out = s * a / b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.b = b
+    args.s0 = s
+    args.single = single
+    _run_kernel(_chunk_div, &args, N)
+
+
+cdef void _kernel_div_scalar(void* out, double s, const void* a, double b,
+                             size_t N, bool single) noexcept nogil:
+    """
+    out = s * a / b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.s0 = s
+    args.c = b
+    args.single = single
+    _run_kernel(_chunk_div_scalar, &args, N)
+
+
+cdef void _kernel_rdiv(void* out, double c, const void* b, size_t N,
+                       bool single) noexcept nogil:
+    """
+    out = c / b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.b = b
+    args.c = c
+    args.single = single
+    _run_kernel(_chunk_rdiv, &args, N)
+
+
+cdef void _kernel_pow(void* out, const void* a, int exponent, size_t N,
+                      bool single) noexcept nogil:
+    """
+    out = a ** exponent
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.exponent = exponent
+    args.single = single
+    _run_kernel(_chunk_pow, &args, N)
+
+
+#
+# Comparisons of contiguous float32 or double buffers, written to boolean
+# buffers. The operator is one of the rich comparison codes Py_LT to Py_GE,
+# and the scale between the units of the operands is applied within the
+# comparison.
+#
+cdef inline bool _compare(double x, double y, int op) noexcept nogil:
+    if op == Py_LT:
+        return x < y
+    elif op == Py_LE:
+        return x <= y
+    elif op == Py_EQ:
+        return x == y
+    elif op == Py_NE:
+        return x != y
+    elif op == Py_GT:
+        return x > y
+    return x >= y
+
+
+cdef inline int _swapped_comparison(int op) noexcept nogil:
+    """
+    The operator that compares the swapped operands.
+    """
+    if op == Py_LT or op == Py_LE:
+        return op + 4
+    elif op == Py_GT or op == Py_GE:
+        return op - 4
+    return op
+
+
+cdef inline void _compare_range(bool* out, int op, const floating* a,
+                                double s, const floating* b, size_t i0,
+                                size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = _compare(a[i], s * b[i], op)
+
+
+cdef inline void _compare_scalar_range(bool* out, int op, double s,
+                                       const floating* a, double c, size_t i0,
+                                       size_t i1) noexcept nogil:
+    cdef size_t i
+    for i in range(i0, i1):
+        out[i] = _compare(s * a[i], c, op)
+
+
+#
+# Dispatch to the inlined ranges with constant operators, so that the
+# compiler generates a vectorized loop for each operator.
+#
+cdef inline void _loop_compare(bool* out, int op, const floating* a, double s,
+                               const floating* b, size_t i0,
+                               size_t i1) noexcept nogil:
+    if op == Py_LT:
+        _compare_range(out, Py_LT, a, s, b, i0, i1)
+    elif op == Py_LE:
+        _compare_range(out, Py_LE, a, s, b, i0, i1)
+    elif op == Py_EQ:
+        _compare_range(out, Py_EQ, a, s, b, i0, i1)
+    elif op == Py_NE:
+        _compare_range(out, Py_NE, a, s, b, i0, i1)
+    elif op == Py_GT:
+        _compare_range(out, Py_GT, a, s, b, i0, i1)
+    else:
+        _compare_range(out, Py_GE, a, s, b, i0, i1)
+
+
+cdef inline void _loop_compare_scalar(bool* out, int op, double s,
+                                      const floating* a, double c, size_t i0,
+                                      size_t i1) noexcept nogil:
+    if op == Py_LT:
+        _compare_scalar_range(out, Py_LT, s, a, c, i0, i1)
+    elif op == Py_LE:
+        _compare_scalar_range(out, Py_LE, s, a, c, i0, i1)
+    elif op == Py_EQ:
+        _compare_scalar_range(out, Py_EQ, s, a, c, i0, i1)
+    elif op == Py_NE:
+        _compare_scalar_range(out, Py_NE, s, a, c, i0, i1)
+    elif op == Py_GT:
+        _compare_scalar_range(out, Py_GT, s, a, c, i0, i1)
+    else:
+        _compare_scalar_range(out, Py_GE, s, a, c, i0, i1)
+
+
+cdef void _chunk_compare(const _KernelArgs* args, size_t i0,
+                         size_t i1) noexcept nogil:
+    if args.single:
+        _loop_compare(<bool*>args.out, args.exponent, <const float*>args.a,
+                      args.s1, <const float*>args.b, i0, i1)
+    else:
+        _loop_compare(<bool*>args.out, args.exponent, <const double*>args.a,
+                      args.s1, <const double*>args.b, i0, i1)
+
+
+cdef void _chunk_compare_scalar(const _KernelArgs* args, size_t i0,
+                                size_t i1) noexcept nogil:
+    if args.single:
+        _loop_compare_scalar(<bool*>args.out, args.exponent, args.s0,
+                             <const float*>args.a, args.c, i0, i1)
+    else:
+        _loop_compare_scalar(<bool*>args.out, args.exponent, args.s0,
+                             <const double*>args.a, args.c, i0, i1)
+
+
+cdef void _kernel_compare(bool* out, int op, const void* a, double s,
+                          const void* b, size_t N, bool single) noexcept nogil:
+    """
+    out = a OP s * b
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.b = b
+    args.s1 = s
+    args.exponent = op
+    args.single = single
+    _run_kernel(_chunk_compare, &args, N)
+
+
+cdef void _kernel_compare_scalar(bool* out, int op, double s, const void* a,
+                                 double c, size_t N,
+                                 bool single) noexcept nogil:
+    """
+    out = s * a OP c
+    """
+    cdef _KernelArgs args
+    args.out = out
+    args.a = a
+    args.s0 = s
+    args.c = c
+    args.exponent = op
+    args.single = single
+    _run_kernel(_chunk_compare_scalar, &args, N)
+
+
+#
+# Reductions over contiguous float32 or double buffers. Large buffers are
+# split into one chunk per thread, and the partial results are combined
+# in chunk order.
+#
+cdef enum:
+    _MAX_CHUNKS = 256
+
+cdef struct _ReductionArgs:
+    const void* a
+    const void* b
+    bool single
+    # Whether argextremum searches for the maximum:
+    bool maximum
+    # Per-chunk results:
+    double* value
+    size_t* index
+
+
+ctypedef void (*_chunk_reduction_t)(const _ReductionArgs*, size_t, size_t,
+                                    size_t) noexcept nogil
+
+
+cdef size_t _run_reduction(_chunk_reduction_t kernel,
+                           const _ReductionArgs* args,
+                           size_t N) noexcept nogil:
+    """
+    Evaluates a reduction kernel on the index range [0,N). Chunk k writes
+    its result to args.value[k] or args.index[k]. Returns the number of
+    chunks.
+    """
+    cdef int nthreads = min(_num_threads, _MAX_CHUNKS)
+    if nthreads <= 1 or N < _parallel_threshold:
+        kernel(args, 0, 0, N)
+        return 1
+    cdef size_t chunk = (N + nthreads - 1) // nthreads
+    cdef size_t nchunks = (N + chunk - 1) // chunk
+    cdef Py_ssize_t k
+    for k in prange(nchunks, num_threads=nthreads, schedule='static'):
+        kernel(args, k, k * chunk, min((k + 1) * chunk, N))
+    return nchunks
+
+
+cdef double _pairwise_sum(const floating* a, size_t n) noexcept nogil:
+    """
+    Pairwise summation with eight accumulators in the leaves, as in
+    NumPy.
+    """
+    cdef double r0, r1, r2, r3, r4, r5, r6, r7
+    cdef size_t i, m
+    if n < 8:
+        r0 = 0.0
+        for i in range(n):
+            r0 += a[i]
+        return r0
+    elif n <= 128:
+        r0 = a[0]; r1 = a[1]; r2 = a[2]; r3 = a[3]
+        r4 = a[4]; r5 = a[5]; r6 = a[6]; r7 = a[7]
+        i = 8
+        while i + 8 <= n:
+            r0 += a[i]; r1 += a[i+1]; r2 += a[i+2]; r3 += a[i+3]
+            r4 += a[i+4]; r5 += a[i+5]; r6 += a[i+6]; r7 += a[i+7]
+            i += 8
+        r0 = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < n:
+            r0 += a[i]
+            i += 1
+        return r0
+    m = n // 2
+    m -= m % 8
+    return _pairwise_sum(a, m) + _pairwise_sum(a + m, n - m)
+
+
+cdef double _pairwise_dot(const floating* a, const floating* b,
+                          size_t n) noexcept nogil:
+    """
+    Pairwise summation of the products a[i] * b[i].
+    """
+    cdef double r0, r1, r2, r3
+    cdef size_t i, m
+    if n <= 128:
+        r0 = 0.0; r1 = 0.0; r2 = 0.0; r3 = 0.0
+        i = 0
+        while i + 4 <= n:
+            r0 += <double>a[i] * b[i]
+            r1 += <double>a[i+1] * b[i+1]
+            r2 += <double>a[i+2] * b[i+2]
+            r3 += <double>a[i+3] * b[i+3]
+            i += 4
+        r0 = (r0 + r1) + (r2 + r3)
+        while i < n:
+            r0 += <double>a[i] * b[i]
+            i += 1
+        return r0
+    m = n // 2
+    m -= m % 8
+    return _pairwise_dot(a, b, m) + _pairwise_dot(a + m, b + m, n - m)
+
+
+cdef size_t _loop_argextremum(const floating* a, bool maximum, size_t i0,
+                              size_t i1) noexcept nogil:
+    """
+    Index of the first minimum or maximum in [i0,i1), or of the first NaN.
+    """
+    cdef size_t i, j = i0
+    cdef floating best = a[i0]
+    if best != best:
+        return i0
+    for i in range(i0 + 1, i1):
+        if a[i] != a[i]:
+            return i
+        if (a[i] > best) if maximum else (a[i] < best):
+            best = a[i]
+            j = i
+    return j
+
+
+cdef void _chunk_sum(const _ReductionArgs* args, size_t k, size_t i0,
+                     size_t i1) noexcept nogil:
+    if args.single:
+        args.value[k] = _pairwise_sum((<const float*>args.a) + i0, i1 - i0)
+    else:
+        args.value[k] = _pairwise_sum((<const double*>args.a) + i0, i1 - i0)
+
+
+cdef void _chunk_dot(const _ReductionArgs* args, size_t k, size_t i0,
+                     size_t i1) noexcept nogil:
+    if args.single:
+        args.value[k] = _pairwise_dot((<const float*>args.a) + i0,
+                                      (<const float*>args.b) + i0, i1 - i0)
+    else:
+        args.value[k] = _pairwise_dot((<const double*>args.a) + i0,
+                                      (<const double*>args.b) + i0, i1 - i0)
+
+
+cdef void _chunk_argextremum(const _ReductionArgs* args, size_t k, size_t i0,
+                             size_t i1) noexcept nogil:
+    if args.single:
+        args.index[k] = _loop_argextremum(<const float*>args.a, args.maximum,
+                                          i0, i1)
+        args.value[k] = (<const float*>args.a)[args.index[k]]
+    else:
+        args.index[k] = _loop_argextremum(<const double*>args.a, args.maximum,
+                                          i0, i1)
+        args.value[k] = (<const double*>args.a)[args.index[k]]
+
+
+cdef double _kernel_dot(const void* a, const void* b, size_t N,
+                        bool single) noexcept nogil:
+    """
+    sum(a * b), or sum(a) if b is NULL.
+    """
+    cdef double[_MAX_CHUNKS] value
+    cdef _ReductionArgs args
+    args.a = a
+    args.b = b
+    args.single = single
+    args.value = value
+    cdef size_t nchunks = _run_reduction(
+        _chunk_sum if b == NULL else _chunk_dot, &args, N
+    )
+    cdef double res = 0.0
+    cdef size_t k
+    for k in range(nchunks):
+        res += value[k]
+    return res
+
+
+cdef size_t _kernel_argextremum(const void* a, bool maximum, size_t N,
+                                bool single) noexcept nogil:
+    """
+    Index of the first minimum or maximum of a, or of the first NaN.
+    N has to be positive.
+    """
+    cdef double[_MAX_CHUNKS] value
+    cdef size_t[_MAX_CHUNKS] index
+    cdef _ReductionArgs args
+    args.a = a
+    args.single = single
+    args.maximum = maximum
+    args.value = value
+    args.index = index
+    cdef size_t nchunks = _run_reduction(_chunk_argextremum, &args, N)
+    cdef size_t k, j = 0
+    for k in range(nchunks):
+        if value[k] != value[k]:
+            return index[k]
+        if (value[k] > value[j]) if maximum else (value[k] < value[j]):
+            j = k
+    return index[j]
+
+
+cdef object _storage_dtype(object dtype):
+    """
+    The dtype in which arrays of a given dtype are stored in a Quantity.
+    """
+    if dtype == np.float32:
+        return np.dtype(np.float32)
+    return np.dtype(np.double)
+
+
+cdef bool _same_shape(Quantity q0, Quantity q1):
+    """
+    Checks whether two array quantities have the same shape.
+    """
+    cdef PyArrayObject* a0 = <PyArrayObject*>q0._val_object
+    cdef PyArrayObject* a1 = <PyArrayObject*>q1._val_object
+    cdef int ndim = PyArray_NDIM(a0)
+    if PyArray_NDIM(a1) != ndim:
+        return False
+    cdef npy_intp* shape0 = PyArray_SHAPE(a0)
+    cdef npy_intp* shape1 = PyArray_SHAPE(a1)
+    cdef int i
+    for i in range(ndim):
+        if shape0[i] != shape1[i]:
+            return False
+    return True
+
+
+cdef bool _native_operands(Quantity q0, Quantity q1):
+    """
+    Checks whether the elementwise kernels can evaluate a binary operation
+    between q0 and q1, that is, whether array operands are contiguous and
+    have the same shape and dtype.
+    """
+    if not q0._is_scalar and not q0._is_contiguous:
+        return False
+    if not q1._is_scalar and not q1._is_contiguous:
+        return False
+    if q0._is_scalar or q1._is_scalar:
+        return True
+    return q0._is_float32 == q1._is_float32 and _same_shape(q0, q1)
+
+
+cdef object _values(Quantity q):
+    """
+    The numeric value of a quantity for evaluation by NumPy.
+    """
+    if q._is_scalar:
+        return q._val
+    return q._val_object
+
+
+cdef bool _overlaps_partially(Quantity out, Quantity q):
+    """
+    Checks whether the buffers of two contiguous array quantities of
+    equal size and dtype overlap without being identical. For contiguous
+    buffers, overlapping address ranges imply shared elements.
+    """
+    cdef size_t nbytes = out._val_array_N * (4 if out._is_float32 else 8)
+    cdef const char* p0 = <const char*>out._val_array_ptr
+    cdef const char* p1 = <const char*>q._val_array_ptr
+    if p0 == p1 or nbytes == 0:
+        return False
+    return p0 < p1 + nbytes and p1 < p0 + nbytes
+
+
+cdef bool _writes_elementwise(Quantity out, Quantity q0, Quantity q1):
+    """
+    Checks whether the result of a binary operation between q0 and q1
+    can be written elementwise to the buffer of the array quantity 'out'.
+    Operands may be the buffer of 'out' itself, but must not overlap it
+    partially.
+    """
+    if not out._is_contiguous:
+        return False
+    if not q0._is_scalar and (q0._is_float32 != out._is_float32
+                              or not q0._is_contiguous
+                              or not _same_shape(out, q0)
+                              or _overlaps_partially(out, q0)):
+        return False
+    if not q1._is_scalar and (q1._is_float32 != out._is_float32
+                              or not q1._is_contiguous
+                              or not _same_shape(out, q1)
+                              or _overlaps_partially(out, q1)):
+        return False
+    return True
+
+
+cdef void _scaled_add_into(Quantity out, double s0, Quantity q0, double s1,
+                           Quantity q1):
+    """
+    Writes s0 * q0 + s1 * q1 into the buffer of 'out'. Array operands
+    need to have the shape and dtype of 'out'.
+    """
+    if out._is_scalar:
+        out._val = s0 * q0._val + s1 * q1._val
+        return
+    cdef bool single = out._is_float32
+    with nogil:
+        if q0._is_scalar and q1._is_scalar:
+            _kernel_fill(out._val_array_ptr, s0 * q0._val + s1 * q1._val,
+                         out._val_array_N, single)
+        elif q0._is_scalar:
+            _kernel_axpb(out._val_array_ptr, s1, q1._val_array_ptr,
+                         s0 * q0._val, out._val_array_N, single)
+        elif q1._is_scalar:
+            _kernel_axpb(out._val_array_ptr, s0, q0._val_array_ptr,
+                         s1 * q1._val, out._val_array_N, single)
+        else:
+            _kernel_axpby(out._val_array_ptr, s0, q0._val_array_ptr, s1,
+                          q1._val_array_ptr, out._val_array_N, single)
+
+
+cdef void _multiply_into(Quantity out, double s, Quantity q0, Quantity q1):
+    """
+    Writes s * q0 * q1 into the buffer of 'out'. Array operands
+    need to have the shape and dtype of 'out'.
+    """
+    if out._is_scalar:
+        out._val = s * q0._val * q1._val
+        return
+    cdef bool single = out._is_float32
+    with nogil:
+        if q0._is_scalar and q1._is_scalar:
+            _kernel_fill(out._val_array_ptr, s * q0._val * q1._val,
+                         out._val_array_N, single)
+        elif q0._is_scalar:
+            _kernel_scale(out._val_array_ptr, s * q0._val, q1._val_array_ptr,
+                          out._val_array_N, single)
+        elif q1._is_scalar:
+            _kernel_scale(out._val_array_ptr, s * q1._val, q0._val_array_ptr,
+                          out._val_array_N, single)
+        else:
+            _kernel_mul(out._val_array_ptr, s, q0._val_array_ptr,
+                        q1._val_array_ptr, out._val_array_N, single)
+
+
+cdef void _divide_into(Quantity out, double s, Quantity q0, Quantity q1):
+    """
+    Writes s * q0 / q1 into the buffer of 'out'. Array operands
+    need to have the shape and dtype of 'out'.
+    """
+    if out._is_scalar:
+        out._val = s * q0._val / q1._val
+        return
+    cdef bool single = out._is_float32
+    with nogil:
+        if q0._is_scalar and q1._is_scalar:
+            _kernel_fill(out._val_array_ptr, s * q0._val / q1._val,
+                         out._val_array_N, single)
+        elif q0._is_scalar:
+            _kernel_rdiv(out._val_array_ptr, s * q0._val, q1._val_array_ptr,
+                         out._val_array_N, single)
+        elif q1._is_scalar:
+            _kernel_div_scalar(out._val_array_ptr, s, q0._val_array_ptr,
+                               q1._val, out._val_array_N, single)
+        else:
+            _kernel_div(out._val_array_ptr, s, q0._val_array_ptr,
+                        q1._val_array_ptr, out._val_array_N, single)
+
+
+cdef Quantity _as_quantity(object other):
+    """
+    Wraps floats, integers, units, and NumPy arrays into a Quantity.
+    Returns None for other types.
+    """
+    cdef Quantity other_quantity
+    cdef Unit a_unit
+    if isinstance(other, Quantity):
+        return other
+
+    elif isinstance(other, np.ndarray):
+        other_quantity = Quantity.__new__(Quantity)
+        if other.size == 1:
+            other_quantity._cyinit(True, other.flat[0], None, CppUnit())
+        else:
+            other_quantity._cyinit(False, dummy_double[0], other, CppUnit())
+        return other_quantity
+
+    elif isinstance(other, float) or isinstance(other, int):
+        other_quantity = Quantity.__new__(Quantity)
+        other_quantity._cyinit(True, other, None, CppUnit())
+        return other_quantity
+
+    elif isinstance(other, Unit):
+        a_unit = other
+        other_quantity = Quantity.__new__(Quantity)
+        other_quantity._cyinit(True, 1.0, None, a_unit._unit)
+        return other_quantity
+
+    return None
+
+
+cdef object _compare_quantities(Quantity q, object other, int op):
+    """
+    Elementwise comparison of a quantity with another quantity, or with
+    numbers, arrays, and numeric sequences if the quantity is
+    dimensionless. The scale between the units is folded into scalar
+    operands or applied within a single pass over the arrays, also if
+    they are strided or broadcast, so that no rescaled copy of an operand
+    is created.
+    """
+    cdef Quantity oq = _as_quantity(other)
+    cdef object values
+    if oq is None and q._unit.dimensionless() and not isinstance(other, str):
+        # Numeric sequences are compared elementwise with dimensionless
+        # quantities:
+        try:
+            values = np.asarray(other)
+        except (ValueError, TypeError):
+            values = None
+        if values is not None and values.dtype.kind in 'biuf':
+            oq = _as_quantity(values)
+    if oq is None or not q._unit.same_dimension(oq._unit):
+        # Quantities of different dimension are never equal:
+        if op == Py_EQ:
+            return False
+        elif op == Py_NE:
+            return True
+        elif oq is None:
+            return NotImplemented
+        raise UnitError("Cannot compare quantities of different dimension.")
+
+    cdef double s = (oq._unit / q._unit).total_scale()
+    if oq._is_scalar:
+        if q._is_scalar:
+            return _compare(q._val, s * oq._val, op)
+        # Fold the scale into the scalar:
+        return PyObject_RichCompare(q._val_object, np.float64(s * oq._val),
+                                    op)
+    if s == 1.0:
+        return PyObject_RichCompare(
+            np.float64(q._val) if q._is_scalar else q._val_object,
+            oq._val_object, op
+        )
+    if not _native_operands(q, oq):
+        # Broadcasting or strided operands are read through their strides:
+        return _compare_broadcast(
+            np.array(q._val) if q._is_scalar else q._val_object, op, s,
+            oq._val_object
+        )
+
+    # Apply the scale within a single pass:
+    cdef object out = np.empty(oq._val_object.shape, dtype=np.bool_)
+    cdef bool* res = <bool*>PyArray_DATA(<PyArrayObject*>out)
+    with nogil:
+        if q._is_scalar:
+            _kernel_compare_scalar(res, _swapped_comparison(op), s,
+                                   oq._val_array_ptr, q._val,
+                                   oq._val_array_N, oq._is_float32)
+        else:
+            _kernel_compare(res, op, q._val_array_ptr, s, oq._val_array_ptr,
+                            q._val_array_N, q._is_float32)
+    return out
+
+
+cdef object _bound_values(Quantity q, object bound):
+    """
+    The values of a quantity, number, or array expressed in the unit of
+    the quantity 'q'. Scalars are returned as floats. Array bounds of
+    another scale are rescaled into a temporary array of their size, which
+    is no larger than the result of the operation that uses them.
+    """
+    if bound is None:
+        return None
+    cdef Quantity b = _as_quantity(bound)
+    if b is None:
+        raise TypeError("Bounds have to be quantities, or numbers or arrays "
+                        "for dimensionless quantities.")
+    if not q._unit.same_dimension(b._unit):
+        raise UnitError("The bounds have to be of the dimension of the "
+                        "quantity.")
+    cdef double s = (b._unit / q._unit).total_scale()
+    if b._is_scalar:
+        return s * b._val
+    if s == 1.0:
+        return b._val_object
+    return s * b._val_object
+
+
+cdef Quantity _scalar_quantity(double value, CppUnit unit):
+    """
+    Creates a scalar quantity. The members are set directly, bypassing
+    the checks of _cyinit.
+    """
+    cdef Quantity res = Quantity.__new__(Quantity)
+    res._is_scalar = True
+    res._val = value
+    res._unit = unit
+    res._initialized = True
+    return res
+
+
+cdef enum _ScalarOperand:
+    _NOT_SCALAR
+    _NUMBER
+    _WITH_UNIT
+
+
+cdef _ScalarOperand _scalar_operand(object other, double* value,
+                                    CppUnit* unit) except *:
+    """
+    Reads the value and unit of a scalar operand, that is, a float,
+    integer, unit, or scalar quantity, without wrapping it into a
+    Quantity. The unit is only set for _WITH_UNIT.
+    """
+    cdef Quantity q
+    if isinstance(other, float) or isinstance(other, int):
+        value[0] = other
+        return _NUMBER
+    elif isinstance(other, Quantity):
+        q = other
+        if not q._is_scalar:
+            return _NOT_SCALAR
+        value[0] = q._val
+        unit[0] = q._unit
+        return _WITH_UNIT
+    elif isinstance(other, Unit):
+        value[0] = 1.0
+        unit[0] = (<Unit>other)._unit
+        return _WITH_UNIT
+    return _NOT_SCALAR
+
+
+cdef enum _ScalarOperation:
+    _SCALAR_MULTIPLY
+    _SCALAR_DIVIDE
+    _SCALAR_RDIVIDE
+
+
+cdef Quantity _scalar_arithmetic(Quantity q, object other,
+                                 _ScalarOperation op):
+    """
+    Multiplies or divides a scalar quantity with a scalar operand.
+    Returns None if 'other' is not scalar.
+    """
+    cdef double value
+    cdef CppUnit unit
+    cdef _ScalarOperand kind = _scalar_operand(other, &value, &unit)
+    if kind == _NOT_SCALAR:
+        return None
+    if op == _SCALAR_MULTIPLY:
+        if kind == _NUMBER:
+            return _scalar_quantity(q._val * value, q._unit)
+        return _scalar_quantity(q._val * value, q._unit * unit)
+    elif op == _SCALAR_DIVIDE:
+        if kind == _NUMBER:
+            return _scalar_quantity(q._val / value, q._unit)
+        return _scalar_quantity(q._val / value, q._unit / unit)
+    if kind == _NUMBER:
+        return _scalar_quantity(value / q._val, q._unit.invert())
+    return _scalar_quantity(value / q._val, unit / q._unit)
+
+
+cdef Quantity _from_values(object values, CppUnit unit):
+    """
+    Creates a quantity from the result of a NumPy function, which is
+    either an array or a NumPy scalar.
+    """
+    cdef Quantity res
+    if isinstance(values, np.ndarray) and PyArray_NDIM(
+            <PyArrayObject*>values) > 0:
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], values, unit)
+        return res
+    return _scalar_quantity(float(values), unit)
+
+
+cdef CppUnit _target_unit(object unit) except *:
+    """
+    The C++ unit of a Unit or unit string.
+    """
+    if isinstance(unit, Unit):
+        return (<Unit>unit)._unit
+    elif isinstance(unit, str):
+        return parse_unit(unit)
+    raise TypeError("'unit' has to be either a string or a Unit.")
+
+
+cdef Quantity _convert(Quantity q, CppUnit target, double scale):
+    """
+    Converts a quantity to the unit 'target', where 'scale' is the
+    total scale of q's unit relative to 'target'.
+    """
+    cdef Quantity res
+    if q._is_scalar:
+        return _scalar_quantity(scale * q._val, target)
+    if scale == 1.0:
+        # Shortcut: Do not copy.
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], q._val_object, target)
+        res._cow = q._cow
+        return res
+    if not q._is_contiguous:
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], q._val_object * scale, target)
+        return res
+    res = _empty_like(q, target)
+    with nogil:
+        _kernel_scale(res._val_array_ptr, scale, q._val_array_ptr,
+                      q._val_array_N, q._is_float32)
+    return res
+
+
+cdef Quantity _empty_like(Quantity q, CppUnit unit):
+    """
+    Creates an array quantity with an uninitialized buffer of the shape
+    of the array quantity 'q'.
+    """
+    cdef Quantity res = Quantity.__new__(Quantity)
+    res._cyinit(False, dummy_double[0],
+                np.empty_like(q._val_object, order='C'), unit)
+    return res
+
+
 cdef Quantity _multiply_quantities(Quantity q0, Quantity q1):
     """
     Multiply two quantities.
     """
-    cdef Quantity res = Quantity.__new__(Quantity)
+    cdef Quantity res
     cdef CppUnit unit = q0._unit * q1._unit
 
     if q0._is_scalar and q1._is_scalar:
-        res._cyinit(True, q0._val * q1._val, None, unit)
+        res = _scalar_quantity(q0._val * q1._val, unit)
 
-    elif q0._is_scalar:
-        if q0._val == 1.0:
-            # Shortcut: Do not copy.
-            res._cyinit(
-                False, dummy_double[0], q1._val_object, unit
-            )
-        else:
-            res._cyinit(
-                False, dummy_double[0], float(q0._val) * q1._val_object, unit
-            )
+    elif q0._is_scalar and q0._val == 1.0:
+        # Shortcut: Do not copy.
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], q1._val_object, unit)
 
-    elif q1._is_scalar:
-        if q1._val == 1.0:
-            # Shortcut: Do not copy.
-            res._cyinit(
-                False, dummy_double[0], q0._val_object, unit
-            )
-        else:
-            res._cyinit(
-                False, dummy_double[0], float(q1._val) * q0._val_object, unit
-            )
+    elif q1._is_scalar and q1._val == 1.0:
+        # Shortcut: Do not copy.
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], q0._val_object, unit)
+
+    elif _native_operands(q0, q1):
+        res = _empty_like(q1 if q0._is_scalar else q0, unit)
+        _multiply_into(res, 1.0, q0, q1)
 
     else:
-        res._cyinit(
-            False, dummy_double[0], q0._val_object * q1._val_object, unit
-        )
+        # Broadcasting is left to NumPy:
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], _values(q0) * _values(q1), unit)
 
     return res
 
 
 cdef Quantity _divide_quantities(Quantity q0, Quantity q1):
     """
-    Multiply two quantities.
+    Divide two quantities.
     """
-    cdef Quantity res = Quantity.__new__(Quantity)
+    cdef Quantity res
     cdef CppUnit unit = q0._unit / q1._unit
 
     if q0._is_scalar and q1._is_scalar:
-        res._cyinit(True, q0._val / q1._val, None, unit)
+        res = _scalar_quantity(q0._val / q1._val, unit)
 
-    elif q0._is_scalar:
-        res._cyinit(
-            False, dummy_double[0], float(q0._val) / q1._val_object, unit
-        )
+    elif q1._is_scalar and q1._val == 1.0:
+        # Shortcut: Do not copy.
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], q0._val_object, unit)
 
-    elif q1._is_scalar:
-        if q1._val == 1.0:
-            # Shortcut: Do not copy.
-            res._cyinit(
-                False, dummy_double[0], q0._val_object, unit
-            )
-        else:
-            res._cyinit(
-                False, dummy_double[0], q0._val_object / float(q1._val), unit
-            )
+    elif _native_operands(q0, q1):
+        res = _empty_like(q1 if q0._is_scalar else q0, unit)
+        _divide_into(res, 1.0, q0, q1)
 
     else:
-        res._cyinit(
-            False, dummy_double[0], q0._val_object / q1._val_object, unit
-        )
+        # Broadcasting is left to NumPy:
+        res = Quantity.__new__(Quantity)
+        res._cyinit(False, dummy_double[0], _values(q0) / _values(q1), unit)
 
     return res
 
@@ -174,80 +1297,34 @@ cdef Quantity _add_quantities_equal_scale(Quantity q0, double s0, Quantity q1,
     """
     Adds two quantities of equal scale.
     """
-    cdef Quantity res = Quantity.__new__(Quantity)
+    cdef Quantity res
     s0 *= (q0._unit / unit).total_scale()
     s1 *= (q1._unit / unit).total_scale()
 
     if q0._is_scalar and q1._is_scalar:
-        res._cyinit(True, s0 * q0._val + s1 * q1._val, None, unit)
+        res = _scalar_quantity(s0 * q0._val + s1 * q1._val, unit)
 
-    elif q0._is_scalar:
-        if s1 == 1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s0 * q0._val) + q1._val_object, unit
-            )
-        elif s1 == -1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s0 * q0._val) - q1._val_object, unit
-            )
-        else:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s0 * q0._val) + s1 * q1._val_object, unit
-            )
-
-    elif q1._is_scalar:
-        if s0 == 1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s1 * q1._val) + q0._val_object, unit
-            )
-        elif s0 == -1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s1 * q1._val) - q0._val_object, unit
-            )
-        else:
-            res._cyinit(
-                False, dummy_double[0],
-                float(s1 * q1._val) + s0 * q0._val_object, unit
-            )
+    elif _native_operands(q0, q1):
+        # Compute s0 * q0 + s1 * q1 in a single pass directly into the
+        # result buffer, avoiding the scaled temporaries.
+        res = _empty_like(q1 if q0._is_scalar else q0, unit)
+        _scaled_add_into(res, s0, q0, s1, q1)
 
     else:
+        # Broadcasting is left to NumPy:
+        res = Quantity.__new__(Quantity)
         if s0 == 1.0 and s1 == 1.0:
             res._cyinit(
-                False, dummy_double[0], q0._val_object + q1._val_object, unit
+                False, dummy_double[0], _values(q0) + _values(q1), unit
             )
         elif s0 == 1.0 and s1 == -1.0:
             res._cyinit(
-                False, dummy_double[0], q0._val_object - q1._val_object, unit
-            )
-        elif s0 == 1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                q0._val_object + s1 * q1._val_object, unit
-            )
-        elif s0 == -1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                s1 * q1._val_object - q0._val_object, unit
-            )
-        elif s1 == 1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                s0 * q0._val_object + q1._val_object, unit
-            )
-        elif s1 == -1.0:
-            res._cyinit(
-                False, dummy_double[0],
-                s0 * q0._val_object - q1._val_object, unit
+                False, dummy_double[0], _values(q0) - _values(q1), unit
             )
         else:
             res._cyinit(
                 False, dummy_double[0],
-                s0 * q0._val_object + s1 * q1._val_object, unit
+                s0 * _values(q0) + s1 * _values(q1), unit
             )
 
     return res
@@ -258,6 +1335,8 @@ cdef Quantity _add_quantities(Quantity q0, Quantity q1):
     Add two quantities.
     """
     if q0._unit == q1._unit:
+        if q0._is_scalar and q1._is_scalar:
+            return _scalar_quantity(q0._val + q1._val, q0._unit)
         return _add_quantities_equal_scale(q0, 1.0, q1, 1.0, q0._unit)
 
     # Otherwise need to decide which unit to add in:
@@ -281,6 +1360,8 @@ cdef Quantity _subtract_quantities(Quantity q0, Quantity q1):
     Add two quantities.
     """
     if q0._unit == q1._unit:
+        if q0._is_scalar and q1._is_scalar:
+            return _scalar_quantity(q0._val - q1._val, q0._unit)
         return _add_quantities_equal_scale(q0, 1.0, q1, -1.0, q0._unit)
 
     # Otherwise need to decide which unit to add in:
@@ -304,26 +1385,40 @@ cdef Quantity _power_quantity(Quantity q0, int b):
     Compute the power of a quantity.
     """
     cdef CppUnit unit = q0._unit.power(b)
-    cdef Quantity res = Quantity.__new__(Quantity)
+    cdef Quantity res
     if q0._is_scalar:
-        res._cyinit(True, q0._val ** b, None, unit)
+        res = _scalar_quantity(q0._val ** b, unit)
 
-    else:
+    elif not q0._is_contiguous:
+        res = Quantity.__new__(Quantity)
         res._cyinit(False, dummy_double[0], q0._val_object ** b, unit)
 
+    else:
+        res = _empty_like(q0, unit)
+        with nogil:
+            _kernel_pow(res._val_array_ptr, q0._val_array_ptr, b,
+                        q0._val_array_N, q0._is_float32)
+
     return res
 
 
+# Quantity does not take part in the cyclic garbage collection: its only
+# Python object member is the NumPy array of its values.
+@cython.freelist(64)
+@cython.no_gc
 cdef class Quantity:
     """
     A physical quantity: a single or array of real numbers with an associated
     physical unit.
-    """
-    __dict__: dict
 
-    __array_ufunc__ = None
+    By default (`copy=True`), array quantities copy the given array once.
+    With `copy=None`, they instead wrap a read-only view of the array,
+    which is copied once the quantity is written to (copy-on-write).
+    Until then, changes of the array are visible in the quantity. With
+    `copy=False`, the buffer is shared with the array also for writing.
+    """
 
-    def __init__(self, value, unit, bool copy=True):
+    def __init__(self, value, unit, copy=True, dtype=None):
         #
         # First determine the values (scalar / ndarray)
         # and setup all corresponding members for a call
@@ -331,6 +1426,7 @@ cdef class Quantity:
         #
         cdef double d_value
         cdef bool is_scalar
+        cdef bool cow = False
         cdef object val_object
         if isinstance(value, float) or isinstance(value, int):
             is_scalar = True
@@ -339,9 +1435,36 @@ cdef class Quantity:
         elif isinstance(value, np.ndarray):
             is_scalar = False
             d_value = dummy_double[0]
-            if copy:
-                val_object = value.copy()
+            # Storage type: float32 arrays are kept as they are unless
+            # promoted explicitly; all other types are converted to double.
+            if dtype is None:
+                dtype = _storage_dtype(value.dtype)
+            else:
+                dtype = np.dtype(dtype)
+                if dtype != np.float32 and dtype != np.float64:
+                    raise TypeError("'dtype' has to be float32 or float64.")
+            # Arrays that are private to this quantity, or views that
+            # must not write to the given array, are locked and copied
+            # on write once they are shared:
+            if copy is None:
+                # If the buffer can be used as is, wrap a read-only view
+                # of it. The buffer is copied only once this quantity is
+                # written to.
+                val_object = np.asarray(value, dtype=dtype)
+                if np.may_share_memory(val_object, value):
+                    val_object = val_object.view()
                 val_object.flags['WRITEABLE'] = False
+                cow = True
+            elif copy:
+                val_object = np.array(
+                    value, dtype=dtype, order='C', copy=True
+                )
+                val_object.flags['WRITEABLE'] = False
+                cow = True
+            elif value.dtype != dtype:
+                val_object = value.astype(dtype)
+                val_object.flags['WRITEABLE'] = False
+                cow = True
             else:
                 val_object = value
         else:
@@ -362,6 +1485,7 @@ cdef class Quantity:
             raise TypeError("'unit' has to be either a string or a Unit.")
 
         self._cyinit(is_scalar, d_value, val_object, cpp_unit)
+        self._cow = cow
 
 
     cdef _cyinit(self, bool is_scalar, double val, object val_object,
@@ -370,54 +1494,131 @@ cdef class Quantity:
             raise RuntimeError("Trying to initialize a second time.")
         self._is_scalar = is_scalar
         self._val = val
-        cdef double[::1] buffer
         cdef PyArrayObject* pao
-        cdef npy_intp* shape
-        cdef npy_intp* strides
-        cdef npy_intp itemsize
-        cdef int ndim
-        cdef PyObject* val_array_ptr
-        if isinstance(val_object, np.ndarray):
-            # Ensure that the array is of double type and ensure that the
-            # underlying buffer is non-strided.
+        if not is_scalar and PyObject_TypeCheck(val_object, &PyArray_Type):
+            # Ensure that the array is of float32 or double type.
             # This single Python call also ensures that non-ndarray types
-            # can be handled.
+            # can be handled. Strided arrays are kept as they are, so that
+            # slices remain views.
+            self._is_float32 = (
+                PyArray_TYPE(<PyArrayObject*>val_object) == NPY_FLOAT
+            )
             val_array = np.asarray(
-                val_object, dtype=np.double, order='C'
+                val_object, dtype=np.float32 if self._is_float32
+                                  else np.double
             )
-            val_array_ptr = <PyObject*>val_array
-
-            # Obtain a PyArrayObject pointer and get all the relevant info:
-            pao = <PyArrayObject*>val_array_ptr
-            ndim = PyArray_NDIM(pao)
-            shape = PyArray_SHAPE(pao)
-            strides = PyArray_STRIDES(pao)
-            itemsize = PyArray_ITEMSIZE(pao)
-
-            # Sanity: Assert that all is single stride:
-            if not is_single_stride(strides, shape, ndim, itemsize):
-                raise RuntimeError(
-                    "Could not get a non-strided version of the input "
-                    "array."
-                )
+            pao = <PyArrayObject*>val_array
+
+            # Only unaligned buffers or strides that are no multiple of
+            # the element size (e.g. fields of structured arrays) need to
+            # be copied:
+            if not PyArray_CHKFLAGS(pao, NPY_ARRAY_ALIGNED) or \
+                    not has_item_strides(PyArray_STRIDES(pao),
+                                         PyArray_NDIM(pao),
+                                         PyArray_ITEMSIZE(pao)):
+                val_array = np.ascontiguousarray(val_array)
+                pao = <PyArrayObject*>val_array
 
             # Now set the attributes.
             # We keep an explicit reference to the NDArray 'val_array' so as
             # to have automatic reference counting.
             self._val_object = val_array
-            self._val_array_ptr = <double*>PyArray_DATA(pao)
+            self._val_array_ptr = PyArray_DATA(pao)
             self._val_array_N = PyArray_SIZE(pao)
+            self._is_contiguous = PyArray_CHKFLAGS(pao, NPY_ARRAY_C_CONTIGUOUS)
         else:
             self._val_object = None
             self._val_array_ptr = NULL
             self._val_array_N = 0
         self._unit = unit
+        self._initialized = True
 
-        # Add, if dimensionless, the __array__ routine:
-        if unit.dimensionless():
-            self.__array__ = self._array
 
-        self._initialized = True
+    cdef _detach(self):
+        """
+        Replaces a copy-on-write buffer by a private copy.
+        """
+        cdef object val_array = np.array(self._val_object, copy=True,
+                                         order='C')
+        self._val_object = val_array
+        self._val_array_ptr = PyArray_DATA(<PyArrayObject*>val_array)
+        self._is_contiguous = True
+        self._cow = False
+
+
+    cdef bool _exclusive(self):
+        """
+        Checks whether this quantity is the sole owner of its array
+        buffer, that is, whether no other object can observe writes
+        to the buffer.
+        """
+        if self._is_scalar:
+            return False
+        cdef PyObject* ptr = <PyObject*>self._val_object
+        cdef PyArrayObject* pao = <PyArrayObject*>ptr
+        if Py_REFCNT(ptr) != 1:
+            return False
+        cdef PyObject* base = PyArray_BASE(pao)
+        if base == NULL:
+            return PyArray_CHKFLAGS(pao, NPY_ARRAY_OWNDATA)
+
+        # A copy-on-write view is exclusive if no other object references
+        # the array that it views:
+        if not self._cow or not PyObject_TypeCheck(<object>base, &PyArray_Type):
+            return False
+        return (
+            Py_REFCNT(base) == 1
+            and PyArray_BASE(<PyArrayObject*>base) == NULL
+            and PyArray_CHKFLAGS(<PyArrayObject*>base, NPY_ARRAY_OWNDATA)
+        )
+
+
+    cdef bool _writable(self):
+        """
+        Checks whether the array buffer of this quantity may be written
+        to as an explicit output target: either it is exclusively owned,
+        or the underlying NumPy array is writeable.
+        """
+        if self._is_scalar:
+            return True
+        if PyArray_CHKFLAGS(<PyArrayObject*>self._val_object,
+                            NPY_ARRAY_WRITEABLE):
+            return True
+        return self._exclusive()
+
+
+    cdef bool _inplace_compatible(self, Quantity other):
+        """
+        Checks whether an in-place operation with 'other' can be written
+        to the buffer of this quantity. Scalar quantities are never
+        modified in place.
+        """
+        if not self._exclusive() or not self._is_contiguous:
+            return False
+        return other._is_scalar or (other._is_float32 == self._is_float32
+                                    and other._is_contiguous
+                                    and _same_shape(self, other))
+
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        NumPy ufuncs. A set of unit-safe ufuncs, including arithmetic,
+        comparisons, minimum and maximum, absolute values, and square
+        roots, is evaluated on the raw values with the unit of the result
+        determined once per call. Dimensionless quantities can be passed
+        to all other ufuncs.
+        """
+        return _array_ufunc(ufunc, method, inputs, kwargs)
+
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        NumPy functions. The reductions np.sum, np.mean, np.min, np.max,
+        np.argmin, np.argmax, np.cumsum, and np.dot map to the methods of
+        this class. Dimensionless quantities can be passed to all other
+        functions.
+        """
+        return _array_function(func, args, kwargs)
 
 
     def __float__(self):
@@ -434,28 +1635,69 @@ cdef class Quantity:
         return float(self._val * self._unit.total_scale())
 
 
-    def _array(self, dtype=None, copy=None) -> np.ndarray:
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
         """
-        Returns, if dimensionally possible, a scalar array.
+        Returns, if dimensionally possible, the values as a NumPy array.
+        Follows the NumPy protocol for 'copy': with copy=False, a
+        ValueError is raised if the values cannot be returned without
+        copying. Arrays returned without copying are read-only.
         """
-        # TODO: More arguments of the __array__ routine protocol of numpy!
         if not self._unit.dimensionless():
             raise RuntimeError("Attempting to get array of a dimensional quantity.")
-        cdef object array
         cdef double scale = self._unit.total_scale()
         if self._is_scalar:
+            if copy is False:
+                raise ValueError("Cannot convert a scalar quantity to an "
+                                 "array without copying.")
             return np.full(1, self._val * scale, dtype=dtype)
 
         if scale != 1.0:
+            if copy is False:
+                raise ValueError("Cannot apply the unit scale without "
+                                 "copying.")
             if dtype is not None:
                 return (self._val_object * float(scale)).astype(dtype)
             return self._val_object * float(scale)
 
         if copy:
-            return self._val_object.copy()
-        if dtype is not None and dtype != self._val_object.dtype:
+            return np.array(self._val_object, dtype=dtype, copy=True)
+        if dtype is not None and np.dtype(dtype) != self._val_object.dtype:
+            if copy is False:
+                raise ValueError("Cannot convert the dtype without copying.")
             return self._val_object.astype(dtype)
-        return self._val_object.view()
+        # The view must not allow writing to the values of this quantity:
+        values = self._val_object.view()
+        values.flags['WRITEABLE'] = False
+        return values
+
+
+    def __dlpack__(self, *, stream=None, max_version=None, dl_device=None,
+                   copy=None):
+        """
+        Exports the values of a dimensionless quantity through the DLPack
+        protocol, without copying if the unit has no scale. As for
+        `__array__`, dimensional quantities cannot be exported; their
+        values in a unit are available as an array from `value_in`.
+        """
+        try:
+            values = self.__array__(copy=copy)
+        except ValueError as e:
+            raise BufferError(str(e)) from None
+        kwargs = {'stream' : stream}
+        if max_version is not None:
+            kwargs['max_version'] = max_version
+        if dl_device is not None:
+            kwargs['dl_device'] = dl_device
+        if copy is not None:
+            kwargs['copy'] = copy
+        return values.__dlpack__(**kwargs)
+
+
+    def __dlpack_device__(self):
+        """
+        The values reside in CPU memory.
+        """
+        return (1, 0)
 
 
     def __repr__(self) -> str:
@@ -474,36 +1716,29 @@ cdef class Quantity:
         return rep
 
 
+    def __reduce__(self):
+        """
+        Pickling support. The values of array quantities are pickled by
+        NumPy, which passes contiguous buffers out-of-band with pickle
+        protocol 5. The unpickled quantity wraps the buffer without a copy.
+        """
+        cdef Unit unit = generate_from_cpp(self._unit)
+        if self._is_scalar:
+            return (Quantity, (self._val, unit))
+        return (Quantity, (self._val_object, unit, False))
+
+
     def __mul__(self, other):
         """
         Multiply this quantity with another quantity or float.
         """
-        # Classifying the other object:
         cdef Quantity other_quantity
-        cdef Unit a_unit
-
-        #
-        # Initialize the quantity that we would like to multiply with:
-        #
-        if isinstance(other, np.ndarray):
-            other_quantity = Quantity.__new__(Quantity)
-            if other.size == 1:
-                other_quantity._cyinit(True, other.flat[0], None, CppUnit())
-            else:
-                other_quantity._cyinit(False, dummy_double[0], other, CppUnit())
-
-        elif isinstance(other, float) or isinstance(other, int):
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, other, None, CppUnit())
-
-        elif isinstance(other, Quantity):
-            other_quantity = other
-
-        elif isinstance(other, Unit):
-            a_unit = other
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, 1.0, None, a_unit._unit)
-        else:
+        if self._is_scalar:
+            other_quantity = _scalar_arithmetic(self, other, _SCALAR_MULTIPLY)
+            if other_quantity is not None:
+                return other_quantity
+        other_quantity = _as_quantity(other)
+        if other_quantity is None:
             return NotImplemented
 
         return _multiply_quantities(self, other_quantity)
@@ -514,32 +1749,13 @@ cdef class Quantity:
         Multiply this quantity with another quantity or float (from the
         right).
         """
-        # Classifying the other object:
         cdef Quantity other_quantity
-        cdef Unit a_unit
-
-        #
-        # Initialize the quantity that we would like to multiply with:
-        #
-        if isinstance(other, np.ndarray):
-            other_quantity = Quantity.__new__(Quantity)
-            if other.size == 1:
-                other_quantity._cyinit(True, other.flat[0], None, CppUnit())
-            else:
-                other_quantity._cyinit(False, dummy_double[0], other, CppUnit())
-
-        elif isinstance(other, float) or isinstance(other, int):
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, other, None, CppUnit())
-
-        elif isinstance(other, Quantity):
-            other_quantity = other
-
-        elif isinstance(other, Unit):
-            a_unit = other
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, 1.0, None, a_unit._unit)
-        else:
+        if self._is_scalar:
+            other_quantity = _scalar_arithmetic(self, other, _SCALAR_MULTIPLY)
+            if other_quantity is not None:
+                return other_quantity
+        other_quantity = _as_quantity(other)
+        if other_quantity is None:
             return NotImplemented
 
         return _multiply_quantities(other_quantity, self)
@@ -549,32 +1765,13 @@ cdef class Quantity:
         """
         Divide this quantity by another quantity or float.
         """
-        # Classifying the other object:
         cdef Quantity other_quantity
-        cdef Unit a_unit
-
-        #
-        # Initialize the quantity that we would like to multiply with:
-        #
-        if isinstance(other, np.ndarray):
-            other_quantity = Quantity.__new__(Quantity)
-            if other.size == 1:
-                other_quantity._cyinit(True, other.flat[0], None, CppUnit())
-            else:
-                other_quantity._cyinit(False, dummy_double[0], other, CppUnit())
-
-        elif isinstance(other, float) or isinstance(other, int):
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, other, None, CppUnit())
-
-        elif isinstance(other, Quantity):
-            other_quantity = other
-
-        elif isinstance(other, Unit):
-            a_unit = other
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, 1.0, None, a_unit._unit)
-        else:
+        if self._is_scalar:
+            other_quantity = _scalar_arithmetic(self, other, _SCALAR_DIVIDE)
+            if other_quantity is not None:
+                return other_quantity
+        other_quantity = _as_quantity(other)
+        if other_quantity is None:
             return NotImplemented
 
         return _divide_quantities(self, other_quantity)
@@ -582,53 +1779,102 @@ cdef class Quantity:
 
     def __rtruediv__(self, other):
         """
-        Divide this quantity by another quantity or float.
+        Divide another quantity or float by this quantity.
         """
-        # Classifying the other object:
         cdef Quantity other_quantity
-        cdef Unit a_unit
+        if self._is_scalar:
+            other_quantity = _scalar_arithmetic(self, other, _SCALAR_RDIVIDE)
+            if other_quantity is not None:
+                return other_quantity
+        other_quantity = _as_quantity(other)
+        if other_quantity is None:
+            return NotImplemented
 
-        #
-        # Initialize the quantity that we would like to multiply with:
-        #
-        if isinstance(other, np.ndarray):
-            other_quantity = Quantity.__new__(Quantity)
-            if other.size == 1:
-                other_quantity._cyinit(True, other.flat[0], None, CppUnit())
-            else:
-                other_quantity._cyinit(False, dummy_double[0], other, CppUnit())
+        return _divide_quantities(other_quantity, self)
 
-        elif isinstance(other, float) or isinstance(other, int):
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, other, None, CppUnit())
 
-        elif isinstance(other, Quantity):
-            other_quantity = other
+    def __add__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        if not self._unit.same_dimension((<Quantity>other)._unit):
+            raise UnitError("Trying to add two quantities of incompatible "
+                            "units.")
 
-        elif isinstance(other, Unit):
-            a_unit = other
-            other_quantity = Quantity.__new__(Quantity)
-            other_quantity._cyinit(True, 1.0, None, a_unit._unit)
-        else:
+        return _add_quantities(self, other)
+
+
+    def __sub__(self, other):
+        if not isinstance(other, Quantity):
             return NotImplemented
+        if not self._unit.same_dimension((<Quantity>other)._unit):
+            raise UnitError("Trying to subtract two quantities of incompatible "
+                            "units.")
 
-        return _divide_quantities(other_quantity, self)
+        return _subtract_quantities(self, other)
 
 
-    def __add__(self, Quantity other):
-        if not self._unit.same_dimension(other._unit):
+    def __iadd__(self, other):
+        """
+        In-place addition. The sum is expressed in the unit of this
+        quantity.
+        """
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        cdef Quantity oq = other
+        if not self._unit.same_dimension(oq._unit):
             raise UnitError("Trying to add two quantities of incompatible "
                             "units.")
+        if not self._inplace_compatible(oq):
+            return NotImplemented
+
+        _scaled_add_into(self, 1.0, self, (oq._unit / self._unit).total_scale(),
+                         oq)
+        return self
+
+
+    def __isub__(self, other):
+        """
+        In-place subtraction. The difference is expressed in the unit of
+        this quantity.
+        """
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        cdef Quantity oq = other
+        if not self._unit.same_dimension(oq._unit):
+            raise UnitError("Trying to subtract two quantities of "
+                            "incompatible units.")
+        if not self._inplace_compatible(oq):
+            return NotImplemented
+
+        _scaled_add_into(self, 1.0, self,
+                         -(oq._unit / self._unit).total_scale(), oq)
+        return self
+
+
+    def __imul__(self, other):
+        """
+        In-place multiplication.
+        """
+        cdef Quantity oq = _as_quantity(other)
+        if oq is None or not self._inplace_compatible(oq):
+            return NotImplemented
 
-        return _add_quantities(self, other)
+        _multiply_into(self, 1.0, self, oq)
+        self._unit = self._unit * oq._unit
+        return self
 
 
-    def __sub__(self, Quantity other):
-        if not self._unit.same_dimension(other._unit):
-            raise UnitError("Trying to subtract two quantities of incompatible "
-                            "units.")
+    def __itruediv__(self, other):
+        """
+        In-place division.
+        """
+        cdef Quantity oq = _as_quantity(other)
+        if oq is None or not self._inplace_compatible(oq):
+            return NotImplemented
 
-        return _subtract_quantities(self, other)
+        _divide_into(self, 1.0, self, oq)
+        self._unit = self._unit / oq._unit
+        return self
 
 
     def __pow__(self, exponent):
@@ -645,15 +1891,17 @@ cdef class Quantity:
         """
         # Mostly a copy, we just have to see which part of the value
         # (scalar or ndarray?) we have to negate:
-        cdef Quantity res = Quantity.__new__(Quantity)
+        cdef Quantity res
         if self._is_scalar:
-            res._cyinit(
-                True, -self._val, None, self._unit
-            )
+            res = _scalar_quantity(-self._val, self._unit)
+        elif not self._is_contiguous:
+            res = Quantity.__new__(Quantity)
+            res._cyinit(False, dummy_double[0], -self._val_object, self._unit)
         else:
-            res._cyinit(
-                False, dummy_double[0], -self._val_object, self._unit
-            )
+            res = _empty_like(self, self._unit)
+            with nogil:
+                _kernel_scale(res._val_array_ptr, -1.0, self._val_array_ptr,
+                              self._val_array_N, self._is_float32)
 
         return res
 
@@ -664,12 +1912,11 @@ cdef class Quantity:
         """
         # Mostly a copy, we just have to see which part of the value
         # (scalar or ndarray?) we have to negate:
-        cdef Quantity res = Quantity.__new__(Quantity)
+        cdef Quantity res
         if self._is_scalar:
-            res._cyinit(
-                True, abs(self._val), None, self._unit
-            )
+            res = _scalar_quantity(abs(self._val), self._unit)
         else:
+            res = Quantity.__new__(Quantity)
             res._cyinit(
                 False, dummy_double[0], np.abs(self._val_object), self._unit
             )
@@ -678,40 +1925,27 @@ cdef class Quantity:
 
 
     def __eq__(self, other):
-        # First the case that the other is not a Quantity.
-        # This results in nonzero only if this quantity is
-        # dimensionless:
-        if not isinstance(other, Quantity):
-            if not self._unit.dimensionless():
-                return False
-            if self._is_scalar:
-                return float(self._val) == other
-            return self._val_object == other
+        return _compare_quantities(self, other, Py_EQ)
 
-        # Now compare quantities:
-        cdef Quantity oq = other
-        if not self._unit.same_dimension(oq._unit):
-            return False
 
-        # Check whether there's a scale difference:
-        cdef CppUnit div_unit = self._unit / oq._unit
-        cdef double scale = div_unit.total_scale()
-        if scale == 1.0:
-            # No scale difference. Make the two possible
-            # comparisons:
-            if self._is_scalar and oq._is_scalar:
-                return self._val == oq._val
-            elif not self._is_scalar and not oq._is_scalar:
-                return self._val_object == oq._val_object
-            return False
+    def __ne__(self, other):
+        return _compare_quantities(self, other, Py_NE)
 
-        # Have scale difference. Make the two possible
-        # comparisons:
-        if self._is_scalar and oq._is_scalar:
-            return self._val == scale*oq._val
-        elif not self._is_scalar and not oq._is_scalar:
-            return self._val_object == scale * oq._val_object
-        return False
+
+    def __lt__(self, other):
+        return _compare_quantities(self, other, Py_LT)
+
+
+    def __le__(self, other):
+        return _compare_quantities(self, other, Py_LE)
+
+
+    def __gt__(self, other):
+        return _compare_quantities(self, other, Py_GT)
+
+
+    def __ge__(self, other):
+        return _compare_quantities(self, other, Py_GE)
 
 
     def __getitem__(self, index) -> Quantity:
@@ -733,7 +1967,7 @@ cdef class Quantity:
 
 
         # Initialize the new Quantity:
-        cdef Quantity q = Quantity.__new__(Quantity)
+        cdef Quantity q
         cdef PyObject* val_object_ptr
         cdef double* data
         val_object_ptr = <PyObject*>val_object
@@ -752,10 +1986,13 @@ cdef class Quantity:
                     "Could not cast index result scalar to double. This error "
                     "should not occur."
                 )
-            q._cyinit(True, val, None, self._unit)
+            q = _scalar_quantity(val, self._unit)
 
         else:
+            q = Quantity.__new__(Quantity)
             q._cyinit(False, dummy_double[0], val_object, self._unit)
+            # Views of copy-on-write buffers are copy-on-write as well:
+            q._cow = self._cow and not q._exclusive()
 
         return q
 
@@ -773,17 +2010,356 @@ cdef class Quantity:
         return generate_from_cpp(self._unit)
 
 
+    def dtype(self) -> np.dtype:
+        """
+        Return the dtype in which this quantity's values are stored.
+        """
+        if self._is_float32:
+            return np.dtype(np.float32)
+        return np.dtype(np.double)
+
+
+    def to(self, unit, Quantity out=None, bool inplace=False) -> Quantity:
+        """
+        Converts this quantity to another unit of the same dimension.
+
+        Parameters
+        ----------
+        unit : Unit | str
+            The target unit.
+        out : Quantity, optional
+            A preallocated quantity with unit `unit` to which the
+            converted values are written.
+        inplace : bool, optional
+            If True, the values of this quantity are rescaled in its
+            own buffer and this quantity is returned. Shared copy-on-write
+            buffers are copied first, other read-only buffers raise a
+            ValueError.
+
+        Returns
+        -------
+        converted : Quantity
+            The quantity in unit `unit`. If the scale between the units
+            is exactly one, the converted quantity shares the buffer of
+            this quantity.
+        """
+        cdef CppUnit target = _target_unit(unit)
+        if not self._unit.same_dimension(target):
+            raise UnitError("Cannot convert to a unit of different "
+                            "dimension.")
+        cdef double scale = (self._unit / target).total_scale()
+        cdef object array
+        if out is not None:
+            if inplace:
+                raise ValueError("'out' and 'inplace' are mutually "
+                                 "exclusive.")
+            if not out._unit == target:
+                raise UnitError("The unit of `out` has to be the target "
+                                "unit.")
+            _check_output(out, target)
+            return _write_result(out, self)
+
+        if inplace:
+            if self._is_scalar:
+                self._val *= scale
+            elif scale != 1.0:
+                array = _writable_array(self)
+                if self._is_contiguous:
+                    with nogil:
+                        _kernel_scale(self._val_array_ptr, scale,
+                                      self._val_array_ptr, self._val_array_N,
+                                      self._is_float32)
+                else:
+                    np.multiply(array, scale, out=array)
+            self._unit = target
+            return self
+
+        return _convert(self, target, scale)
+
+
+    def value_in(self, unit) -> float | np.ndarray:
+        """
+        The values of this quantity expressed in a unit of the same
+        dimension. Returns a float for scalar quantities and an array
+        for array quantities. If the scale between the units is exactly
+        one, the array is a read-only view of the values of this quantity.
+        """
+        cdef CppUnit target = _target_unit(unit)
+        if not self._unit.same_dimension(target):
+            raise UnitError("Cannot express a quantity in a unit of "
+                            "different dimension.")
+        cdef double scale = (self._unit / target).total_scale()
+        cdef object view
+        if self._is_scalar:
+            return scale * self._val
+        if scale == 1.0:
+            view = self._val_object.view()
+            view.flags['WRITEABLE'] = False
+            return view
+        return _convert(self, target, scale)._val_object
+
+
+    cdef bool _native_reduction(self, object axis):
+        """
+        Checks whether a reduction over all elements can be evaluated
+        by the native kernels.
+        """
+        return (axis is None and not self._is_scalar and self._is_contiguous
+                and self._val_array_N > 0)
+
+
+    def sum(self, axis=None) -> Quantity:
+        """
+        Sum of the elements, over all elements or along the given axis.
+        """
+        if not self._native_reduction(axis):
+            return _from_values(np.sum(_values(self), axis=axis), self._unit)
+        cdef double res
+        with nogil:
+            res = _kernel_dot(self._val_array_ptr, NULL, self._val_array_N,
+                              self._is_float32)
+        return _scalar_quantity(res, self._unit)
+
+
+    def mean(self, axis=None) -> Quantity:
+        """
+        Arithmetic mean of the elements, over all elements or along the
+        given axis.
+        """
+        if not self._native_reduction(axis):
+            return _from_values(np.mean(_values(self), axis=axis), self._unit)
+        cdef double res
+        with nogil:
+            res = _kernel_dot(self._val_array_ptr, NULL, self._val_array_N,
+                              self._is_float32)
+        return _scalar_quantity(res / self._val_array_N, self._unit)
+
+
+    def min(self, axis=None) -> Quantity:
+        """
+        Minimum of the elements, over all elements or along the given axis.
+        NaNs propagate.
+        """
+        if not self._native_reduction(axis):
+            return _from_values(np.min(_values(self), axis=axis), self._unit)
+        return _scalar_quantity(self._element(self._argextremum(False)),
+                                self._unit)
+
+
+    def max(self, axis=None) -> Quantity:
+        """
+        Maximum of the elements, over all elements or along the given axis.
+        NaNs propagate.
+        """
+        if not self._native_reduction(axis):
+            return _from_values(np.max(_values(self), axis=axis), self._unit)
+        return _scalar_quantity(self._element(self._argextremum(True)),
+                                self._unit)
+
+
+    def argmin(self, axis=None) -> int | np.ndarray:
+        """
+        Flat index of the first minimum or, if an axis is given, the
+        indices of the minima along that axis.
+        """
+        if not self._native_reduction(axis):
+            return np.argmin(_values(self), axis=axis)
+        return self._argextremum(False)
+
+
+    def argmax(self, axis=None) -> int | np.ndarray:
+        """
+        Flat index of the first maximum or, if an axis is given, the
+        indices of the maxima along that axis.
+        """
+        if not self._native_reduction(axis):
+            return np.argmax(_values(self), axis=axis)
+        return self._argextremum(True)
+
+
+    def cumsum(self, axis=None) -> Quantity:
+        """
+        Cumulative sum of the flattened elements or along the given axis.
+        """
+        return _from_values(np.cumsum(_values(self), axis=axis), self._unit)
+
+
+    def sort(self, axis=-1) -> Quantity:
+        """
+        A copy of this array quantity, sorted along the given axis or,
+        if `axis` is None, flattened and sorted.
+        """
+        if self._is_scalar:
+            raise TypeError("Cannot sort a scalar Quantity.")
+        return _from_values(np.sort(self._val_object, axis=axis), self._unit)
+
+
+    def argsort(self, axis=-1) -> np.ndarray:
+        """
+        Indices that sort this array quantity along the given axis or,
+        if `axis` is None, the flattened quantity.
+        """
+        if self._is_scalar:
+            raise TypeError("Cannot sort a scalar Quantity.")
+        return np.argsort(self._val_object, axis=axis)
+
+
+    def searchsorted(self, v, side='left') -> int | np.ndarray:
+        """
+        Indices at which the elements of `v` would have to be inserted
+        into this sorted one-dimensional quantity to maintain the order.
+
+        Parameters
+        ----------
+        v : Quantity
+            A scalar or array quantity of the dimension of this quantity.
+            It is converted to the unit of this quantity, which is not
+            copied. Arrays of another scale are rescaled into a temporary
+            array of the size of `v`.
+        side : 'left' | 'right', optional
+            Which index to return for elements equal to `v`.
+        """
+        if self._is_scalar:
+            raise TypeError("Cannot search a scalar Quantity.")
+        return np.searchsorted(self._val_object, _bound_values(self, v),
+                               side=side)
+
+
+    def clip(self, min=None, max=None) -> Quantity:
+        """
+        Limits the values of this quantity to the interval [min, max].
+        The bounds can be scalar or array quantities and are converted
+        to the unit of this quantity. Array bounds of another scale are
+        rescaled into temporary arrays of their size.
+        """
+        if min is None and max is None:
+            raise ValueError("At least one of 'min' and 'max' has to be "
+                             "given.")
+        return _from_values(
+            np.clip(_values(self), _bound_values(self, min),
+                    _bound_values(self, max)),
+            self._unit
+        )
+
+
+    def dot(self, other) -> Quantity:
+        """
+        Dot product with another quantity, array, or number. The unit of
+        the result is the product of the units.
+        """
+        cdef Quantity oq = _as_quantity(other)
+        if oq is None:
+            raise TypeError("The second factor has to be a quantity, unit, "
+                            "NumPy array, or number.")
+        cdef CppUnit unit = self._unit * oq._unit
+        cdef double res
+        if (self._native_reduction(None) and oq._native_reduction(None)
+                and self._is_float32 == oq._is_float32
+                and PyArray_NDIM(<PyArrayObject*>self._val_object) == 1
+                and _same_shape(self, oq)):
+            with nogil:
+                res = _kernel_dot(self._val_array_ptr, oq._val_array_ptr,
+                                  self._val_array_N, self._is_float32)
+            return _scalar_quantity(res, unit)
+        return _from_values(np.dot(_values(self), _values(oq)), unit)
+
+
+    def norm(self, axis=None) -> Quantity:
+        """
+        Euclidean norm of the elements, over all elements or along the
+        given axis.
+        """
+        cdef double res
+        if not self._native_reduction(axis):
+            values = _values(self)
+            return _from_values(
+                np.sqrt(np.sum(values * values, axis=axis)), self._unit
+            )
+        with nogil:
+            res = _kernel_dot(self._val_array_ptr, self._val_array_ptr,
+                              self._val_array_N, self._is_float32)
+        return _scalar_quantity(sqrt(res), self._unit)
+
+
+    cdef size_t _argextremum(self, bool maximum):
+        """
+        Flat index of the first minimum or maximum of a nonempty,
+        contiguous array quantity.
+        """
+        cdef size_t res
+        with nogil:
+            res = _kernel_argextremum(self._val_array_ptr, maximum,
+                                      self._val_array_N, self._is_float32)
+        return res
+
+
+    cdef double _element(self, size_t i):
+        """
+        Element i of a contiguous array quantity.
+        """
+        if self._is_float32:
+            return (<float*>self._val_array_ptr)[i]
+        return (<double*>self._val_array_ptr)[i]
+
+
     cdef QuantityWrapper wrapper(self) nogil:
         """
         Return a QuantityWrapper instance for talking to C++.
         """
         if self._is_scalar:
             return QuantityWrapper(&self._val, 1, self._unit)
-        else:
-            return QuantityWrapper(
-                self._val_array_ptr,
-                self._val_array_N,
-                self._unit)
+        if self._is_float32:
+            with gil:
+                raise TypeError("The quantity is stored in float32. Use "
+                                "wrapper32() instead.")
+        cdef PyArrayObject* pao = <PyArrayObject*>self._val_object
+        return QuantityWrapper(
+            <double*>self._val_array_ptr,
+            PyArray_NDIM(pao),
+            PyArray_SHAPE(pao),
+            PyArray_STRIDES(pao),
+            self._unit)
+
+
+    cdef QuantityWrapper32 wrapper32(self) nogil:
+        """
+        Return a QuantityWrapper32 instance for talking to C++ with float32
+        quantities. Scalar quantities are passed by value.
+        """
+        if self._is_scalar:
+            return QuantityWrapper32(<float>self._val, self._unit)
+        if not self._is_float32:
+            with gil:
+                raise TypeError("The quantity is stored in double. Use "
+                                "wrapper() instead.")
+        cdef PyArrayObject* pao = <PyArrayObject*>self._val_object
+        return QuantityWrapper32(
+            <float*>self._val_array_ptr,
+            PyArray_NDIM(pao),
+            PyArray_SHAPE(pao),
+            PyArray_STRIDES(pao),
+            self._unit)
+
+
+    cdef QuantityWrapper mutable_wrapper(self):
+        """
+        Return a QuantityWrapper instance for writing from C++. Copy-on-write
+        buffers that are shared with other objects are copied first.
+        """
+        if self._cow and not self._exclusive():
+            self._detach()
+        return self.wrapper()
+
+
+    cdef QuantityWrapper32 mutable_wrapper32(self):
+        """
+        Return a QuantityWrapper32 instance for writing from C++.
+        Copy-on-write buffers that are shared with other objects are copied
+        first.
+        """
+        if self._cow and not self._exclusive():
+            self._detach()
+        return self.wrapper32()
 
 
     @staticmethod
@@ -849,4 +2425,1155 @@ cdef class Quantity:
             dest_unit
         )
 
-        return res
\ No newline at end of file
+        return res
+
+
+
+################################################################################
+#                                                                              #
+#                  Arithmetic with preallocated output targets                 #
+#                                                                              #
+################################################################################
+
+cdef Quantity _check_output(Quantity out, const CppUnit& unit):
+    """
+    Checks that the output target of an operation with result unit
+    'unit' is dimensionally compatible and writable.
+    """
+    if not out._unit.same_dimension(unit):
+        raise UnitError("The unit of `out` is incompatible with the unit "
+                        "of the result.")
+    if not out._writable():
+        if not out._cow:
+            raise ValueError("The buffer of `out` is read-only and shared.")
+        out._detach()
+    return out
+
+
+cdef Quantity _write_result(Quantity out, Quantity res):
+    """
+    Writes a computed result to an output target, converting it to
+    the output unit and dtype.
+    """
+    cdef double scale = (res._unit / out._unit).total_scale()
+    if out._is_scalar:
+        if not res._is_scalar:
+            raise ValueError("The shape of `out` does not match the shape "
+                             "of the result.")
+        out._val = scale * res._val
+        return out
+    if not res._is_scalar and not _same_shape(out, res):
+        raise ValueError("The shape of `out` does not match the shape of "
+                         "the result.")
+    cdef object values
+    if out._is_contiguous and (res._is_scalar or res._is_contiguous):
+        if res._is_scalar:
+            _kernel_fill(out._val_array_ptr, scale * res._val,
+                         out._val_array_N, out._is_float32)
+            return out
+        values = res._val_object
+        if res._is_float32 != out._is_float32:
+            values = values.astype(out._val_object.dtype)
+        _kernel_scale(out._val_array_ptr, scale,
+                      PyArray_DATA(<PyArrayObject*>values), out._val_array_N,
+                      out._is_float32)
+        return out
+
+    # Strided operands are written by NumPy:
+    if not PyArray_CHKFLAGS(<PyArrayObject*>out._val_object,
+                            NPY_ARRAY_WRITEABLE):
+        out._detach()
+    np.multiply(_values(res), scale, out=out._val_object, casting='unsafe')
+    return out
+
+
+def add(Quantity a, Quantity b, Quantity out=None) -> Quantity:
+    """
+    Add two quantities.
+
+    Parameters
+    ----------
+    a, b : Quantity
+        The summands.
+    out : Quantity, optional
+        A preallocated quantity to which the sum is written, expressed
+        in the unit of `out`. Its buffer has to be writeable or owned
+        exclusively by `out`.
+
+    Returns
+    -------
+    sum : Quantity
+        The sum, which is `out` if provided.
+    """
+    if not a._unit.same_dimension(b._unit):
+        raise UnitError("Trying to add two quantities of incompatible "
+                        "units.")
+    if out is None:
+        return _add_quantities(a, b)
+    _check_output(out, a._unit)
+    if (out._is_scalar and not (a._is_scalar and b._is_scalar)) \
+            or (not out._is_scalar and not _writes_elementwise(out, a, b)):
+        return _write_result(out, _add_quantities(a, b))
+    _scaled_add_into(out, (a._unit / out._unit).total_scale(), a,
+                     (b._unit / out._unit).total_scale(), b)
+    return out
+
+
+def subtract(Quantity a, Quantity b, Quantity out=None) -> Quantity:
+    """
+    Subtract two quantities.
+
+    Parameters
+    ----------
+    a, b : Quantity
+        The minuend and subtrahend.
+    out : Quantity, optional
+        A preallocated quantity to which the difference is written,
+        expressed in the unit of `out`. Its buffer has to be writeable or
+        owned exclusively by `out`.
+
+    Returns
+    -------
+    difference : Quantity
+        The difference, which is `out` if provided.
+    """
+    if not a._unit.same_dimension(b._unit):
+        raise UnitError("Trying to subtract two quantities of incompatible "
+                        "units.")
+    if out is None:
+        return _subtract_quantities(a, b)
+    _check_output(out, a._unit)
+    if (out._is_scalar and not (a._is_scalar and b._is_scalar)) \
+            or (not out._is_scalar and not _writes_elementwise(out, a, b)):
+        return _write_result(out, _subtract_quantities(a, b))
+    _scaled_add_into(out, (a._unit / out._unit).total_scale(), a,
+                     -(b._unit / out._unit).total_scale(), b)
+    return out
+
+
+def multiply(a, b, Quantity out=None) -> Quantity:
+    """
+    Multiply two quantities.
+
+    Parameters
+    ----------
+    a, b : Quantity | Unit | NDArray[np.double] | float
+        The factors.
+    out : Quantity, optional
+        A preallocated quantity to which the product is written, expressed
+        in the unit of `out`. Its buffer has to be writeable or owned
+        exclusively by `out`.
+
+    Returns
+    -------
+    product : Quantity
+        The product, which is `out` if provided.
+    """
+    cdef Quantity qa = _as_quantity(a)
+    cdef Quantity qb = _as_quantity(b)
+    if qa is None or qb is None:
+        raise TypeError("Factors have to be quantities, units, NumPy "
+                        "arrays, or numbers.")
+    if out is None:
+        return _multiply_quantities(qa, qb)
+    cdef CppUnit unit = qa._unit * qb._unit
+    _check_output(out, unit)
+    if (out._is_scalar and not (qa._is_scalar and qb._is_scalar)) \
+            or (not out._is_scalar and not _writes_elementwise(out, qa, qb)):
+        return _write_result(out, _multiply_quantities(qa, qb))
+    _multiply_into(out, (unit / out._unit).total_scale(), qa, qb)
+    return out
+
+
+def divide(a, b, Quantity out=None) -> Quantity:
+    """
+    Divide two quantities.
+
+    Parameters
+    ----------
+    a, b : Quantity | Unit | NDArray[np.double] | float
+        The dividend and divisor.
+    out : Quantity, optional
+        A preallocated quantity to which the quotient is written, expressed
+        in the unit of `out`. Its buffer has to be writeable or owned
+        exclusively by `out`.
+
+    Returns
+    -------
+    quotient : Quantity
+        The quotient, which is `out` if provided.
+    """
+    cdef Quantity qa = _as_quantity(a)
+    cdef Quantity qb = _as_quantity(b)
+    if qa is None or qb is None:
+        raise TypeError("Dividend and divisor have to be quantities, units, "
+                        "NumPy arrays, or numbers.")
+    if out is None:
+        return _divide_quantities(qa, qb)
+    cdef CppUnit unit = qa._unit / qb._unit
+    _check_output(out, unit)
+    if (out._is_scalar and not (qa._is_scalar and qb._is_scalar)) \
+            or (not out._is_scalar and not _writes_elementwise(out, qa, qb)):
+        return _write_result(out, _divide_quantities(qa, qb))
+    _divide_into(out, (unit / out._unit).total_scale(), qa, qb)
+    return out
+
+
+
+################################################################################
+#                                                                              #
+#                             NumPy interoperability                           #
+#                                                                              #
+################################################################################
+
+cdef enum _UfuncKind:
+    _UF_ADD
+    _UF_SUBTRACT
+    _UF_MULTIPLY
+    _UF_DIVIDE
+    # Binary, operands of equal dimension, result in the unit of the first:
+    _UF_SAME
+    # Comparisons, operands of equal dimension, boolean result:
+    _UF_COMPARE
+    _UF_EQUALITY
+    # Unary, result in the unit of the operand:
+    _UF_UNARY
+    # Unary, scale-independent result without unit:
+    _UF_RAW
+    _UF_SQRT
+    _UF_CBRT
+    _UF_SQUARE
+    _UF_RECIPROCAL
+
+
+#
+# The ufuncs that Quantity supports for all units. Dimensionless quantities
+# can be passed to any other ufunc, which receives them as arrays.
+#
+cdef dict _UFUNC_KIND = {
+    np.add : _UF_ADD,
+    np.subtract : _UF_SUBTRACT,
+    np.multiply : _UF_MULTIPLY,
+    np.divide : _UF_DIVIDE,
+    np.minimum : _UF_SAME,
+    np.maximum : _UF_SAME,
+    np.fmin : _UF_SAME,
+    np.fmax : _UF_SAME,
+    np.hypot : _UF_SAME,
+    np.less : _UF_COMPARE,
+    np.less_equal : _UF_COMPARE,
+    np.greater : _UF_COMPARE,
+    np.greater_equal : _UF_COMPARE,
+    np.equal : _UF_EQUALITY,
+    np.not_equal : _UF_EQUALITY,
+    np.negative : _UF_UNARY,
+    np.positive : _UF_UNARY,
+    np.absolute : _UF_UNARY,
+    np.fabs : _UF_UNARY,
+    np.isnan : _UF_RAW,
+    np.isinf : _UF_RAW,
+    np.isfinite : _UF_RAW,
+    np.signbit : _UF_RAW,
+    np.sign : _UF_RAW,
+    np.sqrt : _UF_SQRT,
+    np.cbrt : _UF_CBRT,
+    np.square : _UF_SQUARE,
+    np.reciprocal : _UF_RECIPROCAL,
+}
+
+
+cdef object _writable_array(Quantity out):
+    """
+    Returns the array of an output target, which NumPy can write to.
+    As in _check_output, read-only buffers that are neither exclusively
+    owned nor copy-on-write cannot be written to.
+    """
+    if PyArray_CHKFLAGS(<PyArrayObject*>out._val_object, NPY_ARRAY_WRITEABLE):
+        return out._val_object
+    # Exclusively owned buffers can be unlocked, shared copy-on-write
+    # buffers are copied. Note that a reference to the array held here
+    # before the check would defeat it.
+    cdef object array
+    if out._exclusive():
+        array = out._val_object
+        try:
+            array.flags['WRITEABLE'] = True
+            return array
+        except ValueError:
+            pass
+    if not out._cow:
+        raise ValueError("The buffer of the quantity is read-only and "
+                         "shared.")
+    out._detach()
+    return out._val_object
+
+
+def _writable_values(Quantity q, bool copy=True):
+    """
+    Returns the writeable array of an array quantity, unlocking exclusively
+    owned buffers and copying shared copy-on-write buffers. Other
+    read-only buffers raise a ValueError, as do all buffers that would
+    have to be copied if `copy` is False. Views of the returned array can
+    serve as output targets.
+    """
+    if q._is_scalar:
+        raise TypeError("Scalar quantities have no array buffer.")
+    if not copy and not q._writable():
+        raise ValueError("The buffer of the quantity is read-only.")
+    return _writable_array(q)
+
+
+cdef object _dimensionless_ufunc(object ufunc, str method, tuple inputs,
+                                 object out, dict kwargs):
+    """
+    Evaluates a ufunc on dimensionless quantities, which are passed as
+    arrays.
+    """
+    try:
+        inputs = tuple(_dimensionless_argument(x) for x in inputs)
+    except UnitError:
+        return NotImplemented
+    if out is not None:
+        if any(isinstance(o, Quantity) for o in out):
+            return NotImplemented
+        kwargs['out'] = out
+    return getattr(ufunc, method)(*inputs, **kwargs)
+
+
+cdef object _array_ufunc(object ufunc, str method, tuple inputs,
+                         dict kwargs):
+    """
+    Unit propagation for the NumPy ufuncs.
+    """
+    cdef object out = kwargs.pop('out', None)
+    cdef object kind = _UFUNC_KIND.get(ufunc)
+    if kind is None or method != '__call__':
+        return _dimensionless_ufunc(ufunc, method, inputs, out, kwargs)
+
+    cdef list operands = [_as_quantity(x) for x in inputs]
+    if None in operands:
+        return NotImplemented
+    cdef Quantity q0 = operands[0]
+    cdef Quantity q1 = operands[1] if len(operands) > 1 else None
+    cdef Quantity out_q = None
+    if out is not None:
+        if len(out) != 1:
+            return NotImplemented
+        if isinstance(out[0], Quantity):
+            out_q = out[0]
+
+    # Sums, differences, products, and quotients are evaluated by the
+    # fused kernels:
+    if not kwargs and (out is None or out_q is not None):
+        if kind == _UF_ADD:
+            return add(q0, q1, out_q)
+        elif kind == _UF_SUBTRACT:
+            return subtract(q0, q1, out_q)
+        elif kind == _UF_MULTIPLY:
+            return multiply(q0, q1, out_q)
+        elif kind == _UF_DIVIDE:
+            return divide(q0, q1, out_q)
+
+    # Determine the unit of the result and the raw operands once:
+    cdef CppUnit unit = q0._unit
+    cdef double scale
+    cdef list raw = [_values(q0)]
+    if q1 is not None:
+        if kind == _UF_MULTIPLY:
+            unit = q0._unit * q1._unit
+        elif kind == _UF_DIVIDE:
+            unit = q0._unit / q1._unit
+        elif not q0._unit.same_dimension(q1._unit):
+            if kind == _UF_EQUALITY:
+                return NotImplemented
+            raise UnitError("The operands of '" + ufunc.__name__ + "' have "
+                            "incompatible units.")
+        if kind == _UF_MULTIPLY or kind == _UF_DIVIDE:
+            raw.append(_values(q1))
+        else:
+            # Express the second operand in the unit of the first:
+            scale = (q1._unit / q0._unit).total_scale()
+            raw.append(_values(q1) if scale == 1.0
+                       else scale * _values(q1))
+    elif kind == _UF_SQRT or kind == _UF_CBRT:
+        if not q0._unit.has_root(2 if kind == _UF_SQRT else 3):
+            raise UnitError("The unit of the operand of '" + ufunc.__name__
+                            + "' has no integer root.")
+        unit = q0._unit.root(2 if kind == _UF_SQRT else 3)
+    elif kind == _UF_SQUARE:
+        unit = q0._unit.power(2)
+    elif kind == _UF_RECIPROCAL:
+        unit = q0._unit.invert()
+
+    # Results without a unit:
+    if kind == _UF_COMPARE or kind == _UF_EQUALITY or kind == _UF_RAW:
+        if out_q is not None:
+            raise TypeError("The output of '" + ufunc.__name__ + "' has no "
+                            "unit and cannot be written to a Quantity.")
+        if out is not None:
+            kwargs['out'] = out
+        return ufunc(*raw, **kwargs)
+
+    if out is None:
+        return _from_values(ufunc(*raw, **kwargs), unit)
+    if out_q is None:
+        raise TypeError("The output of '" + ufunc.__name__ + "' has to be "
+                        "a Quantity.")
+    _check_output(out_q, unit)
+    if out_q._is_scalar:
+        return _write_result(out_q, _from_values(ufunc(*raw, **kwargs), unit))
+    cdef object target = _writable_array(out_q)
+    ufunc(*raw, out=target, **kwargs)
+    scale = (unit / out_q._unit).total_scale()
+    if scale != 1.0:
+        np.multiply(target, scale, out=target)
+    return out_q
+
+
+#
+# NumPy functions that map to the methods of Quantity, with the number of
+# further positional arguments and the keyword arguments that the methods
+# accept:
+#
+cdef dict _ARRAY_FUNCTION_METHOD = {
+    np.sum : ("sum", 1, ('axis',)),
+    np.mean : ("mean", 1, ('axis',)),
+    np.min : ("min", 1, ('axis',)),
+    np.amin : ("min", 1, ('axis',)),
+    np.max : ("max", 1, ('axis',)),
+    np.amax : ("max", 1, ('axis',)),
+    np.argmin : ("argmin", 1, ('axis',)),
+    np.argmax : ("argmax", 1, ('axis',)),
+    np.cumsum : ("cumsum", 1, ('axis',)),
+    np.sort : ("sort", 1, ('axis',)),
+    np.argsort : ("argsort", 1, ('axis',)),
+    np.searchsorted : ("searchsorted", 2, ('v', 'side')),
+    np.clip : ("clip", 2, ('min', 'max')),
+}
+
+
+cdef object _array_function(object func, tuple args, dict kwargs):
+    """
+    Dispatch of NumPy functions to the methods of Quantity.
+    """
+    cdef tuple method = _ARRAY_FUNCTION_METHOD.get(func)
+    cdef Quantity q
+    if method is not None and len(args) >= 1 and isinstance(args[0], Quantity):
+        if len(args) > 1 + method[1] or any(k not in method[2]
+                                            for k in kwargs):
+            return NotImplemented
+        return getattr(args[0], method[0])(*args[1:], **kwargs)
+    if func is np.dot and len(args) == 2 and not kwargs:
+        q = _as_quantity(args[0])
+        if q is not None:
+            return q.dot(args[1])
+
+    # Dimensionless quantities are passed as arrays to all other functions:
+    try:
+        args = tuple(_dimensionless_argument(x) for x in args)
+    except UnitError:
+        return NotImplemented
+    return func(*args, **kwargs)
+
+
+cdef object _dimensionless_argument(object x):
+    """
+    Replaces dimensionless quantities, also within lists and tuples, by
+    their values.
+    """
+    cdef Quantity q
+    if isinstance(x, Quantity):
+        q = x
+        if not q._unit.dimensionless():
+            raise UnitError("Quantity is not dimensionless.")
+        return float(q) if q._is_scalar else q.__array__()
+    elif isinstance(x, (list, tuple)):
+        return type(x)(_dimensionless_argument(y) for y in x)
+    return x
+
+
+
+def from_dlpack(x, unit, copy=None) -> Quantity:
+    """
+    Creates an array quantity from an object that supports the DLPack
+    protocol, for instance arrays of other array libraries.
+
+    Parameters
+    ----------
+    x : object
+        An object with `__dlpack__` and `__dlpack_device__` methods
+        that exports a CPU buffer.
+    unit : Unit | str
+        The unit of the values.
+    copy : bool, optional
+        If True, the values are copied. By default, float32 and double
+        buffers are shared with the producer and other types converted
+        to double. If False, buffers of other types raise a ValueError
+        instead of being converted.
+    """
+    values = np.from_dlpack(x)
+    if values.ndim == 0:
+        return Quantity(float(values), unit)
+    if copy is False and values.dtype != np.float32 \
+            and values.dtype != np.float64:
+        raise ValueError("Values of dtype " + str(values.dtype) + " cannot "
+                         "be shared without conversion.")
+    return Quantity(values, unit, copy=True if copy else False)
+
+
+################################################################################
+#                                                                              #
+#                        Fused evaluation of expressions                       #
+#                                                                              #
+################################################################################
+
+#
+# Expressions are compiled (by cyantities.lazy) into postfix programs that
+# operate on a stack of registers. Each register holds one block of
+# elements, so that all intermediate results of an expression stay in the
+# cache while the operands are read, and the result written, once.
+#
+cdef enum _Opcode:
+    # Push the array given by the argument:
+    _OP_LOAD
+    # Push the constant given by the argument:
+    _OP_CONST
+    # Binary operations on the two topmost registers:
+    _OP_ADD
+    _OP_SUBTRACT
+    _OP_MULTIPLY
+    _OP_DIVIDE
+    # Unary operations on the topmost register:
+    _OP_NEGATE
+    _OP_SCALE
+    _OP_POWER
+
+# Opcodes for the compiler:
+_PROGRAM_OPCODES = {
+    'load' : _OP_LOAD,
+    'const' : _OP_CONST,
+    'add' : _OP_ADD,
+    'subtract' : _OP_SUBTRACT,
+    'multiply' : _OP_MULTIPLY,
+    'divide' : _OP_DIVIDE,
+    'negate' : _OP_NEGATE,
+    'scale' : _OP_SCALE,
+    'power' : _OP_POWER
+}
+
+cdef enum:
+    # Number of elements per register:
+    _PROGRAM_BLOCK = 512
+
+
+cdef enum:
+    # Maximum number of dimensions of the result:
+    _PROGRAM_MAXDIMS = 64
+
+
+cdef struct _Operand:
+    const char* data
+    bool single
+    # Contiguous of the size of the result:
+    bool contiguous
+    # Byte strides along the axes of the result, zero for broadcast axes:
+    const Py_ssize_t* strides
+
+
+cdef struct _Program:
+    const int* opcodes
+    const double* args
+    size_t length
+    const _Operand* arrays
+    # Contiguous output, float32 if 'single':
+    void* out
+    bool single
+    # Shape of the result:
+    size_t ndim
+    const size_t* shape
+    # One stack of 'depth' registers per chunk:
+    double* scratch
+    size_t depth
+
+
+cdef void _load_block(const _Program* p, const _Operand* x, double* a,
+                      size_t i0, size_t n) noexcept nogil:
+    """
+    Loads the elements [i0, i0+n) of the broadcast operand x into the
+    register a.
+    """
+    cdef size_t j, k, d, run
+    if x.contiguous:
+        if x.single:
+            for j in range(n):
+                a[j] = (<const float*>x.data)[i0 + j]
+        else:
+            for j in range(n):
+                a[j] = (<const double*>x.data)[i0 + j]
+        return
+
+    # Multi-index and offset of the first element:
+    cdef size_t idx[_PROGRAM_MAXDIMS]
+    cdef size_t rem = i0
+    cdef Py_ssize_t offset = 0
+    cdef size_t last = p.ndim - 1
+    d = p.ndim
+    while d > 0:
+        d -= 1
+        idx[d] = rem % p.shape[d]
+        rem //= p.shape[d]
+        offset += <Py_ssize_t>idx[d] * x.strides[d]
+
+    # Runs along the last axis:
+    cdef Py_ssize_t s = x.strides[last]
+    cdef const char* src
+    j = 0
+    while j < n:
+        run = min(n - j, p.shape[last] - idx[last])
+        src = x.data + offset
+        if x.single:
+            for k in range(run):
+                a[j + k] = (<const float*>(src + <Py_ssize_t>k * s))[0]
+        else:
+            for k in range(run):
+                a[j + k] = (<const double*>(src + <Py_ssize_t>k * s))[0]
+        j += run
+        offset += <Py_ssize_t>run * s
+        idx[last] += run
+        # Carry to the outer axes:
+        d = last
+        while d > 0 and idx[d] == p.shape[d]:
+            offset -= <Py_ssize_t>p.shape[d] * x.strides[d]
+            idx[d] = 0
+            d -= 1
+            idx[d] += 1
+            offset += x.strides[d]
+
+
+cdef void _program_block(const _Program* p, double* stack, size_t i0,
+                         size_t n) noexcept nogil:
+    """
+    Runs a program on the elements [i0, i0+n), n <= _PROGRAM_BLOCK.
+    """
+    cdef size_t sp = 0
+    cdef size_t i, j
+    cdef int op
+    cdef double* a
+    cdef double* b
+    cdef double c
+    for i in range(p.length):
+        op = p.opcodes[i]
+        if op == _OP_LOAD:
+            _load_block(p, p.arrays + <size_t>p.args[i],
+                        stack + sp * _PROGRAM_BLOCK, i0, n)
+            sp += 1
+        elif op == _OP_CONST:
+            a = stack + sp * _PROGRAM_BLOCK
+            c = p.args[i]
+            for j in range(n):
+                a[j] = c
+            sp += 1
+        elif op == _OP_NEGATE or op == _OP_SCALE or op == _OP_POWER:
+            a = stack + (sp - 1) * _PROGRAM_BLOCK
+            c = p.args[i]
+            if op == _OP_NEGATE:
+                for j in range(n):
+                    a[j] = -a[j]
+            elif op == _OP_SCALE:
+                for j in range(n):
+                    a[j] *= c
+            elif c == 2.0:
+                for j in range(n):
+                    a[j] = a[j] * a[j]
+            else:
+                for j in range(n):
+                    a[j] = pow(a[j], c)
+        else:
+            sp -= 1
+            a = stack + (sp - 1) * _PROGRAM_BLOCK
+            b = stack + sp * _PROGRAM_BLOCK
+            if op == _OP_ADD:
+                for j in range(n):
+                    a[j] += b[j]
+            elif op == _OP_SUBTRACT:
+                for j in range(n):
+                    a[j] -= b[j]
+            elif op == _OP_MULTIPLY:
+                for j in range(n):
+                    a[j] *= b[j]
+            else:
+                for j in range(n):
+                    a[j] /= b[j]
+
+    cdef float* out32
+    if p.single:
+        out32 = <float*>p.out + i0
+        for j in range(n):
+            out32[j] = <float>stack[j]
+    else:
+        a = <double*>p.out + i0
+        for j in range(n):
+            a[j] = stack[j]
+
+
+cdef void _program_chunk(const _Program* p, size_t k, size_t i0,
+                         size_t i1) noexcept nogil:
+    """
+    Runs a program on the elements [i0, i1) using the stack of chunk k.
+    """
+    cdef double* stack = p.scratch + k * p.depth * _PROGRAM_BLOCK
+    while i0 < i1:
+        _program_block(p, stack, i0, min(<size_t>_PROGRAM_BLOCK, i1 - i0))
+        i0 += _PROGRAM_BLOCK
+
+
+cdef list _broadcast_operands(list arrays, tuple shape,
+                              vector[Py_ssize_t]& strides,
+                              vector[_Operand]& operands):
+    """
+    Sets up the operands of _load_block for float32 or double arrays that
+    broadcast to 'shape'. Returns the broadcast views of the arrays, which
+    have to be kept alive while the operands are used.
+    """
+    cdef size_t ndim = max(len(shape), 1)
+    cdef list views = []
+    strides.reserve(len(arrays) * ndim)
+    cdef object view
+    for a in arrays:
+        if not isinstance(a, np.ndarray) \
+                or (a.dtype != np.double and a.dtype != np.float32) \
+                or not a.flags['ALIGNED']:
+            raise ValueError("The operands have to be aligned float32 or "
+                             "double arrays.")
+        view = np.broadcast_to(a, shape).reshape(
+            shape if len(shape) > 0 else (1,)
+        )
+        views.append(view)
+        for n in view.strides:
+            strides.push_back(n)
+
+    operands.resize(len(views))
+    cdef size_t i
+    for i in range(len(views)):
+        view = views[i]
+        operands[i].data = <const char*>PyArray_DATA(<PyArrayObject*>view)
+        operands[i].single = (view.dtype == np.float32)
+        operands[i].contiguous = view.flags['C_CONTIGUOUS']
+        operands[i].strides = strides.data() + i * ndim
+    return views
+
+
+def _evaluate_program(list opcodes, list args, list arrays, object out,
+                      size_t depth):
+    """
+    Evaluates a postfix program elementwise into the contiguous float32
+    or double array 'out'. The operands are float32 or double arrays that
+    broadcast to the shape of 'out'. They are read through their strides,
+    without copies, and evaluated in double precision.
+    """
+    cdef object ops = np.asarray(opcodes, dtype=np.intc)
+    cdef object arg_values = np.asarray(args, dtype=np.double)
+    if not isinstance(out, np.ndarray) \
+            or (out.dtype != np.double and out.dtype != np.float32) \
+            or not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']:
+        raise ValueError("'out' has to be a writeable, contiguous float32 "
+                         "or double array.")
+    cdef tuple shape = out.shape
+    cdef size_t ndim = len(shape)
+    if ndim > _PROGRAM_MAXDIMS:
+        raise ValueError("Too many dimensions.")
+    cdef size_t N = out.size
+    cdef vector[size_t] shape_vec = [max(<size_t>n, 1) for n in shape]
+    if ndim == 0:
+        shape_vec.push_back(1)
+        ndim = 1
+
+    # Broadcast views of the operands, which are kept alive during the
+    # evaluation:
+    cdef vector[Py_ssize_t] strides
+    cdef vector[_Operand] operands
+    cdef list views = _broadcast_operands(arrays, shape, strides, operands)
+
+    # Determine the number of chunks and allocate a stack for each:
+    cdef int nthreads = _num_threads
+    if nthreads <= 1 or N < _parallel_threshold:
+        nthreads = 1
+    cdef object scratch = np.empty(
+        nthreads * max(depth, 1) * _PROGRAM_BLOCK, dtype=np.double
+    )
+
+    cdef _Program p
+    p.opcodes = <const int*>PyArray_DATA(<PyArrayObject*>ops)
+    p.args = <const double*>PyArray_DATA(<PyArrayObject*>arg_values)
+    p.length = len(opcodes)
+    p.arrays = operands.data()
+    p.out = PyArray_DATA(<PyArrayObject*>out)
+    p.single = (out.dtype == np.float32)
+    p.ndim = ndim
+    p.shape = shape_vec.data()
+    p.scratch = <double*>PyArray_DATA(<PyArrayObject*>scratch)
+    p.depth = depth
+    cdef size_t chunk = (N + nthreads - 1) // nthreads
+    cdef Py_ssize_t k
+    with nogil:
+        if nthreads == 1:
+            _program_chunk(&p, 0, 0, N)
+        else:
+            for k in prange(nthreads, num_threads=nthreads,
+                            schedule='static'):
+                _program_chunk(&p, k, k * chunk, min((k + 1) * chunk, N))
+
+
+
+cdef object _compare_broadcast(object a, int op, double s, object b):
+    """
+    Elementwise comparison a OP s * b of float32 or double arrays that
+    broadcast against each other. The operands are read block by block
+    through their strides, and the scale is applied within the
+    comparison, so that neither a broadcast nor a rescaled copy of an
+    operand is created.
+    """
+    cdef tuple shape = np.broadcast_shapes(a.shape, b.shape)
+    if len(shape) > _PROGRAM_MAXDIMS:
+        raise ValueError("Too many dimensions.")
+    cdef object out = np.empty(shape, dtype=np.bool_)
+    cdef size_t N = out.size
+    cdef vector[size_t] shape_vec = [max(<size_t>n, 1) for n in shape]
+    if len(shape) == 0:
+        shape_vec.push_back(1)
+    cdef vector[Py_ssize_t] strides
+    cdef vector[_Operand] operands
+    cdef list views = _broadcast_operands([a, b], shape, strides, operands)
+
+    # Only the shape of the program is used to load the operands:
+    cdef _Program p
+    p.ndim = shape_vec.size()
+    p.shape = shape_vec.data()
+    cdef bool* res = <bool*>PyArray_DATA(<PyArrayObject*>out)
+    cdef double block_a[_PROGRAM_BLOCK]
+    cdef double block_b[_PROGRAM_BLOCK]
+    cdef size_t i0 = 0
+    cdef size_t n
+    with nogil:
+        while i0 < N:
+            n = min(<size_t>_PROGRAM_BLOCK, N - i0)
+            _load_block(&p, &operands[0], block_a, i0, n)
+            _load_block(&p, &operands[1], block_b, i0, n)
+            _loop_compare(res + i0, op, <const double*>block_a, s,
+                          <const double*>block_b, 0, n)
+            i0 += n
+    return out
+
+
+################################################################################
+#                                                                              #
+#                         Bulk parsing of quantity strings                     #
+#                                                                              #
+################################################################################
+
+cdef extern from *:
+    """
+    #include <cstdlib>
+    #if __has_include(<charconv>)
+    #include <charconv>
+    #endif
+
+    /*
+     * Parses a number from the start of the NUL-terminated string
+     * [s, end) and returns a pointer past it, or 's' on failure.
+     * Leading blanks and a plus sign are skipped as by strtod.
+     */
+    const char* _parse_number(const char* s, const char* end, double* value)
+    {
+        const char* p = s;
+        while (p < end && (*p == ' ' || *p == '\\t'))
+            ++p;
+        #if defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L
+        const char* q = (p < end && *p == '+' && p + 1 < end && p[1] != '-')
+                        ? p + 1 : p;
+        std::from_chars_result res = std::from_chars(q, end, *value);
+        if (res.ec == std::errc())
+            return res.ptr;
+        if (res.ec == std::errc::invalid_argument)
+            return s;
+        #endif
+        /* Fallback and out-of-range values: */
+        char* stop;
+        *value = std::strtod(p, &stop);
+        return (stop == p) ? s : stop;
+    }
+
+    /*
+     * Encodes the UCS4 string 'src' of at most 'n' code points, which
+     * ends at the first NUL, as UTF-8 into 'dst', which has to hold
+     * 4*n+1 bytes. Returns the length of the encoded string.
+     */
+    size_t _ucs4_to_utf8(const uint32_t* src, size_t n, char* dst)
+    {
+        char* p = dst;
+        for (size_t i=0; i<n && src[i] != 0; ++i){
+            uint32_t c = src[i];
+            if (c < 0x80){
+                *p++ = (char)c;
+            } else if (c < 0x800){
+                *p++ = (char)(0xC0 | (c >> 6));
+                *p++ = (char)(0x80 | (c & 0x3F));
+            } else if (c < 0x10000){
+                *p++ = (char)(0xE0 | (c >> 12));
+                *p++ = (char)(0x80 | ((c >> 6) & 0x3F));
+                *p++ = (char)(0x80 | (c & 0x3F));
+            } else {
+                *p++ = (char)(0xF0 | (c >> 18));
+                *p++ = (char)(0x80 | ((c >> 12) & 0x3F));
+                *p++ = (char)(0x80 | ((c >> 6) & 0x3F));
+                *p++ = (char)(0x80 | (c & 0x3F));
+            }
+        }
+        *p = 0;
+        return (size_t)(p - dst);
+    }
+    """
+    const char* _parse_number(const char* s, const char* end,
+                              double* value) noexcept nogil
+    size_t _ucs4_to_utf8(const uint32_t* src, size_t n,
+                         char* dst) noexcept nogil
+
+#
+# The distinct unit strings of a bulk parse, each resolved once to its
+# scale relative to the target unit.
+#
+cdef struct _UnitScales:
+    vector[string] symbols
+    vector[double] scales
+    size_t last
+    CppUnit target
+    bool has_target
+
+
+cdef double _unit_scale(_UnitScales* units, const char* symbol, size_t n,
+                        Py_ssize_t index) except? -1.0:
+    """
+    The scale of a unit string relative to the target unit. Strings
+    that have not been seen before are parsed and stored.
+    """
+    # Consecutive elements usually share their unit:
+    cdef size_t i = units.last
+    if i < units.symbols.size() and units.symbols[i].size() == n \
+            and memcmp(units.symbols[i].data(), symbol, n) == 0:
+        return units.scales[i]
+    for i in range(units.symbols.size()):
+        if units.symbols[i].size() == n \
+                and memcmp(units.symbols[i].data(), symbol, n) == 0:
+            units.last = i
+            return units.scales[i]
+
+    cdef CppUnit unit
+    if n > 0:
+        unit = parse_unit(PyUnicode_DecodeUTF8(<char*>symbol, n, NULL))
+    if not units.has_target:
+        units.target = unit
+        units.has_target = True
+    elif not unit.same_dimension(units.target):
+        raise UnitError("The unit of element " + str(index) + " is "
+                        "incompatible with the target unit.")
+    units.symbols.push_back(string(symbol, n))
+    units.scales.push_back((unit / units.target).total_scale())
+    units.last = units.symbols.size() - 1
+    return units.scales[units.last]
+
+
+cdef double _parse_quantity_string(_UnitScales* units, const char* s,
+                                   size_t n, Py_ssize_t index) except? -1.0:
+    """
+    Parses the NUL-terminated string 's' of length 'n' that consists of
+    a number, optionally followed by a unit, and returns the number in
+    the target unit.
+    """
+    cdef double value
+    cdef const char* end = _parse_number(s, s + n, &value)
+    if end == s:
+        raise ValueError("Could not parse a number from element "
+                         + str(index) + ": '"
+                         + PyUnicode_DecodeUTF8(<char*>s, n, 'replace')
+                         + "'")
+    cdef const char* stop = s + n
+    while end < stop and (end[0] == b' ' or end[0] == b'\t'):
+        end += 1
+    while stop > end and (stop[-1] == b' ' or stop[-1] == b'\t'
+                          or stop[-1] == b'\n' or stop[-1] == b'\r'):
+        stop -= 1
+    return value * _unit_scale(units, end, stop - end, index)
+
+
+def parse_quantities(strings, unit=None) -> Quantity:
+    """
+    Parses a sequence or array of strings of the form "value unit",
+    for instance "3.2 km" or "450 m", into an array quantity.
+
+    Parameters
+    ----------
+    strings : Sequence[str] | np.ndarray
+        The strings. Arrays of type str, bytes, or object retain their
+        shape. Strings without a unit are dimensionless.
+    unit : Unit | str, optional
+        The unit of the result, to which all values are converted. By
+        default, the unit of the first string.
+
+    Returns
+    -------
+    quantity : Quantity
+        A contiguous array quantity.
+
+    Notes
+    -----
+    Numbers and units are parsed natively in a single pass. Each
+    distinct unit string is parsed only once.
+    """
+    if isinstance(strings, (str, bytes)):
+        raise TypeError("'strings' has to be a sequence or array of strings, "
+                        "not a single string.")
+    cdef _UnitScales units
+    units.last = 0
+    units.has_target = unit is not None
+    if units.has_target:
+        units.target = _target_unit(unit)
+
+    cdef object shape
+    cdef list items = None
+    cdef object buffer = None
+    cdef bool ucs4 = False
+    if isinstance(strings, np.ndarray):
+        # Str and byte string arrays are parsed directly from the array
+        # buffer:
+        shape = strings.shape
+        if strings.dtype.kind == 'U':
+            ucs4 = True
+            buffer = strings.astype(strings.dtype.newbyteorder('='),
+                                    copy=False)
+        elif strings.dtype.kind == 'S':
+            buffer = strings
+        elif strings.dtype.kind == 'O':
+            items = strings.reshape(-1).tolist()
+        else:
+            raise TypeError("'strings' has to be an array of strings.")
+        if buffer is not None:
+            buffer = np.ascontiguousarray(buffer)
+    else:
+        items = list(strings)
+        shape = (len(items),)
+
+    cdef Py_ssize_t N = len(items) if buffer is None else buffer.size
+    if N == 0 and not units.has_target:
+        raise ValueError("The unit of the result has to be given if there "
+                         "are no strings to parse.")
+    cdef object values = np.empty(N)
+    cdef double* out = <double*>PyArray_DATA(<PyArrayObject*>values)
+
+    cdef Py_ssize_t i, n
+    cdef object string_item
+    cdef const char* s
+    cdef const char* data
+    cdef const char* nul
+    cdef size_t itemsize
+    cdef vector[char] item
+    if buffer is None:
+        for i in range(N):
+            string_item = items[i]
+            if not isinstance(string_item, str):
+                raise TypeError("Element " + str(i) + " is not a string.")
+            s = PyUnicode_AsUTF8AndSize(string_item, &n)
+            out[i] = _parse_quantity_string(&units, s, n, i)
+    elif ucs4:
+        data = <const char*>PyArray_DATA(<PyArrayObject*>buffer)
+        itemsize = buffer.dtype.itemsize
+        item.resize(itemsize + 1)
+        for i in range(N):
+            n = _ucs4_to_utf8(<const uint32_t*>(data + i * itemsize),
+                              itemsize // 4, item.data())
+            out[i] = _parse_quantity_string(&units, item.data(), n, i)
+    else:
+        # Items of byte string arrays are not NUL-terminated if they
+        # fill the whole item size:
+        data = <const char*>PyArray_DATA(<PyArrayObject*>buffer)
+        itemsize = buffer.dtype.itemsize
+        item.resize(itemsize + 1)
+        for i in range(N):
+            s = data + i * itemsize
+            nul = <const char*>memchr(s, 0, itemsize)
+            n = itemsize if nul == NULL else nul - s
+            memcpy(item.data(), s, n)
+            item[n] = 0
+            out[i] = _parse_quantity_string(&units, item.data(), n, i)
+
+    cdef Quantity res = Quantity.__new__(Quantity)
+    res._cyinit(False, dummy_double[0], values.reshape(shape), units.target)
+    return res
+
+
+
+################################################################################
+#                                                                              #
+#                          Bulk formatting of values                           #
+#                                                                              #
+################################################################################
+
+cdef extern from *:
+    """
+    #include <cstdio>
+    #if __has_include(<charconv>)
+    #include <charconv>
+    #endif
+
+    /*
+     * Writes the number 'x' to 'dst', which has to hold 32 bytes, and
+     * returns the number of characters. A negative precision selects
+     * the shortest representation that parses back to 'x'.
+     */
+    size_t _format_number(double x, int precision, char* dst)
+    {
+        #if defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L
+        std::to_chars_result res = (precision < 0)
+            ? std::to_chars(dst, dst + 32, x)
+            : std::to_chars(dst, dst + 32, x, std::chars_format::general,
+                            precision);
+        return (size_t)(res.ptr - dst);
+        #else
+        return (size_t)std::snprintf(dst, 32, "%.*g",
+                                     (precision < 0) ? 17 : precision, x);
+        #endif
+    }
+    """
+    size_t _format_number(double x, int precision, char* dst) noexcept nogil
+
+
+def _format_values(object values, double scale, bytes delimiter,
+                   int precision) -> bytes:
+    """
+    Formats the rows of a contiguous two-dimensional double array,
+    multiplied by 'scale', as delimited lines of text.
+    """
+    if not isinstance(values, np.ndarray) or values.ndim != 2 \
+            or values.dtype != np.double or not values.flags['C_CONTIGUOUS']:
+        raise ValueError("'values' has to be a contiguous two-dimensional "
+                         "double array.")
+    if precision > 17:
+        raise ValueError("'precision' must not exceed 17.")
+    cdef size_t M = values.shape[0]
+    cdef size_t N = values.shape[1]
+    cdef const double* x = <const double*>PyArray_DATA(<PyArrayObject*>values)
+    cdef const char* delim = delimiter
+    cdef size_t nd = len(delimiter)
+    cdef vector[char] text
+    text.resize(M * N * (32 + nd) + M)
+    cdef char* p = text.data()
+    cdef size_t i, j
+    with nogil:
+        for i in range(M):
+            for j in range(N):
+                if j > 0:
+                    memcpy(p, delim, nd)
+                    p += nd
+                p += _format_number(scale * x[i * N + j], precision, p)
+            p[0] = b'\n'
+            p += 1
+    return text.data()[:p - text.data()]
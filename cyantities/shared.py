@@ -0,0 +1,131 @@
+# Quantities in shared memory.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import sys
+import numpy as np
+from multiprocessing.shared_memory import SharedMemory
+from .unit import Unit
+from .quantity import Quantity
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attaches to an existing block of shared memory. Where possible, the
+    block is not registered with the resource tracker of this process,
+    which would otherwise unlink it when this process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+class SharedQuantity:
+    """
+    An array quantity whose values reside in a block of shared memory.
+
+    Instances are small handles that can be pickled to other processes,
+    for instance as arguments to `multiprocessing` or `concurrent.futures`
+    workers. Each process obtains a `Quantity` that wraps the shared block
+    without copying through `quantity()`.
+
+    The process that calls `create` owns the block and unlinks it when
+    its handle is used as a context manager or `unlink()` is called.
+    Quantities obtained from `quantity()` have to be released before the
+    handle is closed.
+    """
+    def __init__(self, name: str, shape: tuple[int,...], dtype: str,
+                 unit: Unit):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.unit = unit
+        self._shm = None
+        self._owner = False
+
+
+    @classmethod
+    def create(cls, quantity: Quantity) -> "SharedQuantity":
+        """
+        Copies the values of an array quantity into a new block of shared
+        memory.
+        """
+        if not isinstance(quantity, Quantity):
+            raise TypeError("'quantity' has to be a Quantity.")
+        if not isinstance(quantity.shape(), tuple):
+            raise TypeError("Only array quantities can be shared.")
+        unit = quantity.unit()
+        values = np.asarray(quantity / unit)
+        shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+        shared = cls(shm.name, values.shape, values.dtype.str, unit)
+        shared._shm = shm
+        shared._owner = True
+        np.ndarray(values.shape, values.dtype, buffer=shm.buf)[...] = values
+        return shared
+
+
+    def quantity(self) -> Quantity:
+        """
+        Returns a Quantity that wraps the shared values without copying.
+        Writes to the quantity are visible to all processes.
+        """
+        if self._shm is None:
+            self._shm = _attach(self.name)
+        values = np.ndarray(self.shape, self.dtype, buffer=self._shm.buf)
+        return Quantity(values, self.unit, copy=False)
+
+
+    def close(self):
+        """
+        Detaches this process from the shared block.
+        """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+
+    def unlink(self):
+        """
+        Closes and destroys the shared block. Should be called once, by
+        the process that created it.
+        """
+        shm = self._shm if self._shm is not None else _attach(self.name)
+        self._shm = None
+        shm.close()
+        shm.unlink()
+
+
+    def __enter__(self) -> "SharedQuantity":
+        return self
+
+
+    def __exit__(self, *args):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+    def __reduce__(self):
+        return (SharedQuantity,
+                (self.name, self.shape, self.dtype.str, self.unit))
+
+
+    def __repr__(self) -> str:
+        return ("SharedQuantity(" + repr(self.name) + ", " + str(self.shape)
+                + ", '" + str(self.unit) + "')")
@@ -0,0 +1,218 @@
+# Chunked evaluation of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+#
+# The functions in this module process array quantities in blocks of a
+# fixed number of elements. Results are written to caller-supplied output
+# quantities with writeable buffers, which may be backed by memory maps
+# opened with mode 'r+' (see cyantities.io), so that the memory required
+# for temporaries is bounded by the block size independent of the size of
+# the operands.
+#
+
+import builtins
+import numpy as np
+from typing import Iterator
+from .unit import Unit
+from .quantity import Quantity, _writable_values
+from . import quantity as _quantity
+
+# Number of elements per block:
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Note that the reductions 'sum', 'min', and 'max' of this module shadow
+# the builtins, which are available through the 'builtins' module.
+
+
+def _values(q: Quantity) -> np.ndarray:
+    """
+    Zero-copy view of the values of an array quantity in its own unit.
+    """
+    return np.asarray(q / q.unit())
+
+
+def _blocks(arrays: list[np.ndarray], chunk_size: int | None):
+    """
+    Splits arrays of equal shape into consecutive blocks of at most
+    `chunk_size` elements. Contiguous arrays are split along their
+    flattened view, all others along the first axis.
+    """
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+    elif chunk_size < 1:
+        raise ValueError("'chunk_size' has to be positive.")
+    if all(a.flags['C_CONTIGUOUS'] for a in arrays):
+        arrays = [a.reshape(-1) for a in arrays]
+    N = arrays[0].shape[0]
+    if N == 0:
+        return
+    # Number of rows per block:
+    step = chunk_size // (arrays[0].size // N) if arrays[0].size else N
+    step = builtins.max(step, 1)
+    for i in range(0, N, step):
+        yield [a[i:i+step] for a in arrays]
+
+
+def chunks(q: Quantity, chunk_size: int | None = None) -> Iterator[Quantity]:
+    """
+    Iterates over consecutive blocks of an array quantity.
+
+    Parameters
+    ----------
+    q : Quantity
+       An array quantity.
+    chunk_size : int, optional
+       The maximum number of elements per block. Blocks of contiguous
+       quantities run over the flattened values, blocks of strided
+       quantities over the first axis.
+
+    Yields
+    ------
+    block : Quantity
+       Views of the blocks, which share the buffer of `q`.
+    """
+    if not isinstance(q.shape(), tuple):
+        raise TypeError("Only array quantities can be split into chunks.")
+    unit = q.unit()
+    for block, in _blocks([_values(q)], chunk_size):
+        yield Quantity(block, unit, copy=False)
+
+
+def _elementwise(operation, a: Quantity, b, out: Quantity,
+                 chunk_size: int | None) -> Quantity:
+    """
+    Evaluates a binary operation blockwise into `out`. The buffer of `out`
+    has to be writeable, since copying it would defeat the bounded memory
+    use.
+    """
+    if not isinstance(out, Quantity) or not isinstance(out.shape(), tuple):
+        raise TypeError("'out' has to be an array quantity.")
+    if not isinstance(a, Quantity) or a.shape() != out.shape():
+        raise ValueError("'a' has to be a quantity of the shape of 'out'.")
+    arrays = [_writable_values(out, copy=False), _values(a)]
+    units = [out.unit(), a.unit()]
+    b_array = isinstance(b, Quantity) and isinstance(b.shape(), tuple)
+    if b_array:
+        if b.shape() != out.shape():
+            raise ValueError("'b' has to be a scalar or a quantity of the "
+                             "shape of 'out'.")
+        arrays.append(_values(b))
+        units.append(b.unit())
+    for blocks in _blocks(arrays, chunk_size):
+        operation(
+            Quantity(blocks[1], units[1], copy=False),
+            Quantity(blocks[2], units[2], copy=False) if b_array else b,
+            out=Quantity(blocks[0], units[0], copy=False)
+        )
+    return out
+
+
+def add(a: Quantity, b: Quantity, out: Quantity,
+        chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise sum of two quantities, written to `out` in the unit of
+    `out`. `b` can be a scalar quantity.
+    """
+    return _elementwise(_quantity.add, a, b, out, chunk_size)
+
+
+def subtract(a: Quantity, b: Quantity, out: Quantity,
+             chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise difference of two quantities, written to `out` in the unit
+    of `out`. `b` can be a scalar quantity.
+    """
+    return _elementwise(_quantity.subtract, a, b, out, chunk_size)
+
+
+def multiply(a: Quantity, b: Quantity | Unit | float, out: Quantity,
+             chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise product of two quantities, written to `out` in the unit
+    of `out`. `b` can be a scalar quantity, unit, or number.
+    """
+    return _elementwise(_quantity.multiply, a, b, out, chunk_size)
+
+
+def divide(a: Quantity, b: Quantity | Unit | float, out: Quantity,
+           chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise quotient of two quantities, written to `out` in the unit
+    of `out`. `b` can be a scalar quantity, unit, or number.
+    """
+    return _elementwise(_quantity.divide, a, b, out, chunk_size)
+
+
+def convert(q: Quantity, out: Quantity,
+            chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise conversion of a quantity to the unit and dtype of `out`.
+    """
+    return _elementwise(_quantity.multiply, q, 1.0, out, chunk_size)
+
+
+def sum(q: Quantity, chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise sum of all elements of an array quantity.
+    """
+    total = 0.0
+    for block in chunks(q, chunk_size):
+        total += float(block.sum() / q.unit())
+    return Quantity(total, q.unit())
+
+
+def mean(q: Quantity, chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise arithmetic mean of all elements of an array quantity.
+    """
+    values = _values(q)
+    if values.size == 0:
+        return Quantity(np.nan, q.unit())
+    return sum(q, chunk_size) / values.size
+
+
+def _extremum(q: Quantity, chunk_size: int | None,
+              maximum: bool) -> Quantity:
+    """
+    Blockwise minimum or maximum of an array quantity.
+    """
+    res = None
+    for block in chunks(q, chunk_size):
+        x = float((block.max() if maximum else block.min()) / q.unit())
+        if res is None or np.isnan(x) or (x > res if maximum else x < res):
+            res = x
+            if np.isnan(x):
+                break
+    if res is None:
+        raise ValueError("Zero-size quantities have no extremum.")
+    return Quantity(res, q.unit())
+
+
+def min(q: Quantity, chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise minimum of an array quantity. NaNs propagate.
+    """
+    return _extremum(q, chunk_size, False)
+
+
+def max(q: Quantity, chunk_size: int | None = None) -> Quantity:
+    """
+    Blockwise maximum of an array quantity. NaNs propagate.
+    """
+    return _extremum(q, chunk_size, True)
@@ -0,0 +1,266 @@
+# Columnar tables of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import numpy as np
+from typing import Iterator, Mapping
+from .unit import Unit
+from .quantity import Quantity
+from .lazy import LazyQuantity, lazy as _lazy
+
+
+class QuantityTable:
+    """
+    A table of one-dimensional quantities of equal length, each with its
+    own unit.
+
+    Each column is stored in its own contiguous buffer of the dtype of
+    the quantity that it was created from, float64 or float32. Columns
+    are obtained as quantities that view these buffers, and row
+    selections by boolean masks, index arrays, or slices are applied to
+    all columns with the selected rows determined only once.
+
+    Column views follow all later changes of the values of a column,
+    including assignments to the column of the same unit and dtype.
+    Assigning a value of another unit or dtype replaces the buffer of
+    the column, and deleting a column detaches it from the table. Adding columns never
+    affects existing columns.
+
+    Parameters
+    ----------
+    columns : Mapping[str, Quantity], optional
+        The columns. Array columns have to be one-dimensional and of
+        equal length. Scalar quantities are repeated in every row.
+    nrows : int, optional
+        The number of rows. Required only if no column is an array.
+
+    Example
+    -------
+    >>> t = QuantityTable({'m' : m, 'v' : v, 'h' : h})
+    >>> m, v, h = t.lazy('m', 'v', 'h')
+    >>> t['E'] = 0.5 * m * v**2 + m * g * h
+    >>> heavy = t[t['m'] > Quantity(1.0, 'kg')]
+    """
+    __slots__ = ('_columns', '_units', '_nrows')
+
+    def __init__(self, columns: Mapping[str, Quantity] | None = None,
+                 nrows: int | None = None):
+        if columns is None:
+            columns = dict()
+        for q in columns.values():
+            if not isinstance(q, Quantity):
+                raise TypeError("The columns have to be quantities.")
+            shape = q.shape()
+            if isinstance(shape, tuple):
+                if len(shape) != 1:
+                    raise ValueError("Array columns have to be "
+                                     "one-dimensional.")
+                if nrows is None:
+                    nrows = shape[0]
+                elif shape[0] != nrows:
+                    raise ValueError("All columns have to be of equal "
+                                     "length.")
+        if nrows is None:
+            if len(columns) > 0:
+                raise ValueError("'nrows' has to be given if all columns "
+                                 "are scalar.")
+            nrows = 0
+
+        self._nrows = nrows
+        self._columns = dict()
+        self._units = dict()
+        for name, q in columns.items():
+            self._columns[name] = _column_buffer(q, nrows)
+            self._units[name] = q.unit()
+
+
+    @classmethod
+    def _from_columns(cls, columns: dict[str, np.ndarray],
+                      units: dict[str, Unit], nrows: int) -> "QuantityTable":
+        """
+        Creates a table around existing column buffers without copying.
+        """
+        table = cls.__new__(cls)
+        table._columns = columns
+        table._units = units
+        table._nrows = nrows
+        return table
+
+
+    def __len__(self) -> int:
+        """
+        The number of rows.
+        """
+        return self._nrows
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the column names.
+        """
+        return iter(self._columns)
+
+
+    def names(self) -> list[str]:
+        """
+        The column names.
+        """
+        return list(self._columns)
+
+
+    def unit(self, name: str) -> Unit:
+        """
+        The unit of a column.
+        """
+        self._column(name)
+        return self._units[name]
+
+
+    def _column(self, name: str) -> np.ndarray:
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError("No column '" + str(name) + "'.") from None
+
+
+    def __getitem__(self, key):
+        """
+        A column by name, a table of the columns in a list of names, or
+        the table of the rows selected by a boolean mask, an index array,
+        or a slice. Columns, tables of columns, and slices view the
+        buffers of this table, masks and index arrays copy the selected
+        rows.
+        """
+        if isinstance(key, str):
+            return Quantity(self._column(key), self._units[key], copy=False)
+        if isinstance(key, list) and all(isinstance(k, str) for k in key) \
+                and len(key) > 0:
+            return QuantityTable._from_columns(
+                {k : self._column(k) for k in key},
+                {k : self._units[k] for k in key},
+                self._nrows
+            )
+        if isinstance(key, slice):
+            columns = {name : col[key] for name, col in self._columns.items()}
+            nrows = len(range(*key.indices(self._nrows)))
+        else:
+            key = np.asarray(key)
+            if key.ndim != 1 or (key.dtype != np.bool_
+                                 and key.dtype.kind not in 'iu'):
+                raise IndexError("Rows have to be selected by a slice, or a "
+                                 "one-dimensional boolean or integer array.")
+            if key.dtype == np.bool_:
+                if key.size != self._nrows:
+                    raise IndexError("The boolean mask has to have one entry "
+                                     "per row.")
+                # Determine the selected rows once for all columns:
+                key = np.flatnonzero(key)
+            columns = {name : np.take(col, key)
+                       for name, col in self._columns.items()}
+            nrows = key.size
+        return QuantityTable._from_columns(columns, dict(self._units), nrows)
+
+
+    def __setitem__(self, name: str, value: Quantity | LazyQuantity):
+        """
+        Sets a column to a quantity or evaluates a lazy expression into
+        a column. The column takes the unit and dtype of the value.
+        Scalars keep the dtype of an existing column.
+        """
+        if not isinstance(name, str):
+            raise TypeError("Column names have to be strings.")
+        if not isinstance(value, (Quantity, LazyQuantity)):
+            raise TypeError("Columns have to be quantities or lazy "
+                            "expressions.")
+        shape = value.shape()
+        is_array = isinstance(shape, tuple) and len(shape) > 0
+        if is_array and shape != (self._nrows,):
+            if len(shape) != 1:
+                raise ValueError("Array columns have to be one-dimensional.")
+            if len(self._columns) > 0:
+                raise ValueError("The column has to be of the length of "
+                                 "the table.")
+            # First column of an empty table:
+            self._nrows = shape[0]
+
+        dtype = value.dtype() if is_array else None
+
+        # Write to the buffer of an existing column if possible, so that
+        # views of the column remain connected. Views of a column hold
+        # its unit, so a change of unit requires a new buffer:
+        unit = value.unit()
+        column = self._columns.get(name, None)
+        if column is None:
+            column = np.empty(self._nrows,
+                              dtype=np.double if dtype is None else dtype)
+        elif (dtype is not None and column.dtype != dtype) \
+                or unit != self._units[name]:
+            column = np.empty(self._nrows,
+                              dtype=column.dtype if dtype is None else dtype)
+        if isinstance(value, LazyQuantity) and is_array:
+            value.evaluate(out=Quantity(column, unit, copy=False))
+        else:
+            if isinstance(value, LazyQuantity):
+                value = value.evaluate()
+            column[...] = value / unit
+        self._columns[name] = column
+        self._units[name] = unit
+
+
+    def __delitem__(self, name: str):
+        self._column(name)
+        del self._columns[name]
+        del self._units[name]
+
+
+    def lazy(self, *names: str) -> LazyQuantity | tuple[LazyQuantity,...]:
+        """
+        Lazy expressions of columns, which read the buffers of the table
+        directly. Expressions of several columns are evaluated in a
+        single fused pass (see `cyantities.lazy`).
+
+        Returns
+        -------
+        columns : LazyQuantity | tuple[LazyQuantity, ...]
+            One lazy column for a single name, a tuple otherwise.
+        """
+        columns = tuple(_lazy(self[name]) for name in names)
+        if len(columns) == 1:
+            return columns[0]
+        return columns
+
+
+    def __repr__(self) -> str:
+        return ("QuantityTable(" + str(len(self)) + " rows, columns: "
+                + ", ".join(name + " [" + str(unit) + "]"
+                            for name, unit in self._units.items())
+                + ")")
+
+
+def _column_buffer(q: Quantity, nrows: int) -> np.ndarray:
+    """
+    A new buffer with the values of a quantity in its own unit, of the
+    dtype of array quantities and float64 for scalar quantities.
+    """
+    if not isinstance(q.shape(), tuple):
+        return np.full(nrows, float(q / q.unit()))
+    return np.array(np.asarray(q / q.unit()), copy=True, order='C')
@@ -19,7 +19,7 @@
 
 from libcpp.vector cimport vector
 from libcpp.pair cimport pair
-from libc.stdint cimport uint8_t, int8_t, int16_t
+from libc.stdint cimport uint8_t, int8_t, int16_t, uint64_t
 from libcpp cimport bool
 
 
@@ -46,6 +46,8 @@ cdef extern from "cyantities/unit.hpp" namespace "cyantities":
 
     const uint8_t BASE_UNIT_COUNT
 
+    ctypedef uint64_t dimension_key_t
+
     cdef cppclass base_unit_array_t:
         int8_t operator[](int) nogil
 
@@ -75,10 +77,15 @@ cdef extern from "cyantities/unit.hpp" namespace "cyantities":
 
         CppUnit power(int16_t exp) nogil
 
+        bool has_root(int16_t n) nogil
+
+        CppUnit root(int16_t n) nogil
+
         int16_t decadal_exponent() nogil
         double conversion_factor() nogil
         double total_scale() nogil
         const base_unit_array_t& base_units() nogil
+        dimension_key_t dimension_key() nogil
 
 
 
@@ -18,7 +18,40 @@
 # limitations under the Licence.
 
 
-from typing import Literal, Any
+from typing import Literal, Any, NamedTuple
+
+
+class ParseCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    pass
+
+
+def clear_parse_cache() -> None:
+    pass
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    pass
+
+
+def register_unit(
+        symbol: str,
+        unit: Unit | str,
+        scale: float = 1.0,
+        prefixes: bool = True
+    ) -> None:
+    pass
+
+
+def unregister_unit(symbol: str) -> None:
+    pass
+
 
 class Unit:
     """
@@ -28,6 +61,11 @@ class Unit:
         pass
 
 
+    @classmethod
+    def parse(cls, unit: str) -> Unit:
+        pass
+
+
     def __repr__(self) -> str:
         pass
 
@@ -60,6 +98,14 @@ class Unit:
         pass
 
 
+    def __hash__(self) -> int:
+        pass
+
+
+    def __reduce__(self) -> tuple:
+        pass
+
+
     def same_dimension(self, other: Unit) -> bool:
         pass
 
@@ -20,6 +20,7 @@
 from libcpp.vector cimport vector
 from libc.stdint cimport uint8_t, int8_t, int16_t
 from libcpp cimport bool
+from collections import namedtuple
 
 from .unit cimport base_unit_t, UnitBuilder, CppUnit, Unit, base_unit_array_t,\
                    base_unit_index_t
@@ -43,318 +44,326 @@ cdef extern from * namespace "cyantities" nogil:
 
 #######################################################################
 #
-#                         Cython unit parsing.
+#                            Unit interning.
 #
 #######################################################################
 
-cdef void _parse_unit_single(str unit, int prefix, int exponent,
-                             UnitBuilder& builder):
+# Interned Unit instances, keyed by the tuple returned from _unit_key.
+# Only the units of the symbol table are interned, so that the number of
+# interned instances is bounded by the number of symbols. Parsed units,
+# unit arithmetic, and quantities return the interned instance of equal
+# units.
+cdef dict _interned_units = dict()
+
+
+cdef inline tuple _unit_key(const CppUnit& unit):
+    return (unit.dimension_key(), unit.decadal_exponent(),
+            unit.conversion_factor())
+
+
+cdef Unit _intern(Unit u):
     """
-    A single unit's representation to SI basis units.
+    Return the interned instance equal to a unit, interning the
+    unit if no such instance exists yet.
     """
-    #
-    # Prefixes:
-    #
-    cdef bool has_prefix = False
-    cdef size_t n = len(unit)
-    cdef Py_UCS4 first
-    if n == 0:
-        raise RuntimeError("Empty unit string.")
-    elif n > 1:
-        # Parse prefies:
-        first = unit[0]
-        if first == u'T':
-            # Tera.
-            builder.add_decadal_exponent(12 * prefix * exponent)
-            has_prefix = True
-        elif first == u'G':
-            # Giga-prefix overlaps with Gray.
-            # Catch that overlap here:
-            if n == 2 and unit == 'Gy':
-                builder.add_base_unit_occurrence(SI_METER,   2 * prefix * exponent)
-                builder.add_base_unit_occurrence(SI_SECOND, -2 * prefix * exponent)
-                return
-            # Giga.
-            builder.add_decadal_exponent(9 * prefix * exponent)
-            has_prefix = True
-        elif first == u'M':
-            # Mega
-            builder.add_decadal_exponent(6 * prefix * exponent)
-            has_prefix = True
-        elif first == u'k':
-            # kilo-prefix overlaps with kilogram.
-            # Catch that overlap here:
-            if n == 2 and unit == "kg":
-                builder.add_base_unit_occurrence(SI_KILOGRAM, prefix * exponent)
-                return
-            # kilo-prefix overlaps with katal:
-            elif n == 3 and unit == "kat":
-                builder.add_base_unit_occurrence(SI_MOLE,    1 * prefix * exponent)
-                builder.add_base_unit_occurrence(SI_SECOND, -1 * prefix * exponent)
-                return
-
-            # kilo
-            builder.add_decadal_exponent(3 * prefix * exponent)
-            has_prefix = True
-        elif first == u'h':
-            # hecto
-            builder.add_decadal_exponent(2 * prefix * exponent)
-            has_prefix = True
-        elif first == u'd':
-            # dezi
-            builder.add_decadal_exponent(-1 * prefix * exponent)
-            has_prefix = True
-        elif first == u'c':
-            # centi-prefix overlaps with Candela.
-            # Catch that overlap here:
-            if n == 2 and unit == "cd":
-                builder.add_base_unit_occurrence(SI_CANDELA, prefix * exponent)
-                return
-            # centi
-            builder.add_decadal_exponent(-2 * prefix * exponent)
-            has_prefix = True
-        elif first == u'm':
-            # milli-prefix overlaps with mol.
-            # Catch that overlap here:
-            if n == 3 and unit == "mol":
-                builder.add_base_unit_occurrence(SI_MOLE, prefix * exponent)
-                return
-            # milli
-            builder.add_decadal_exponent(-3 * prefix * exponent)
-            has_prefix = True
-        elif first == u'µ':
-            # micro
-            builder.add_decadal_exponent(-6 * prefix * exponent)
-            has_prefix = True
-        elif first == u'n':
-            # nano
-            builder.add_decadal_exponent(-9 * prefix * exponent)
-            has_prefix = True
-        elif first == u'p':
-            # pico
-            builder.add_decadal_exponent(-12 * prefix * exponent)
-            has_prefix = True
-
-        # Now need to cut the prefix:
-        if has_prefix:
-            unit = unit[1:]
-
-    # A note for future performance optimization:
-    # This function does a lot of string comparisons. Potentially, this process
-    # might be sped up using a dict lookup for 'unit' (but that's also not clear
-    # - measurement would be key).
-    # Probably, units will not be parsed often enough in typical code to incur a
-    # significant performance overhead, so that this function should be OK,
-    # and simplicity in writing this function takes precendence.
+    return _interned_units.setdefault(_unit_key(u._unit), u)
+
+
+
+#######################################################################
+#
+#                          Unit symbol table.
+#
+#######################################################################
 
+# Decadal exponents of the supported SI prefixes:
+_PREFIXES = (
+    ("T", 12),  # tera
+    ("G", 9),   # giga
+    ("M", 6),   # mega
+    ("k", 3),   # kilo
+    ("h", 2),   # hecto
+    ("d", -1),  # dezi
+    ("c", -2),  # centi
+    ("m", -3),  # milli
+    ("µ", -6),  # micro
+    ("n", -9),  # nano
+    ("p", -12), # pico
+)
+
+# The known unit symbols. Each entry lists the symbol, its occurrences of
+# the base units, its decadal exponent, and its conversion factor.
+_SYMBOL_DEFINITIONS = (
     #
     # SI base units:
     #
-    if unit == "m":
-        builder.add_base_unit_occurrence(SI_METER, prefix * exponent)
-        return
-    elif unit == "kg":
-        builder.add_base_unit_occurrence(SI_KILOGRAM, prefix * exponent)
-        return
-    elif unit == "s":
-        builder.add_base_unit_occurrence(SI_SECOND, prefix * exponent)
-        return
-    elif unit == "A":
-        builder.add_base_unit_occurrence(SI_AMPERE, prefix * exponent)
-        return
-    elif unit == "K":
-        builder.add_base_unit_occurrence(SI_KELVIN, prefix * exponent)
-        return
-    elif unit == "mol":
-        builder.add_base_unit_occurrence(SI_MOLE, prefix * exponent)
-        return
-    elif unit == "cd":
-        builder.add_base_unit_occurrence(SI_CANDELA, prefix * exponent)
-        return
-    elif unit == "rad":
-        # Follow boost units in defining radians as a base unit.
-        builder.add_base_unit_occurrence(OTHER_RADIANS, prefix * exponent)
-        return
-    elif unit == "sr":
-        # Follow boost units in defining steradian as a base unit.
-        builder.add_base_unit_occurrence(OTHER_STERADIAN, prefix * exponent)
-        return
-
-
+    ("m",   ((SI_METER, 1),), 0, 1.0),
+    ("kg",  ((SI_KILOGRAM, 1),), 0, 1.0),
+    ("s",   ((SI_SECOND, 1),), 0, 1.0),
+    ("A",   ((SI_AMPERE, 1),), 0, 1.0),
+    ("K",   ((SI_KELVIN, 1),), 0, 1.0),
+    ("mol", ((SI_MOLE, 1),), 0, 1.0),
+    ("cd",  ((SI_CANDELA, 1),), 0, 1.0),
+    # Follow boost units in defining radians and steradian as base units.
+    ("rad", ((OTHER_RADIANS, 1),), 0, 1.0),
+    ("sr",  ((OTHER_STERADIAN, 1),), 0, 1.0),
     #
     # SI derived units:
     #
-    if unit == "Pa":
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,   -1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -2 * prefix * exponent)
-        return
-    elif unit == "J":
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -2 * prefix * exponent)
-        return
-    elif unit == "W":
-        # Watts
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -3 * prefix * exponent)
-        return
-    elif unit == "erg":
-        # 1 erg = 1e-7 J
-        builder.add_decadal_exponent(-7 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -2 * prefix * exponent)
-        return
-    elif unit == "g":
-        builder.add_decadal_exponent(-3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        return
-    elif unit == "h":
-        builder.multiply_conversion_factor(pow(3600.0, prefix * exponent))
-        builder.add_base_unit_occurrence(SI_SECOND, 1 * prefix * exponent)
-        return
-    elif unit == "Hz":
-        # Hertz
-        builder.add_base_unit_occurrence(SI_SECOND, -1 * prefix * exponent)
-        return
-    elif unit == "N":
-        # Newton
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -2 * prefix * exponent)
-        return
-    elif unit == "W":
-        # Watt
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -3 * prefix * exponent)
-        return
-    elif unit == "C":
-        # Coulomb
-        builder.add_base_unit_occurrence(SI_SECOND, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE, 1 * prefix * exponent)
-        return
-    elif unit == "V":
-        # Volt
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,   -1 * prefix * exponent)
-        return
-    elif unit == "F":
-        # Farad
-        builder.add_base_unit_occurrence(SI_KILOGRAM, -1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    -2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,    4 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,    2 * prefix * exponent)
-        return
-    elif unit == "Ω":
-        # Ohm, electrical resistance
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,   -2 * prefix * exponent)
-        return
-    elif unit == "S":
-        # Siemens, electrical conductance
-        builder.add_base_unit_occurrence(SI_KILOGRAM, -1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    -2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,    3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,    2 * prefix * exponent)
-        return
-    elif unit == "Wb":
-        # Weber, magnetic flux
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,   -1 * prefix * exponent)
-        return
-    elif unit == "T":
-        # Tesla, magnetic induction
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,   -1 * prefix * exponent)
-        return
-    elif unit == "H":
-        # Henry, electrical inductance
-        builder.add_base_unit_occurrence(SI_KILOGRAM,  1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,     2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,   -2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_AMPERE,   -2 * prefix * exponent)
-        return
-    elif unit == "lm":
-        # Lumen, luminous flux
-        builder.add_base_unit_occurrence(SI_CANDELA,      1 * prefix * exponent)
-        builder.add_base_unit_occurrence(OTHER_STERADIAN, 1 * prefix * exponent)
-        return
-    elif unit == "lx":
-        # Lux, illuminance
-        builder.add_base_unit_occurrence(SI_CANDELA,      1 * prefix * exponent)
-        builder.add_base_unit_occurrence(OTHER_STERADIAN, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,       -2 * prefix * exponent)
-        return
-    elif unit == "Bq":
-        # Becquerel, radioactivity
-        builder.add_base_unit_occurrence(SI_SECOND, -1 * prefix * exponent)
-        return
-    elif unit == "Gy" or unit == "Sv":
-        # Gray, absorbed dose and
-        # Sievert, equivalent dose
-        builder.add_base_unit_occurrence(SI_METER,   2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND, -2 * prefix * exponent)
-        return
-    elif unit == "kat":
-        # katal, catalyitic activity
-        builder.add_base_unit_occurrence(SI_MOLE,    1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND, -1 * prefix * exponent)
-        return
-    elif unit == "bar":
-        # bar, pressure
-        builder.add_decadal_exponent(5 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,   -1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -2 * prefix * exponent)
-        return
-    elif unit == "l":
-        # litre, volume
-        builder.add_decadal_exponent(-3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER, 3 * prefix * exponent)
-        return
-    elif unit == "t":
-        # ton, mass
-        builder.add_decadal_exponent(3 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        return
-    elif unit == "eV":
-        # Electronvolt.
-        # 1eV = 1.602176634e−19 J
-        builder.multiply_conversion_factor(pow(1.602176634, prefix * exponent))
-        builder.add_decadal_exponent(-19 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_KILOGRAM, 1 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_METER,    2 * prefix * exponent)
-        builder.add_base_unit_occurrence(SI_SECOND,  -2 * prefix * exponent)
-        return
-    elif unit == "°C" or unit == "°F":
-        raise ValueError("Cyantities does not support temperatures in Celsius "
-            "or Fahrenheit since they are not proportional to the Kelvin scale. "
-            "Please express your temperatures in Kelvin."
+    # Pascal, pressure
+    ("Pa",  ((SI_KILOGRAM, 1), (SI_METER, -1), (SI_SECOND, -2)), 0, 1.0),
+    # Joule, energy
+    ("J",   ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -2)), 0, 1.0),
+    # Watt, power
+    ("W",   ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -3)), 0, 1.0),
+    # Hertz, frequency
+    ("Hz",  ((SI_SECOND, -1),), 0, 1.0),
+    # Newton, force
+    ("N",   ((SI_KILOGRAM, 1), (SI_METER, 1), (SI_SECOND, -2)), 0, 1.0),
+    # Coulomb, electrical charge
+    ("C",   ((SI_SECOND, 1), (SI_AMPERE, 1)), 0, 1.0),
+    # Volt, electrical potential
+    ("V",   ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -3),
+             (SI_AMPERE, -1)), 0, 1.0),
+    # Farad, electrical capacitance
+    ("F",   ((SI_KILOGRAM, -1), (SI_METER, -2), (SI_SECOND, 4),
+             (SI_AMPERE, 2)), 0, 1.0),
+    # Ohm, electrical resistance
+    ("Ω",   ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -3),
+             (SI_AMPERE, -2)), 0, 1.0),
+    # Siemens, electrical conductance
+    ("S",   ((SI_KILOGRAM, -1), (SI_METER, -2), (SI_SECOND, 3),
+             (SI_AMPERE, 2)), 0, 1.0),
+    # Weber, magnetic flux
+    ("Wb",  ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -2),
+             (SI_AMPERE, -1)), 0, 1.0),
+    # Tesla, magnetic induction
+    ("T",   ((SI_KILOGRAM, 1), (SI_SECOND, -2), (SI_AMPERE, -1)), 0, 1.0),
+    # Henry, electrical inductance
+    ("H",   ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -2),
+             (SI_AMPERE, -2)), 0, 1.0),
+    # Lumen, luminous flux
+    ("lm",  ((SI_CANDELA, 1), (OTHER_STERADIAN, 1)), 0, 1.0),
+    # Lux, illuminance
+    ("lx",  ((SI_CANDELA, 1), (OTHER_STERADIAN, 1), (SI_METER, -2)), 0, 1.0),
+    # Becquerel, radioactivity
+    ("Bq",  ((SI_SECOND, -1),), 0, 1.0),
+    # Gray, absorbed dose
+    ("Gy",  ((SI_METER, 2), (SI_SECOND, -2)), 0, 1.0),
+    # Sievert, equivalent dose
+    ("Sv",  ((SI_METER, 2), (SI_SECOND, -2)), 0, 1.0),
+    # katal, catalytic activity
+    ("kat", ((SI_MOLE, 1), (SI_SECOND, -1)), 0, 1.0),
+    #
+    # Other units:
+    #
+    # erg, 1 erg = 1e-7 J
+    ("erg", ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -2)), -7, 1.0),
+    # gram
+    ("g",   ((SI_KILOGRAM, 1),), -3, 1.0),
+    # hour
+    ("h",   ((SI_SECOND, 1),), 0, 3600.0),
+    # bar, pressure
+    ("bar", ((SI_KILOGRAM, 1), (SI_METER, -1), (SI_SECOND, -2)), 5, 1.0),
+    # litre, volume
+    ("l",   ((SI_METER, 3),), -3, 1.0),
+    # ton, mass
+    ("t",   ((SI_KILOGRAM, 1),), 3, 1.0),
+    # Electronvolt, 1eV = 1.602176634e−19 J
+    ("eV",  ((SI_KILOGRAM, 1), (SI_METER, 2), (SI_SECOND, -2)), -19,
+            1.602176634),
+)
+
+# Symbols that are recognized but deliberately not supported:
+_UNSUPPORTED_SYMBOLS = {
+    "°C" : "Cyantities does not support temperatures in Celsius or "
+           "Fahrenheit since they are not proportional to the Kelvin scale. "
+           "Please express your temperatures in Kelvin.",
+    "°F" : "Cyantities does not support temperatures in Celsius or "
+           "Fahrenheit since they are not proportional to the Kelvin scale. "
+           "Please express your temperatures in Kelvin.",
+}
+
+# The table that maps all known symbols, with and without prefixes, to their
+# units:
+cdef dict _symbol_table = dict()
+
+# The keys of the symbol table added by each call to register_unit, which
+# are removed by unregister_unit:
+cdef dict _registered_symbols = dict()
+
+
+cdef Unit _unit_from_definition(tuple occurrences, int16_t dec_exp,
+                                double conv):
+    """
+    Assemble a unit from its base unit occurrences, decadal
+    exponent, and conversion factor.
+    """
+    cdef UnitBuilder builder
+    for base_unit, exponent in occurrences:
+        builder.add_base_unit_occurrence(
+            _base_unit_from_index(base_unit), exponent
         )
+    builder.add_decadal_exponent(dec_exp)
+    builder.multiply_conversion_factor(conv)
+    return generate_from_cpp(CppUnit(builder))
 
+
+def _unit_state(Unit unit) -> tuple:
+    """
+    The state of a unit: its decadal exponent, conversion factor, and
+    the exponents of the base units.
+    """
+    cdef const base_unit_array_t* base_units = &unit._unit.base_units()
+    cdef tuple exponents = tuple(
+        base_units[0][i] for i in range(BASE_UNIT_COUNT)
+    )
+    return (unit._unit.decadal_exponent(), unit._unit.conversion_factor(),
+            exponents)
+
+
+def _unit_from_state(int16_t dec_exp, double conv, tuple exponents):
+    """
+    Reconstructs a unit from its state.
+    """
+    return _unit_from_definition(
+        tuple((i, e) for i, e in enumerate(exponents) if e != 0),
+        dec_exp, conv
+    )
+
+
+cdef list _add_symbol(str symbol, Unit unit, bool prefixes):
+    """
+    Add a symbol and, optionally, all its prefixed variants to the
+    symbol table, and return the added keys.
+    Unprefixed symbols take precedence over prefixed variants of other
+    symbols (e.g. 'kg' and 'cd' are not kilo-'g' and centi-'d'), so
+    prefixed variants never replace existing entries.
+    """
+    _symbol_table[symbol] = _intern(unit)
+    cdef list added = [symbol]
+    if not prefixes:
+        return added
+    cdef str prefix
+    cdef int16_t dec_exp
+    for prefix, dec_exp in _PREFIXES:
+        if prefix + symbol not in _symbol_table:
+            _symbol_table[prefix + symbol] = _intern(generate_from_cpp(
+                unit._unit * CppUnit(dec_exp)
+            ))
+            added.append(prefix + symbol)
+    return added
+
+
+cdef void _init_symbol_table():
+    """
+    Fill the symbol table with the known units.
+    """
+    # First the unprefixed symbols so that they take precedence over
+    # all prefixed variants:
+    cdef str symbol
+    _intern(generate_from_cpp(CppUnit()))
+    for symbol, occurrences, dec_exp, conv in _SYMBOL_DEFINITIONS:
+        _symbol_table[symbol] = _intern(_unit_from_definition(
+            occurrences, dec_exp, conv
+        ))
+    for symbol, _, _, _ in _SYMBOL_DEFINITIONS:
+        _add_symbol(symbol, _symbol_table[symbol], True)
+
+_init_symbol_table()
+
+
+def register_unit(str symbol, unit, double scale = 1.0, bool prefixes = True):
+    """
+    Register a custom unit symbol for use in unit strings.
+
+    Parameters
+    ----------
+    symbol : str
+        The symbol of the new unit, e.g. 'au'.
+    unit : Unit | str
+        The unit in terms of which the new unit is defined.
+    scale : float, optional
+        The size of the new unit in terms of `unit`. Default: 1.0
+    prefixes : bool, optional
+        Whether to also register the SI-prefixed variants of the symbol
+        (e.g. 'kau'). Prefixed variants do not replace existing symbols.
+        Default: True
+
+    Example
+    -------
+    >>> register_unit('au', 'm', 1.495978707e11)
+    >>> register_unit('yr', 'h', 8766.0)
+    """
+    if len(symbol) == 0:
+        raise ValueError("Empty unit symbol.")
+    if symbol == "1" or any(c in symbol for c in " */^()"):
+        raise ValueError("Invalid unit symbol '" + symbol + "'.")
+    if symbol in _symbol_table or symbol in _UNSUPPORTED_SYMBOLS:
+        raise ValueError("Unit symbol '" + symbol + "' is already defined.")
+    if scale <= 0.0:
+        raise ValueError("`scale` has to be positive.")
+
+    cdef Unit base
+    if isinstance(unit, Unit):
+        base = unit
+    elif isinstance(unit, str):
+        base = generate_from_cpp(parse_unit(unit))
+    else:
+        raise TypeError("'unit' has to be either a string or a Unit.")
+
+    _registered_symbols[symbol] = _add_symbol(
+        symbol, generate_from_cpp(base._unit * CppUnit(0, scale)), prefixes
+    )
+
+
+def unregister_unit(str symbol):
+    """
+    Remove a unit symbol added by `register_unit`, together with its
+    prefixed variants. Built-in symbols cannot be removed.
+
+    Parameters
+    ----------
+    symbol : str
+        The symbol passed to `register_unit`.
+    """
+    cdef list added = _registered_symbols.pop(symbol, None)
+    if added is None:
+        raise ValueError("Unit symbol '" + symbol + "' has not been "
+                         "registered.")
+    for key in added:
+        del _symbol_table[key]
+    # Cached parse results may refer to the removed symbols:
+    clear_parse_cache()
+
+
+cdef CppUnit _lookup_symbol(str unit, int exponent):
+    """
+    A single unit's representation in SI basis units.
+    """
+    cdef Unit u = _symbol_table.get(unit, None)
+    if u is not None:
+        if exponent == 1:
+            return u._unit
+        return u._unit.power(exponent)
+
+    if len(unit) == 0:
+        raise RuntimeError("Empty unit string.")
+    if unit in _UNSUPPORTED_SYMBOLS:
+        raise ValueError(_UNSUPPORTED_SYMBOLS[unit])
     raise ValueError("Unknown unit '" + unit + "'")
 
 
-cdef CppUnit parse_unit(str unit):
+cdef CppUnit _parse_unit_uncached(str unit):
     """
-    The central function that translates
+    The central function that translates a unit string to a CppUnit.
     """
     # Early exit: Dimensionless, unit-unit:
     if unit == "1":
         return CppUnit()
 
     # Initialize the collected parsing results:
-    cdef UnitBuilder builder
+    cdef CppUnit result
 
     # We allow the format like "kg*m/(s^2)"
     cdef list[str] nom_denom_split
@@ -398,7 +407,7 @@ cdef CppUnit parse_unit(str unit):
                 continue
         else:
             exponent = 1
-        _parse_unit_single(sub_unit, 1, exponent, builder)
+        result = result * _lookup_symbol(sub_unit, exponent)
     for sub_unit in denom_split:
         if "^" in sub_unit:
             sub_unit, exp = sub_unit.split("^")
@@ -409,9 +418,98 @@ cdef CppUnit parse_unit(str unit):
                                    "parantheses.")
         else:
             exponent = 1
-        _parse_unit_single(sub_unit, -1, exponent, builder)
+        result = result * _lookup_symbol(sub_unit, -exponent)
+
+    return result
+
+
+#######################################################################
+#
+#                      Cache of parsed unit strings.
+#
+#######################################################################
+
+ParseCacheInfo = namedtuple(
+    "ParseCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+# The cache maps unit strings to Unit instances. Python dicts preserve
+# insertion order, so the first key is always the least recently used
+# one if we re-insert a key on every hit.
+cdef dict _parse_cache = dict()
+cdef Py_ssize_t _parse_cache_maxsize = 256
+cdef size_t _parse_cache_hits = 0
+cdef size_t _parse_cache_misses = 0
 
-    return CppUnit(builder)
+
+cdef Unit _parse_interned(str unit):
+    """
+    Translates a unit string to a Unit instance, looking up previously
+    parsed strings in a least-recently-used cache.
+    """
+    global _parse_cache_hits, _parse_cache_misses
+    cdef Unit cached = _parse_cache.pop(unit, None)
+    if cached is not None:
+        # Hit. Re-insert to mark as most recently used:
+        _parse_cache[unit] = cached
+        _parse_cache_hits += 1
+        return cached
+
+    _parse_cache_misses += 1
+    cdef Unit result = generate_from_cpp(_parse_unit_uncached(unit))
+    if _parse_cache_maxsize > 0:
+        if len(_parse_cache) >= _parse_cache_maxsize:
+            # Evict the least recently used entry:
+            del _parse_cache[next(iter(_parse_cache))]
+        _parse_cache[unit] = result
+
+    return result
+
+
+cdef CppUnit parse_unit(str unit):
+    """
+    Translates a unit string to a CppUnit.
+    """
+    return _parse_interned(unit)._unit
+
+
+def set_parse_cache_size(int maxsize):
+    """
+    Set the maximum number of unit strings held in the parse cache.
+    A size of zero disables the cache.
+    """
+    global _parse_cache_maxsize
+    if maxsize < 0:
+        raise ValueError("`maxsize` has to be non-negative.")
+    _parse_cache_maxsize = maxsize
+    while len(_parse_cache) > _parse_cache_maxsize:
+        del _parse_cache[next(iter(_parse_cache))]
+
+
+def clear_parse_cache():
+    """
+    Remove all entries from the parse cache and reset its statistics.
+    """
+    global _parse_cache_hits, _parse_cache_misses
+    _parse_cache.clear()
+    _parse_cache_hits = 0
+    _parse_cache_misses = 0
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """
+    Statistics of the parse cache.
+
+    Returns
+    -------
+    info : ParseCacheInfo
+        Named tuple of the number of cache hits and misses, the maximum
+        size, and the current number of cached unit strings.
+    """
+    return ParseCacheInfo(
+        _parse_cache_hits, _parse_cache_misses, _parse_cache_maxsize,
+        len(_parse_cache)
+    )
 
 
 ################################################################################
@@ -447,7 +545,34 @@ cdef str _unit_id_to_string(base_unit_t uid):
         raise ValueError("Unknown base unit id")
 
 
+# Formatted unit strings, keyed by the unit key and the rule. The entries
+# hold the formatted unit, so that the equality of units with colliding
+# keys can be confirmed, and the string. The oldest entry is evicted once
+# the cache is full.
+cdef dict _format_cache = dict()
+cdef Py_ssize_t _format_cache_maxsize = 256
+
+
 cdef str format_unit(const CppUnit& unit, str rule):
+    """
+    Output a unit to a string using a specific formating
+    rule. Formatted strings are cached.
+    """
+    cdef tuple key = (unit.dimension_key(), unit.decadal_exponent(),
+                      unit.conversion_factor(), rule)
+    cdef tuple entry = _format_cache.get(key, None)
+    if entry is not None and (<Unit>entry[0])._unit == unit:
+        return entry[1]
+
+    cdef str s = _format_unit_uncached(unit, rule)
+    if entry is None:
+        if len(_format_cache) >= _format_cache_maxsize:
+            del _format_cache[next(iter(_format_cache))]
+        _format_cache[key] = (generate_from_cpp(unit), s)
+    return s
+
+
+cdef str _format_unit_uncached(const CppUnit& unit, str rule):
     """
     Output a unit to a string using a specific formating
     rule.
@@ -499,7 +624,16 @@ cdef str format_unit(const CppUnit& unit, str rule):
 ####################################################################################
 
 cdef Unit generate_from_cpp(const CppUnit& unit):
-    cdef Unit u = Unit.__new__(Unit)
+    """
+    A Unit instance of a C++ unit. Returns the interned instance if
+    the unit is interned.
+    """
+    cdef Unit u = _interned_units.get(_unit_key(unit), None)
+    # The key is not unique for exponents beyond the packed range of the
+    # dimension key, so confirm the equality:
+    if u is not None and u._unit == unit:
+        return u
+    u = Unit.__new__(Unit)
     u._unit = unit
     return u
 
@@ -520,6 +654,17 @@ cdef class Unit:
         self._unit = parse_unit(unit)
 
 
+    @classmethod
+    def parse(cls, str unit) -> Unit:
+        """
+        Translates a unit string to a Unit. Other than the constructor,
+        this returns the interned instance of symbol units and the cached
+        instance of recently parsed unit strings.
+        """
+        if cls is not Unit:
+            return cls(unit)
+        return _parse_interned(unit)
+
     def __repr__(self) -> str:
         """
         String representation.
@@ -567,9 +712,7 @@ cdef class Unit:
         if not isinstance(exp, int):
             raise TypeError("Exponent needs to be integer in Unit power.")
         cdef int i = exp
-        cdef Unit result = Unit.__new__(Unit)
-        result._unit = self._unit.power(i)
-        return result
+        return generate_from_cpp(self._unit.power(i))
 
 
     def __float__(self):
@@ -589,6 +732,19 @@ cdef class Unit:
         return self._unit == ou._unit
 
 
+    def __hash__(self):
+        return hash(_unit_key(self._unit))
+
+
+    def __reduce__(self):
+        """
+        Pickling support. The unit is pickled by its base unit exponents
+        and scale so that registered and derived units survive the round
+        trip.
+        """
+        return (_unit_from_state, _unit_state(self))
+
+
     def same_dimension(self, Unit other):
         return self._unit.same_dimension(other._unit)
 
@@ -597,4 +753,4 @@ cdef class Unit:
         """
         Queries whether this unit is dimensionless.
         """
-        return self._unit.dimensionless()
\ No newline at end of file
+        return self._unit.dimensionless()
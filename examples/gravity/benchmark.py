@@ -40,9 +40,15 @@ benchmark_m_np * 9.81
 t4 = datetime.now()
 benchmark_m * g
 t5 = datetime.now()
+gravitational_force(benchmark_m, g, method='transform')
+t6 = datetime.now()
+gravitational_force(benchmark_m, g, method='span')
+t7 = datetime.now()
 
 print('Pure numpy:     ',t4-t3)
 print('Quantities:     ',t5-t4)
 print('C++ RAC (pipes):',t1-t0)
 print('C++ iterators:  ',t2-t1)
-print('C++ indexing:   ',t3-t2)
\ No newline at end of file
+print('C++ indexing:   ',t3-t2)
+print('C++ transform:  ',t6-t5)
+print('C++ span:       ',t7-t6)
\ No newline at end of file
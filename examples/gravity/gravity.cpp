@@ -138,4 +138,66 @@ void compute_gravitational_force_index(
     for (size_t i=0; i<m.size(); ++i){
         F.set_element(i, m.get<Mass>(i) * g);
     }
-}
\ No newline at end of file
+}
+
+
+void compute_gravitational_force_span(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g_qw,
+        cyantities::QuantityWrapper& F
+)
+{
+    /*
+     * Sanity:
+     */
+    if (g_qw.size() != 1)
+        throw std::runtime_error("'g' needs to be size-one.");
+    if (m.size() != F.size())
+        throw std::runtime_error("Incompatible size between 'm' and 'F'.");
+    if (m.size() == 0)
+        return;
+
+    /*
+     * A single acceleration value:
+     */
+    Acceleration g = g_qw.get<Acceleration>();
+
+    /*
+     * Now use the unchecked spans:
+     */
+    auto in = m.span<Mass>();
+    auto out = F.span<Force>();
+    for (size_t i=0; i<in.size(); ++i){
+        out[i] = in[i] * g;
+    }
+}
+
+
+void compute_gravitational_force_transform(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g_qw,
+        cyantities::QuantityWrapper& F
+)
+{
+    /*
+     * Sanity:
+     */
+    if (g_qw.size() != 1)
+        throw std::runtime_error("'g' needs to be size-one.");
+    if (m.size() != F.size())
+        throw std::runtime_error("Incompatible size between 'm' and 'F'.");
+    if (m.size() == 0)
+        return;
+
+    /*
+     * Use the (parallel) transform algorithm. The size-one 'g_qw' is
+     * broadcast to all elements:
+     */
+    F.transform<Force, Mass, Acceleration>(
+        [](const Mass& mi, const Acceleration& g) -> Force
+        {
+            return mi * g;
+        },
+        m, g_qw
+    );
+}
@@ -55,5 +55,23 @@ void compute_gravitational_force_index(
         cyantities::QuantityWrapper& F
 );
 
+/*
+ * This version uses unchecked spans:
+ */
+void compute_gravitational_force_span(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper& F
+);
+
+/*
+ * This version uses the parallel transform algorithm:
+ */
+void compute_gravitational_force_transform(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper& F
+);
+
 
 #endif
\ No newline at end of file
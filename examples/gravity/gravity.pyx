@@ -44,6 +44,18 @@ cdef extern from "gravity.hpp":
             QuantityWrapper& F
     ) except+
 
+    void compute_gravitational_force_span(
+            const QuantityWrapper& m,
+            const QuantityWrapper& g,
+            QuantityWrapper& F
+    ) except+
+
+    void compute_gravitational_force_transform(
+            const QuantityWrapper& m,
+            const QuantityWrapper& g,
+            QuantityWrapper& F
+    ) except+
+
 
 
 
@@ -58,7 +70,7 @@ def gravitational_force(
 
     method : str, optional
        Which iteration method to use. One of 'rac', 'iter',
-       or 'index'. Defaults to 'rac'.
+       'index', 'span', or 'transform'. Defaults to 'rac'.
     """
     # Make sure that the gravitational acceleration is scalar:
     assert g._is_scalar
@@ -78,7 +90,16 @@ def gravitational_force(
         compute_gravitational_force_index(
             m.wrapper(), g.wrapper(), F.wrapper()
         )
+    elif method == 'span':
+        compute_gravitational_force_span(
+            m.wrapper(), g.wrapper(), F.wrapper()
+        )
+    elif method == 'transform':
+        compute_gravitational_force_transform(
+            m.wrapper(), g.wrapper(), F.wrapper()
+        )
     else:
-        raise ValueError("Method must be one of 'rac', 'iter', or 'index'.")
+        raise ValueError("Method must be one of 'rac', 'iter', 'index', "
+                         "'span', or 'transform'.")
 
     return F
\ No newline at end of file
@@ -19,7 +19,155 @@
 
 import numpy as np
 from cyantities.unit cimport parse_unit, CppUnit
-from cyantities.quantity cimport Quantity, QuantityWrapper
+from cyantities.quantity cimport Quantity, QuantityWrapper, QuantityWrapper32
+
+
+cdef extern from *:
+    """
+    #include <cyantities/quantitywrap.hpp>
+    #include <boost/units/systems/si/length.hpp>
+    #include <boost/units/systems/si/mass.hpp>
+    #include <boost/units/systems/si/acceleration.hpp>
+    #include <boost/units/systems/si/force.hpp>
+
+    namespace test_backend {
+
+    namespace bu = boost::units;
+    typedef bu::quantity<bu::si::length, double> Length;
+    typedef bu::quantity<bu::si::mass, double> Mass;
+    typedef bu::quantity<bu::si::acceleration, double> Acceleration;
+    typedef bu::quantity<bu::si::force, double> Force;
+
+    void transform(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper& F
+    )
+    {
+        F.transform<Force, Mass, Acceleration>(
+            [](const Mass& mi, const Acceleration& gi) -> Force
+            {
+                return mi * gi;
+            },
+            m, g
+        );
+    }
+
+    void transform32(
+        const cyantities::QuantityWrapper32& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper32& F
+    )
+    {
+        F.transform<Force, Mass, Acceleration>(
+            [](const Mass& mi, const Acceleration& gi) -> Force
+            {
+                return mi * gi;
+            },
+            m, g
+        );
+    }
+
+    void double_length(cyantities::QuantityWrapper& l)
+    {
+        l.for_each<Length>(
+            [](Length& li)
+            {
+                li *= 2.0;
+            }
+        );
+    }
+
+    double total_length(const cyantities::QuantityWrapper& l)
+    {
+        Length sum = l.reduce<Length>(
+            Length(),
+            [](const Length& l0, const Length& l1) -> Length
+            {
+                return l0 + l1;
+            }
+        );
+        return sum / bu::si::meter;
+    }
+
+    void span_index(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper& F
+    )
+    {
+        const Acceleration gi = g.get<Acceleration>();
+        auto in = m.span<Mass>();
+        auto out = F.span<Force>();
+        for (size_t i=0; i<in.size(); ++i){
+            out[i] = in[i] * gi;
+        }
+    }
+
+    void span_ranges(
+        const cyantities::QuantityWrapper& m,
+        const cyantities::QuantityWrapper& g,
+        cyantities::QuantityWrapper& F
+    )
+    {
+        const Acceleration gi = g.get<Acceleration>();
+        std::ranges::transform(
+            m.const_span<Mass>(), F.span<Force>().begin(),
+            [gi](const Mass& mi) -> Force
+            {
+                return mi * gi;
+            }
+        );
+    }
+
+    double element_at(const cyantities::QuantityWrapper& l, size_t i,
+                      size_t j)
+    {
+        return l.get_at<Length>(i, j) / bu::si::meter;
+    }
+
+    double broadcast_at(const cyantities::QuantityWrapper& l, size_t i,
+                        size_t j)
+    {
+        return l.get_broadcast<Length>(std::array<size_t, 2>{i, j})
+               / bu::si::meter;
+    }
+
+    }
+    """
+    void test_transform "test_backend::transform"(
+        const QuantityWrapper& m,
+        const QuantityWrapper& g,
+        QuantityWrapper& F
+    ) except+
+    void test_transform32 "test_backend::transform32"(
+        const QuantityWrapper32& m,
+        const QuantityWrapper& g,
+        QuantityWrapper32& F
+    ) except+
+    void test_for_each "test_backend::double_length"(
+        QuantityWrapper& l
+    ) except+
+    double test_reduce "test_backend::total_length"(
+        const QuantityWrapper& l
+    ) except+
+    void test_span_index "test_backend::span_index"(
+        const QuantityWrapper& m,
+        const QuantityWrapper& g,
+        QuantityWrapper& F
+    ) except+
+    void test_span_ranges "test_backend::span_ranges"(
+        const QuantityWrapper& m,
+        const QuantityWrapper& g,
+        QuantityWrapper& F
+    ) except+
+    double test_element_at "test_backend::element_at"(
+        const QuantityWrapper& l, size_t i, size_t j
+    ) except+
+    double test_broadcast_at "test_backend::broadcast_at"(
+        const QuantityWrapper& l, size_t i, size_t j
+    ) except+
+
 
 def test_cython_functionality():
     # Zero mass vector:
@@ -33,4 +181,117 @@ def test_cython_functionality():
     assert m._val == F._val == 1.938928939273982423e-78
     assert m._val_array_N == F._val_array_N == 100
     assert np.all(m._val_object == 0.0)
-    assert np.all(F._val_object == 0.0)
\ No newline at end of file
+    assert np.all(F._val_object == 0.0)
+
+
+def test_parallel_algorithms():
+    # Use sizes above the parallel threshold:
+    cdef size_t N = 300000
+    x = np.arange(N, dtype=np.double)
+    m = Quantity(x, 'g')
+    g = Quantity(9.81, 'm s^-2')
+    cdef Quantity F = Quantity.zeros_like(m, 'kN')
+    test_transform(m.wrapper(), g.wrapper(), F.wrapper())
+    assert np.allclose(F._val_object, x * 9.81e-6)
+
+    # Element-wise broadcasting:
+    cdef Quantity F2 = Quantity.zeros_like(m, 'N')
+    test_transform(m.wrapper(), Quantity.zeros_like(m, 'm s^-2').wrapper(),
+                   F2.wrapper())
+    assert np.all(F2._val_object == 0.0)
+
+    # Incompatible sizes:
+    cdef Quantity F3 = Quantity.zeros(3, 'N')
+    try:
+        test_transform(m.wrapper(), g.wrapper(), F3.wrapper())
+        raise AssertionError("Expected a RuntimeError.")
+    except RuntimeError:
+        pass
+
+    cdef Quantity l = Quantity(x, 'km')
+    test_for_each(l.mutable_wrapper())
+    assert np.all(l._val_object == 2.0 * x)
+    assert np.isclose(test_reduce(l.wrapper()), 2e3 * x.sum())
+
+
+def test_span():
+    x = np.arange(1000, dtype=np.double)
+    m = Quantity(x, 'g')
+    g = Quantity(9.81, 'm s^-2')
+    cdef Quantity F0 = Quantity.zeros_like(m, 'kN')
+    test_span_index(m.wrapper(), g.wrapper(), F0.wrapper())
+    assert np.allclose(F0._val_object, x * 9.81e-6)
+    cdef Quantity F1 = Quantity.zeros_like(m, 'kN')
+    test_span_ranges(m.wrapper(), g.wrapper(), F1.wrapper())
+    assert np.all(F0._val_object == F1._val_object)
+
+
+def test_float32():
+    x = np.arange(1000, dtype=np.float32)
+    cdef Quantity m = Quantity(x, 'g')
+    g = Quantity(9.81, 'm s^-2')
+    cdef Quantity F = Quantity.zeros_like(m, 'kN')
+    assert F.dtype() == np.float32
+    test_transform32(m.wrapper32(), g.wrapper(), F.mutable_wrapper32())
+    assert np.allclose(F._val_object, x * np.float32(9.81e-6))
+    try:
+        m.wrapper()
+        raise AssertionError("Expected a TypeError.")
+    except TypeError:
+        pass
+
+
+def test_strided():
+    # Strided and broadcast operands, above the parallel threshold:
+    x = np.arange(600000, dtype=np.double).reshape(300, 2000)
+    m = Quantity(x[:, :1000:2], 'g', copy=None)
+    g = Quantity(np.linspace(1.0, 2.0, 500), 'm s^-2')
+    cdef Quantity F = Quantity.zeros((300, 500), 'kN')
+    test_transform(m.wrapper(), g.wrapper(), F.wrapper())
+    assert np.allclose(F._val_object,
+                       x[:, :1000:2] * np.linspace(1.0, 2.0, 500) * 1e-6)
+
+    # Transposed output:
+    cdef Quantity FT = Quantity(np.zeros((500, 300)).T, 'kN', copy=False)
+    test_transform(m.wrapper(), g.wrapper(), FT.wrapper())
+    assert np.all(FT._val_object == F._val_object)
+
+    # Incompatible shapes:
+    cdef Quantity g1 = Quantity(np.ones(300), 'm s^-2')
+    try:
+        test_transform(m.wrapper(), g1.wrapper(), F.wrapper())
+        raise AssertionError("Expected a RuntimeError.")
+    except RuntimeError:
+        pass
+
+    # Spans over a column write to the viewed array:
+    y = np.zeros((1000, 5))
+    cdef Quantity m3 = m[:, 3]
+    cdef Quantity g0 = Quantity(9.81, 'm s^-2')
+    cdef Quantity F3 = Quantity(y[:300, 1], 'kN', copy=False)
+    test_span_index(m3.wrapper(), g0.wrapper(), F3.wrapper())
+    assert np.allclose(y[:300, 1], x[:, 6] * 9.81e-6)
+    assert np.all(y[:, 0] == 0.0) and np.all(y[300:, 1] == 0.0)
+    try:
+        test_span_index(m.wrapper(), g.wrapper(), F.wrapper())
+        raise AssertionError("Expected a RuntimeError.")
+    except RuntimeError:
+        pass
+
+    # Algorithms on elements that are not equally spaced:
+    z = np.ones((400, 800))
+    cdef Quantity l = Quantity(z[:, ::2], 'km', copy=False)
+    test_for_each(l.mutable_wrapper())
+    assert np.all(z[:, ::2] == 2.0) and np.all(z[:, 1::2] == 1.0)
+    assert np.isclose(test_reduce(l.wrapper()), 2e3 * 400 * 400)
+
+    # Multidimensional and broadcast indexing:
+    cdef Quantity q = Quantity(x.T, 'km')
+    assert test_element_at(q.wrapper(), 7, 3) == 1e3 * x[3, 7]
+    cdef Quantity row = Quantity(x[:1, :], 'km')
+    assert test_broadcast_at(row.wrapper(), 100, 5) == 1e3 * x[0, 5]
+    try:
+        test_element_at(q.wrapper(), 2000, 0)
+        raise AssertionError("Expected an IndexError.")
+    except IndexError:
+        pass
@@ -0,0 +1,126 @@
+# Test the DLPack and Arrow interchange of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import pickle
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.quantity import from_dlpack, add
+
+
+def test_dlpack():
+    """
+    Test the exchange of values through DLPack.
+    """
+    x = np.linspace(0.0, 1.0, 100)
+
+    # Import without copying:
+    q = from_dlpack(x, 'km')
+    assert q.unit() == Unit('km')
+    assert np.shares_memory(q.value_in('km'), x)
+    assert not np.shares_memory(from_dlpack(x, 'km', copy=True).value_in('km'),
+                                x)
+    q32 = from_dlpack(x.astype(np.float32), 'm')
+    assert q32.dtype() == np.float32
+    assert from_dlpack(np.array(2.0), 'm') == Quantity(2.0, 'm')
+    q_int = from_dlpack(np.arange(3), 'm')
+    assert np.array_equal(q_int.value_in('m'), np.arange(3.0))
+    with pytest.raises(ValueError):
+        from_dlpack(np.arange(3), 'm', copy=False)
+
+    # Export of dimensionless quantities:
+    assert q.__dlpack_device__() == (1, 0)
+    y = np.from_dlpack(Quantity(x, '1', copy=None))
+    assert np.shares_memory(x, y)
+    y = np.from_dlpack(Quantity(x, 'km') / Unit('m'))
+    assert np.allclose(y, 1e3 * x)
+    with pytest.raises(BufferError):
+        np.from_dlpack(Quantity(x, 'km') / Unit('m'), copy=False)
+
+    # Dimensional quantities export their values in a unit:
+    with pytest.raises(RuntimeError):
+        np.from_dlpack(q)
+    assert np.shares_memory(np.from_dlpack(q.value_in('km')), x)
+
+
+def test_arrow():
+    """
+    Test the Arrow extension type.
+    """
+    pa = pytest.importorskip("pyarrow")
+    from cyantities.arrow import QuantityType, QuantityArray, \
+        from_quantity, to_quantity
+
+    x = np.linspace(0.0, 1.0, 100)
+    q = Quantity(x, 'km s^-1', copy=None)
+    a = from_quantity(q)
+    assert isinstance(a, QuantityArray)
+    assert isinstance(a.type, QuantityType)
+    assert a.type.unit() == Unit('km s^-1')
+    assert a.type.storage_type == pa.float64()
+    assert len(a) == 100
+
+    # Both directions share the buffer:
+    q2 = a.to_quantity()
+    assert q2.unit() == q.unit()
+    assert np.shares_memory(q2.value_in('km s^-1'), x)
+    q2 *= 2.0
+    assert np.array_equal(q.value_in('km s^-1'), x)
+    q2 = to_quantity(a)
+    add(q2, q2, out=q2)
+    assert np.array_equal(q2.value_in('km s^-1'), 2.0 * x)
+    assert np.array_equal(q.value_in('km s^-1'), x)
+
+    # Single precision and strided quantities:
+    a = from_quantity(Quantity(x.astype(np.float32), 'kg'))
+    assert a.type.storage_type == pa.float32()
+    assert to_quantity(a).dtype() == np.float32
+    a = from_quantity(Quantity(x, 'kg')[::2])
+    assert np.array_equal(to_quantity(a).value_in('kg'), x[::2])
+
+    # The unit survives IPC, pickling, and chunked arrays:
+    table = pa.table({'v' : from_quantity(q),
+                      'm' : from_quantity(Quantity(x, 'kg'))})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table['v'].type == QuantityType('km s^-1')
+    assert table['v'].type != QuantityType('m s^-1')
+    assert np.all(to_quantity(table['v']) == q)
+    assert to_quantity(table['m']).unit() == Unit('kg')
+    assert pickle.loads(pickle.dumps(a)).type.unit() == Unit('kg')
+    chunked = pa.chunked_array([from_quantity(q), from_quantity(q)])
+    assert to_quantity(chunked).shape() == (200,)
+
+    # Plain arrays with a unit; nulls become NaN:
+    q3 = to_quantity(pa.array([1.0, None, 3.0]), 'm')
+    assert q3.unit() == Unit('m')
+    assert np.isnan(q3.value_in('m')[1])
+
+    with pytest.raises(ValueError):
+        to_quantity(pa.array([1.0]))
+    with pytest.raises(ValueError):
+        to_quantity(from_quantity(q), 'm')
+    with pytest.raises(ValueError):
+        from_quantity(Quantity(np.ones((2, 2)), 'm'))
+    with pytest.raises(ValueError):
+        from_quantity(Quantity(1.0, 'm'))
+    with pytest.raises(TypeError):
+        QuantityType('m', pa.int64())
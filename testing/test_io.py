@@ -0,0 +1,126 @@
+# Test saving and loading quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import io
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.errors import UnitError
+from cyantities.io import save, load, savetxt
+from cyantities.quantity import add
+
+
+def test_save_load(tmp_path):
+    """
+    Test the round trip through files.
+    """
+    x = np.linspace(0.0, 1.0, 120).reshape(10, 12)
+    path = tmp_path / "q.cyq"
+    for q in (Quantity(x, 'km s^-1'), Quantity(x, 'kg')[:, ::5],
+              Quantity(x.astype(np.float32), 'N'),
+              Quantity(x[0], 'mm')**-3, Quantity(2.5, 'h'),
+              Quantity(np.empty((0, 3)), 'm')):
+        save(path, q)
+        for mmap in (True, False):
+            q2 = load(path, mmap=mmap)
+            assert q2.unit() == q.unit()
+            assert q2.shape() == q.shape()
+            assert q2.dtype() == q.dtype()
+            assert np.all(q2 == q)
+            del q2
+
+    with open(tmp_path / "other", 'wb') as f:
+        f.write(b'\x93NUMPY' + bytes(64))
+    with pytest.raises(ValueError):
+        load(tmp_path / "other")
+
+
+def test_load_mmap(tmp_path):
+    """
+    Test the memory-mapped access modes.
+    """
+    x = np.arange(1000.0)
+    path = tmp_path / "q.cyq"
+    save(path, Quantity(x, 'km'))
+
+    # Read-only maps cannot be written to. Arithmetic returns new
+    # quantities:
+    q = load(path)
+    q += Quantity(1.0, 'km')
+    assert np.all(load(path, mmap=False) == Quantity(x, 'km'))
+    q = load(path)
+    with pytest.raises(ValueError):
+        add(q, q, out=q)
+    with pytest.raises(ValueError):
+        q.to('m', inplace=True)
+    with pytest.raises(ValueError):
+        np.negative(q, out=q)
+    assert np.all(q == Quantity(x, 'km'))
+    del q
+
+    # Read-write maps store results written to the quantity:
+    q = load(path, mode='r+')
+    add(q, q, out=q)
+    del q
+    assert np.all(load(path, mmap=False) == Quantity(2 * x, 'km'))
+
+    # Copy-on-write maps do not:
+    q = load(path, mode='c')
+    add(q, q, out=q)
+    assert np.all(q == Quantity(4 * x, 'km'))
+    del q
+    assert np.all(load(path, mmap=False) == Quantity(2 * x, 'km'))
+
+
+def test_savetxt(tmp_path):
+    """
+    Test writing quantities to delimited text files.
+    """
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=(100, 3))
+    x[0, 0] = np.nan
+    path = tmp_path / "q.csv"
+
+    # Values are exact and converted to the requested unit:
+    savetxt(path, Quantity(x, 'km'), 'm', chunk_size=7)
+    with open(path) as f:
+        assert f.readline() == "# m\n"
+    y = np.loadtxt(path, delimiter=',')
+    assert np.array_equal(y, 1e3 * x, equal_nan=True)
+
+    # One-dimensional, strided, and single precision quantities, text
+    # files, and other delimiters:
+    for q in (Quantity(x[:, 1], 'm'), Quantity(x, 'm')[::3, 1],
+              Quantity(x[:, 2].astype(np.float32), 'm')):
+        f = io.StringIO()
+        savetxt(f, q, Unit('m'), delimiter=';', header=False)
+        y = np.loadtxt(io.StringIO(f.getvalue()), delimiter=';')
+        assert np.array_equal(y, q.value_in('m'))
+
+    # Precision:
+    f = io.BytesIO()
+    savetxt(f, Quantity(np.array([[1.0, 2.0/3.0]]), 'kg'), precision=3)
+    assert f.getvalue() == b"# kg\n1,0.667\n"
+
+    with pytest.raises(UnitError):
+        savetxt(path, Quantity(x, 'km'), 's')
+    with pytest.raises(TypeError):
+        savetxt(path, Quantity(1.0, 'km'))
+    with pytest.raises(ValueError):
+        savetxt(path, Quantity(np.zeros((2, 2, 2)), 'km'))
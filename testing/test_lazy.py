@@ -0,0 +1,150 @@
+# Test lazy evaluation of quantity expressions.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.errors import UnitError
+from cyantities.lazy import lazy, LazyQuantity
+
+
+def test_lazy_expressions():
+    """
+    Test lazy expressions against the eager evaluation.
+    """
+    from cyantities.quantity import set_num_threads, get_num_threads, \
+        set_parallel_threshold, get_parallel_threshold
+    rng = np.random.default_rng(3321)
+    N = 5000
+    m = Quantity(rng.random(N), 'kg')
+    v = Quantity(rng.random(N), 'km s^-1')
+    h = Quantity(rng.random(N), 'm')
+    g = Quantity(9.81, 'm s^-2')
+    lm, lv, lh = lazy(m), lazy(v), lazy(h)
+
+    E = 0.5 * lm * lv**2 + lm * g * lh
+    assert isinstance(E, LazyQuantity)
+    assert E.unit().same_dimension(Unit('J'))
+    assert E.shape() == (N,)
+    reference = (0.5 * m * v**2 + m * g * h).value_in('J')
+
+    num_threads = get_num_threads()
+    threshold = get_parallel_threshold()
+    try:
+        for nt in (1, 5):
+            set_num_threads(nt)
+            set_parallel_threshold(0)
+            assert np.allclose(E.evaluate().value_in('J'), reference)
+    finally:
+        set_num_threads(num_threads)
+        set_parallel_threshold(threshold)
+
+    # Differences, quotients, negation, units, and mixed scales:
+    expr = (lv - h / Quantity(2.0, 's')) / Unit('s') * -lm
+    ref = (v - h / Quantity(2.0, 's')) / Unit('s') * -m
+    assert expr.unit().same_dimension(ref.unit())
+    assert np.allclose(expr.evaluate().value_in('N'), ref.value_in('N'))
+    assert np.allclose((lm / Unit('kg') + 2).evaluate().value_in('1'),
+                       m.value_in('kg') + 2)
+    assert np.allclose((lh**-2).evaluate().value_in('m^-2'),
+                       h.value_in('m')**-2)
+
+    # Broadcasting, strided, and single-precision operands:
+    x = rng.random((40, 30))
+    a = lazy(Quantity(x, 'm'))
+    b = lazy(Quantity(x[0].astype(np.float32), 'cm'))
+    c = lazy(Quantity(x[:, ::2], 's'))
+    res = (a + b).evaluate()
+    assert res.shape() == (40, 30)
+    assert np.allclose(res.value_in('m'),
+                       x + 1e-2 * x[0].astype(np.float32))
+    assert np.allclose((c * 2.0).evaluate().value_in('s'), 2 * x[:, ::2])
+    col = lazy(Quantity(x[:, :1], 'm'))
+    cube = lazy(Quantity(rng.random((3, 1, 30)), 'm'))
+    res = (a * col + cube * b).evaluate()
+    assert res.shape() == (3, 40, 30)
+    ref = (Quantity(x, 'm') * Quantity(x[:, :1], 'm')
+           + cube.evaluate() * b.evaluate())
+    assert np.allclose(res.value_in('m^2'), ref.value_in('m^2'))
+
+    # Results are float32 if all array operands are:
+    b32 = lazy(Quantity(x.astype(np.float32), 'm'))
+    assert b32.dtype() == np.float32 and (a + b32).dtype() == np.float64
+    res = (b32 * 2.0 + b32).evaluate()
+    assert res.dtype() == np.float32
+    assert np.allclose(res.value_in('m'), 3 * x.astype(np.float32))
+
+    # Scalar expressions:
+    s = (lazy(Quantity(2.0, 'km')) * 3 + Quantity(1.0, 'm')).evaluate()
+    assert s.shape() == 1
+    assert float(s / Unit('m')) == 6001.0
+
+
+def test_lazy_errors():
+    """
+    Test that unit and shape errors are raised while building the
+    expression.
+    """
+    m = lazy(Quantity(np.ones(10), 'kg'))
+    with pytest.raises(UnitError):
+        m + Quantity(np.ones(10), 's')
+    with pytest.raises(ValueError):
+        m * Quantity(np.ones(11), 's')
+    with pytest.raises(TypeError):
+        m ** 0.5
+    with pytest.raises(TypeError):
+        m + "a"
+
+
+def test_lazy_output():
+    """
+    Test writing the result of a lazy expression to an output target.
+    """
+    x = np.linspace(1.0, 2.0, 100)
+    a = lazy(Quantity(x, 'km'))
+    out = Quantity(np.zeros(100), 'km')
+    assert (a * 2).evaluate(out=out) is out
+    assert np.allclose(out.value_in('km'), 2 * x)
+    out = Quantity(np.zeros(100, dtype=np.float32), 'm')
+    (a + a).evaluate(out=out)
+    assert np.allclose(out.value_in('m'), 2e3 * x)
+    out = Quantity(np.zeros((100, 2)), 'm')[:, 0]
+    (a + a).evaluate(out=out)
+    assert np.allclose(out.value_in('m'), 2e3 * x)
+
+    # Broadcast and strided operands are not copied:
+    import tracemalloc
+    N = 100000
+    expr = lazy(Quantity(np.ones(N), 'm')) * lazy(Quantity(np.ones(1), '1')) \
+           + lazy(Quantity(np.ones(2 * N)[::2], 'm'))
+    out = Quantity(np.empty(N), 'm')
+    tracemalloc.start()
+    expr.evaluate(out=out)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < N
+    assert np.all(out.value_in('m') == 2.0)
+
+    out = Quantity(0.0, 'm')
+    (lazy(Quantity(1.0, 'km')) * 2).evaluate(out=out)
+    assert out == Quantity(2000.0, 'm')
+    with pytest.raises(UnitError):
+        a.evaluate(out=Quantity(np.zeros(100), 's'))
+    with pytest.raises(ValueError):
+        a.evaluate(out=Quantity(np.zeros(10), 'm'))
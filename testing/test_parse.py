@@ -0,0 +1,88 @@
+# Test parsing of quantity strings.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.errors import UnitError
+from cyantities.quantity import parse_quantities
+
+
+def test_parse_quantities():
+    """
+    Test parsing lists and arrays of strings.
+    """
+    strings = ["3.2 km", "450 m", " 1e3  mm ", "-2 km", "+5 cm\n", "7m"]
+    expected = np.array([3.2e3, 450.0, 1.0, -2e3, 0.05, 7.0])
+
+    # Default unit is the unit of the first string:
+    q = parse_quantities(strings)
+    assert q.unit() == Unit('km')
+    assert np.allclose(q.value_in('m'), expected)
+
+    # All string types, with and without target unit:
+    for values in (strings, tuple(strings), np.array(strings),
+                   np.array(strings).astype('>U12'),
+                   np.array(strings, dtype=object),
+                   np.array([s.encode() for s in strings])):
+        q = parse_quantities(values, 'm')
+        assert q.unit() == Unit('m')
+        assert q.shape() == (6,)
+        assert np.allclose(q.value_in('m'), expected)
+
+    # Array shapes are retained:
+    q = parse_quantities(np.array(strings).reshape(2, 3), Unit('cm'))
+    assert q.shape() == (2, 3)
+    assert np.allclose(q.value_in('m'), expected.reshape(2, 3))
+
+    # Compound and non-ASCII units, dimensionless numbers:
+    q = parse_quantities(np.array(["2 µm", "5 mm"]))
+    assert q.unit() == Unit('µm')
+    assert np.allclose(q.value_in('µm'), [2.0, 5e3])
+    q = parse_quantities(["3 km s^-1", "2 m/(s)"], 'm s^-1')
+    assert np.allclose(q.value_in('m s^-1'), [3e3, 2.0])
+    q = parse_quantities(["1", "2.5", "nan"])
+    assert q.unit() == Unit('1')
+    assert np.asarray(q)[1] == 2.5
+    assert np.isnan(np.asarray(q)[2])
+
+    # Empty input requires a target unit:
+    assert parse_quantities([], 'm').shape() == (0,)
+    with pytest.raises(ValueError):
+        parse_quantities([])
+
+
+def test_parse_quantities_errors():
+    """
+    Test the errors raised for malformed strings.
+    """
+    with pytest.raises(ValueError):
+        parse_quantities(["1 m", "m"])
+    with pytest.raises(ValueError):
+        parse_quantities(["1 m", "2 foo"])
+    with pytest.raises(UnitError):
+        parse_quantities(["1 m", "2 s"])
+    with pytest.raises(UnitError):
+        parse_quantities(["1 m"], 's')
+    with pytest.raises(TypeError):
+        parse_quantities("1 m")
+    with pytest.raises(TypeError):
+        parse_quantities(["1 m", 2.0])
+    with pytest.raises(TypeError):
+        parse_quantities(np.arange(3.0))
@@ -52,4 +52,126 @@ def test_composed_unit_parsing():
     with pytest.raises(RuntimeError):
         Unit('kg*m^-2/(s^0)')
 
-    Unit('kg m^-2 s^0')
\ No newline at end of file
+    Unit('kg m^-2 s^0')
+
+def test_parse_cache():
+    """
+    Test the least-recently-used cache of parsed unit strings.
+    """
+    from cyantities.unit import set_parse_cache_size, clear_parse_cache, \
+                                parse_cache_info
+    clear_parse_cache()
+    info = parse_cache_info()
+    assert info.hits == info.misses == info.currsize == 0
+
+    # Repeated parsing of the same string hits the cache:
+    Unit('kg m s^-2')
+    Unit('kg m s^-2')
+    Quantity(1.0, 'kg m s^-2')
+    info = parse_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+    assert Unit('kg m s^-2') == Unit('N')
+
+    # Failed parses are not cached:
+    with pytest.raises(ValueError):
+        Unit('foo')
+    assert parse_cache_info().currsize == 2
+
+    # The least recently used entry is evicted:
+    set_parse_cache_size(2)
+    Unit('kg m s^-2')
+    Unit('km')
+    Unit('h')
+    assert parse_cache_info().currsize == 2
+    misses = parse_cache_info().misses
+    Unit('km')
+    assert parse_cache_info().misses == misses
+    Unit('N')
+    assert parse_cache_info().misses == misses + 1
+
+    # Disable the cache:
+    set_parse_cache_size(0)
+    assert parse_cache_info().currsize == 0
+    Unit('km')
+    assert parse_cache_info().currsize == 0
+    with pytest.raises(ValueError):
+        set_parse_cache_size(-1)
+
+    set_parse_cache_size(256)
+    clear_parse_cache()
+
+
+@pytest.fixture
+def registered_units():
+    """
+    Symbols registered through the returned function are removed from
+    the global symbol table after the test.
+    """
+    from cyantities.unit import register_unit, unregister_unit
+    symbols = []
+    def register(symbol, *args, **kwargs):
+        register_unit(symbol, *args, **kwargs)
+        symbols.append(symbol)
+    yield register
+    for symbol in symbols:
+        unregister_unit(symbol)
+
+
+def test_register_unit(registered_units):
+    """
+    Test registering custom unit symbols.
+    """
+    register_unit = registered_units
+    register_unit('au', 'm', 1.495978707e11)
+    assert float(Unit('au') / Unit('m')) == 1.495978707e11
+    assert float(Unit('au^2') / Unit('m^2')) == 1.495978707e11 ** 2
+    assert float(Unit('kau') / Unit('au')) == 1e3
+    assert Unit('m/(au)').dimensionless()
+
+    # Prefixed variants do not shadow existing symbols:
+    register_unit('d', 'h', 24.0)
+    assert Unit('cd') == Unit('kg') / Unit('kg') * Unit('cd')
+    assert float(Unit('d') / Unit('s')) == 86400.0
+
+    # Unprefixed units:
+    register_unit('Da', Unit('kg'), 1.66053906660e-27, prefixes=False)
+    with pytest.raises(ValueError):
+        Unit('kDa')
+
+    # Invalid symbols:
+    with pytest.raises(ValueError):
+        register_unit('au', 'm', 1.0)
+    with pytest.raises(ValueError):
+        register_unit('m', 'm', 1.0)
+    with pytest.raises(ValueError):
+        register_unit('x^2', 'm', 1.0)
+    with pytest.raises(ValueError):
+        register_unit('yr', 'h', -1.0)
+
+
+def test_unregister_unit():
+    """
+    Test removing registered unit symbols.
+    """
+    from cyantities.unit import register_unit, unregister_unit
+    register_unit('ly', 'm', 9.4607304725808e15)
+    assert float(Unit('kly') / Unit('ly')) == 1e3
+    unregister_unit('ly')
+    with pytest.raises(ValueError):
+        Unit('ly')
+    with pytest.raises(ValueError):
+        Unit('kly')
+
+    # The symbol can be registered again:
+    register_unit('ly', 'km', 9.4607304725808e12, prefixes=False)
+    assert float(Unit('ly') / Unit('m')) == 9.4607304725808e15
+    unregister_unit('ly')
+
+    # Only registered symbols can be removed:
+    with pytest.raises(ValueError):
+        unregister_unit('ly')
+    with pytest.raises(ValueError):
+        unregister_unit('m')
+    assert Unit('m') == Unit('km') / Unit('km') * Unit('m')
@@ -0,0 +1,94 @@
+# Test pickling and shared memory transport.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import pickle
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.shared import SharedQuantity
+
+
+def test_pickle():
+    """
+    Test the pickle round trip of units and quantities.
+    """
+    for unit in (Unit('km s^-1'), Unit('1'), Unit('kg m^2 s^-2'),
+                 Unit('mm')**-3):
+        for protocol in (2, pickle.HIGHEST_PROTOCOL):
+            assert pickle.loads(pickle.dumps(unit, protocol)) == unit
+
+    x = np.linspace(0.0, 1.0, 100).reshape(10, 10)
+    for q in (Quantity(3.0, 'km'), Quantity(x, 'km'), Quantity(x, 'm')[:, 2],
+              Quantity(x.astype(np.float32), 'N')):
+        for protocol in (2, pickle.HIGHEST_PROTOCOL):
+            q2 = pickle.loads(pickle.dumps(q, protocol))
+            assert q2.unit() == q.unit()
+            assert q2.shape() == q.shape()
+            assert q2.dtype() == q.dtype()
+            assert np.all(q2 == q)
+
+
+def test_pickle_out_of_band():
+    """
+    Test that protocol 5 passes the values out-of-band and that the
+    unpickled quantity wraps them without a copy.
+    """
+    x = np.arange(10000.0)
+    q = Quantity(x, 'km')
+    buffers = []
+    data = pickle.dumps(q, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < 1000
+
+    q2 = pickle.loads(data, buffers=buffers)
+    assert q2.unit() == Unit('km')
+    assert np.shares_memory(np.asarray(q2 / Unit('km')),
+                            np.asarray(buffers[0]))
+
+
+def _worker_sum(shared):
+    q = shared.quantity()
+    res = float(q.sum() / Unit('m'))
+    del q
+    shared.close()
+    return res
+
+
+def test_shared_memory():
+    """
+    Test sharing the values of a quantity with worker processes.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    x = np.arange(1000.0)
+    with SharedQuantity.create(Quantity(x, 'km')) as shared:
+        q = shared.quantity()
+        assert q.unit() == Unit('km')
+        assert np.all(q == Quantity(x, 'km'))
+
+        # The handle is small and reattaches in other processes:
+        assert len(pickle.dumps(shared)) < 500
+        with ProcessPoolExecutor(
+                1, mp_context=multiprocessing.get_context('fork')
+            ) as pool:
+            assert pool.submit(_worker_sum, shared).result() == 1e3 * x.sum()
+        del q
+
+    with pytest.raises(TypeError):
+        SharedQuantity.create(Quantity(1.0, 'm'))
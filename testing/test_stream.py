@@ -0,0 +1,132 @@
+# Test chunked evaluation of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities import stream
+from cyantities.io import save, load
+
+
+def test_chunks():
+    """
+    Test the block iteration.
+    """
+    x = np.arange(2000.0).reshape(40, 50)
+    q = Quantity(x, 'km')
+    blocks = list(stream.chunks(q, 300))
+    assert len(blocks) == 7
+    assert all(b.unit() == Unit('km') for b in blocks)
+    assert np.all(np.concatenate([b / Unit('km') for b in blocks])
+                  == x.ravel())
+
+    # Strided quantities are split along the first axis:
+    blocks = list(stream.chunks(q[:, ::2], 300))
+    assert len(blocks) == 4
+    assert np.all(np.concatenate([b / Unit('km') for b in blocks])
+                  == x[:, ::2])
+
+    with pytest.raises(TypeError):
+        list(stream.chunks(Quantity(1.0, 'm')))
+
+
+def test_elementwise():
+    """
+    Test the blockwise arithmetic and conversion against the direct
+    evaluation.
+    """
+    rng = np.random.default_rng(8812)
+    x = rng.random((60, 70))
+    y = rng.random((60, 70))
+    a = Quantity(x, 'km')
+    b = Quantity(y, 'm')
+    for sl in (np.s_[:, :], np.s_[:, ::3], np.s_[::2, 5:]):
+        qa, qb = a[sl], b[sl]
+        shape = x[sl].shape
+        for chunk_size in (1, 100, 10**6):
+            out = Quantity(np.empty(shape), 'cm')
+            assert stream.add(qa, qb, out, chunk_size) is out
+            assert np.allclose(out / Unit('cm'), (qa + qb) / Unit('cm'))
+            stream.subtract(qa, qb, out, chunk_size)
+            assert np.allclose(out / Unit('cm'), (qa - qb) / Unit('cm'))
+            out = Quantity(np.empty(shape, dtype=np.float32), 'm^2')
+            stream.multiply(qa, qb, out, chunk_size)
+            assert np.allclose(out / Unit('m^2'), (qa * qb) / Unit('m^2'))
+            out = Quantity(np.empty(shape), 'm s^-1')
+            stream.divide(qa, Quantity(2.0, 's'), out, chunk_size)
+            assert np.allclose(out / Unit('m s^-1'), 500.0 * x[sl])
+            out = Quantity(np.empty(shape), 'mm')
+            stream.convert(qa, out, chunk_size)
+            assert np.allclose(out / Unit('mm'), 1e6 * x[sl])
+
+    with pytest.raises(ValueError):
+        stream.add(a, b[:10], Quantity(np.empty((60, 70)), 'm'))
+    with pytest.raises(RuntimeError):
+        stream.add(a, Quantity(y, 's'), Quantity(np.empty((60, 70)), 'm'))
+
+
+def test_reductions():
+    """
+    Test the blockwise reductions.
+    """
+    rng = np.random.default_rng(1123)
+    x = rng.normal(size=(80, 30))
+    q = Quantity(x, 'kJ')
+    for qs, xs in ((q, x), (q[:, ::4], x[:, ::4])):
+        for chunk_size in (7, 1000, 10**6):
+            assert np.isclose(float(stream.sum(qs, chunk_size) / Unit('kJ')),
+                              xs.sum())
+            assert np.isclose(float(stream.mean(qs, chunk_size) / Unit('J')),
+                              1e3 * xs.mean())
+            assert float(stream.min(qs, chunk_size) / Unit('kJ')) == xs.min()
+            assert float(stream.max(qs, chunk_size) / Unit('kJ')) == xs.max()
+    x[41, 3] = np.nan
+    assert np.isnan(float(stream.max(Quantity(x, 'kJ'), 100) / Unit('kJ')))
+
+
+def test_bounded_memory(tmp_path):
+    """
+    Test that blockwise evaluation of memory-mapped quantities allocates
+    memory only for the blocks.
+    """
+    import tracemalloc
+    N = 500000
+    save(tmp_path / "a.cyq", Quantity(np.arange(N, dtype=float), 'km'))
+    save(tmp_path / "out.cyq", Quantity(np.zeros(N, dtype=np.float32), 'm'))
+    a = load(tmp_path / "a.cyq")
+    out = load(tmp_path / "out.cyq", mode='r+')
+    tracemalloc.start()
+    stream.multiply(a, 2.0, out, chunk_size=1000)
+    total = stream.sum(a, chunk_size=1000)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 100000
+    assert float(total / Unit('km')) == N * (N - 1) / 2
+    del out
+    out = load(tmp_path / "out.cyq", mmap=False)
+    assert np.allclose(np.asarray(out / Unit('m')), 2e3 * np.arange(N))
+
+    # Read-only outputs are not copied to memory:
+    out = load(tmp_path / "out.cyq")
+    with pytest.raises(ValueError):
+        stream.multiply(a, 2.0, out, chunk_size=1000)
+    shared = np.zeros(N)
+    out = Quantity(shared, 'm', copy=None)
+    with pytest.raises(ValueError):
+        stream.convert(a, out, chunk_size=1000)
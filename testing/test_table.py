@@ -0,0 +1,182 @@
+# Test columnar tables of quantities.
+#
+# Author: Malte J. Ziebarth (mjz.science@fmvkb.de)
+#
+# Copyright (C) 2026 Malte J. Ziebarth
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by
+# the European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS" basis,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+import pickle
+import numpy as np
+import pytest
+from cyantities import Unit, Quantity
+from cyantities.lazy import LazyQuantity, lazy
+from cyantities.quantity import multiply
+from cyantities.table import QuantityTable
+
+
+def _table():
+    rng = np.random.default_rng(7)
+    m = rng.random(50)
+    v = rng.random(50)
+    return m, v, QuantityTable({
+        'm' : Quantity(m, 'kg'),
+        'v' : Quantity(v.astype(np.float32), 'km s^-1'),
+        'g' : Quantity(9.81, 'm s^-2')
+    })
+
+
+def test_table_columns():
+    """
+    Test constructing tables and accessing their columns.
+    """
+    m, v, t = _table()
+    assert len(t) == 50
+    assert t.names() == ['m', 'v', 'g']
+    assert list(t) == ['m', 'v', 'g']
+    assert 'm' in t and 'x' not in t
+    assert t.unit('v') == Unit('km s^-1')
+
+    # Columns view the buffer of the table:
+    assert t['m'].unit() == Unit('kg')
+    assert np.array_equal(t['m'].value_in('kg'), m)
+    assert np.allclose(t['v'].value_in('km s^-1'), v)
+    assert np.all(t['g'] == Quantity(9.81, 'm s^-2'))
+    multiply(t['m'], 2.0, out=t['m'])
+    assert np.array_equal(t['m'].value_in('kg'), 2 * m)
+    multiply(t['m'], 0.5, out=t['m'])
+
+    # Adding, replacing, and deleting columns:
+    t['h'] = Quantity(np.arange(50.0), 'm')
+    assert t.names() == ['m', 'v', 'g', 'h']
+    assert np.array_equal(t['h'].value_in('m'), np.arange(50.0))
+    assert np.array_equal(t['m'].value_in('kg'), m)
+    t['h'] = Quantity(np.arange(50.0), 'km')
+    assert t.unit('h') == Unit('km')
+    del t['g']
+    assert t.names() == ['m', 'v', 'h']
+    assert np.array_equal(t['h'].value_in('km'), np.arange(50.0))
+
+    # Column views remain connected when columns are added or assigned:
+    col = t['m']
+    t['x'] = Quantity(np.zeros(50), 'm')
+    multiply(t['m'], 2.0, out=t['m'])
+    assert np.array_equal(col.value_in('kg'), 2 * m)
+    t['m'] = Quantity(m, 'kg')
+    assert np.array_equal(col.value_in('kg'), m)
+    del t['x']
+
+    # Assigning another unit replaces the buffer of the column:
+    t['m'] = Quantity(np.ones(50), 'g')
+    assert np.array_equal(col.value_in('kg'), m)
+    assert np.array_equal(t['m'].value_in('g'), np.ones(50))
+    t['m'] = Quantity(m, 'kg')
+    t['v'] = Quantity(1.0, 'm s^-1')
+    assert t['v'].dtype() == np.float32
+    t['v'] = Quantity(v.astype(np.float32), 'km s^-1')
+
+    # Columns keep their dtype:
+    assert t['v'].dtype() == np.float32
+    assert t['m'].dtype() == np.float64
+    t['v'] = Quantity(v, 'km s^-1')
+    assert t['v'].dtype() == np.float64
+    t['v'] = Quantity(v.astype(np.float32), 'km s^-1')
+    assert t['v'].dtype() == np.float32
+    assert t[::2]['v'].dtype() == np.float32
+    assert t[t['m'] > Quantity(0.5, 'kg')]['v'].dtype() == np.float32
+
+    # Subtables of columns:
+    s = t[['h', 'm']]
+    assert s.names() == ['h', 'm']
+    assert np.array_equal(s['m'].value_in('kg'), m)
+
+    # Empty tables:
+    t = QuantityTable()
+    assert len(t) == 0
+    t['x'] = Quantity(np.ones(3), 'm')
+    assert len(t) == 3
+    t = QuantityTable({'g' : Quantity(1.0, 'm')}, nrows=4)
+    assert len(t) == 4
+
+    # Pickling:
+    m, v, t = _table()
+    t2 = pickle.loads(pickle.dumps(t))
+    assert t2.names() == t.names()
+    assert np.all(t2['v'] == t['v'])
+
+    with pytest.raises(KeyError):
+        t['x']
+    with pytest.raises(ValueError):
+        t['x'] = Quantity(np.ones(3), 'm')
+    with pytest.raises(ValueError):
+        QuantityTable({'a' : Quantity(np.ones(3), 'm'),
+                       'b' : Quantity(np.ones(4), 'm')})
+    with pytest.raises(ValueError):
+        QuantityTable({'a' : Quantity(np.ones((3, 3)), 'm')})
+    with pytest.raises(ValueError):
+        QuantityTable({'a' : Quantity(1.0, 'm')})
+    with pytest.raises(TypeError):
+        t['x'] = np.ones(50)
+
+
+def test_table_rows():
+    """
+    Test selecting rows of all columns.
+    """
+    m, v, t = _table()
+    mask = t['m'] > Quantity(500.0, 'g')
+    s = t[mask]
+    assert len(s) == np.count_nonzero(m > 0.5)
+    assert s.names() == t.names()
+    assert np.array_equal(s['m'].value_in('kg'), m[m > 0.5])
+    assert np.allclose(s['v'].value_in('km s^-1'), v[m > 0.5])
+
+    idx = np.argsort(m)[::-1]
+    s = t[idx]
+    assert np.array_equal(s['m'].value_in('kg'), m[idx])
+    assert np.array_equal(t[t['m'].argsort()]['m'].value_in('kg'), np.sort(m))
+
+    # Slices view the buffer:
+    s = t[10:20]
+    assert len(s) == 10
+    assert np.array_equal(s['m'].value_in('kg'), m[10:20])
+    s = t[::3]
+    assert np.array_equal(s['m'].value_in('kg'), m[::3])
+
+    with pytest.raises(IndexError):
+        t[np.ones((2, 2), dtype=bool)]
+    with pytest.raises(IndexError):
+        t[np.ones(49, dtype=bool)]
+    with pytest.raises(IndexError):
+        t[np.ones(50)]
+
+
+def test_table_expressions():
+    """
+    Test evaluating lazy expressions of columns into the table.
+    """
+    m, v, t = _table()
+    t['h'] = Quantity(np.linspace(0.0, 10.0, 50), 'm')
+    M, V, g, h = t.lazy('m', 'v', 'g', 'h')
+    assert isinstance(t.lazy('m'), LazyQuantity)
+    t['E'] = 0.5 * M * V**2 + M * g * h
+    assert t.unit('E') == Unit('kg km^2 s^-2')
+    E = 0.5 * t['m'] * t['v']**2 + t['m'] * t['g'] * t['h']
+    assert np.allclose(t['E'].value_in('J'), E.value_in('J'))
+
+    # Replacing a column by an expression of itself, and scalars:
+    t['h'] = 2 * h
+    assert np.allclose(t['h'].value_in('m'), np.linspace(0.0, 20.0, 50))
+    t['c'] = lazy(Quantity(2.0, 'm')) * 3.0
+    assert np.all(t['c'] == Quantity(6.0, 'm'))
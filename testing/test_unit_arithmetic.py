@@ -19,9 +19,69 @@
 
 import numpy as np
 import pytest
-from cyantities import Unit
+from cyantities import Unit, Quantity
 
 def test_unit_arithmetics():
     u = Unit("h")
     assert float(u / Unit('s')) == 3600.0
-    assert float(u**2 / Unit('s^2')) == 3600.0**2
\ No newline at end of file
+    assert float(u**2 / Unit('s^2')) == 3600.0**2
+
+def test_unit_hash():
+    """
+    Test hashing and interning of units.
+    """
+    assert hash(Unit('J')) == hash(Unit('kg m^2 s^-2'))
+    assert len({Unit('Gy'), Unit('Sv'), Unit('m^2 s^-2')}) == 1
+    assert len({Unit('m'), Unit('km'), Unit('s')}) == 3
+    table = {Unit('N'): 'force'}
+    assert table[Unit('kg*m/(s^2)')] == 'force'
+
+    # Symbol units are interned and returned by unit arithmetic,
+    # parsing, and quantities:
+    assert (Unit('m') * Unit('s') / Unit('s')) \
+        is (Unit('km') / Unit('km') * Unit('m'))
+    assert Quantity(1.0, 'm').unit() is Quantity(2.0, 'm').unit()
+    assert Unit.parse('m') is Unit.parse('m')
+    assert Unit.parse('kg m^2 s^-2') is Unit.parse('J')
+    assert Unit('km') ** 2 / Unit('km') is Unit.parse('km')
+    assert Quantity(1.0, 'J').unit() is Unit.parse('J')
+    assert Unit.parse('km s^-1') is Unit.parse('km s^-1')
+    assert Unit.parse('km s^-1') == Unit('s') ** -1 * Unit('km')
+
+    # The constructor creates new instances:
+    assert Unit('m') is not Unit('m')
+    assert Unit('m') == Unit('m')
+    assert Unit(unit='mm') == Unit.parse('mm')
+    with pytest.raises(TypeError):
+        Unit(1)
+    with pytest.raises(TypeError):
+        Unit('m', 's')
+
+    # Derived units that are not symbols are not interned:
+    from cyantities.unit import clear_parse_cache
+    u = Unit.parse('m s^-3')
+    clear_parse_cache()
+    assert Unit('m') / Unit('s') ** 3 is not u
+    assert Unit.parse('m s^-3') is not u
+
+    # Exponents beyond the range of the packed dimension key:
+    assert Unit('m^100') == Unit('m^100')
+    assert hash(Unit('m^100')) == hash(Unit('m^100'))
+    assert not Unit('m^100').same_dimension(Unit('m^-28'))
+    assert not Unit('m^100').dimensionless()
+    assert (Unit('m^100') / Unit('m^100')).dimensionless()
+
+def test_unit_format():
+    """
+    Test the cached formatting of units.
+    """
+    u = Unit('kg s^2')
+    assert str(u) == "kg s^2"
+    assert u.format('casual') == "s^2 kg"
+    assert str(u) is str(Unit('s^2 kg'))
+    assert str(Unit('km')) == "1000.0 * m"
+    assert repr(Quantity(2.0, 'km')) == "Quantity(2.0, '1000.0 * m')"
+
+    # Exponents beyond the range of the packed dimension key:
+    assert str(Unit('m^100')) == "m^100"
+    assert str(Unit('m^-28')) == "m^-28"